@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import csv
+import glob
+import logging
+import math
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from prtimes_corrected_scraper import PRTimesCorrectedScraper, logger, metrics
+
+# 精度を評価する項目
+FIELDS = ['会社名', '担当者名', 'メールアドレス', '電話番号']
+
+
+def load_corpus(corpus_dir: str) -> Dict[str, str]:
+    """
+    保存済みの記事HTMLを読み込む
+
+    Args:
+        corpus_dir: 記事HTML（*.html）を置いたディレクトリ
+
+    Returns:
+        Dict[str, str]: ファイル名をキー、HTMLを値とする辞書（ファイル名順）
+    """
+    corpus = {}
+    for path in sorted(glob.glob(os.path.join(corpus_dir, '*.html'))):
+        with open(path, encoding='utf-8', errors='replace') as f:
+            corpus[os.path.basename(path)] = f.read()
+    return corpus
+
+
+def load_golden(golden_path: str) -> Dict[str, Dict[str, str]]:
+    """
+    正解CSV（ファイル名, 会社名, 担当者名, メールアドレス, 電話番号）を読み込む
+
+    Returns:
+        Dict[str, Dict[str, str]]: ファイル名をキーとする正解データ
+    """
+    with open(golden_path, newline='', encoding='utf-8-sig') as f:
+        return {row['ファイル名']: row for row in csv.DictReader(f)}
+
+
+def write_golden(results: Dict[str, Dict[str, str]], golden_path: str):
+    """現在の抽出結果を正解CSVとして書き出す（手で修正して正解データにする用）"""
+    with open(golden_path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f)
+        writer.writerow(['ファイル名'] + FIELDS)
+        for name, info in results.items():
+            writer.writerow([name] + [info[field] for field in FIELDS])
+    print(f"正解CSVを書き出しました: {golden_path}")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近傍法によるパーセンタイル（全体のpct%以上を占める最小の値）"""
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """
+    プロセス全体の最大RSS（tracemallocで見えないlibxml2等のC拡張の割り当てを含む）
+
+    Returns:
+        Optional[int]: バイト数（resourceモジュールがないWindowsではNone）
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOSはバイト、Linux等はKB単位
+    return peak if platform.system() == 'Darwin' else peak * 1024
+
+
+def run_benchmark(corpus: Dict[str, str], repeat: int = 3, fast_path: bool = True):
+    """
+    記事HTMLを解析して処理速度と抽出結果を計測
+
+    Args:
+        corpus: ファイル名とHTMLの辞書
+        repeat: 計測の繰り返し回数（レイテンシは全回の値を集計）
+        fast_path: 高速抽出（問い合わせ先ブロックのみ処理）を先に試すか
+
+    Returns:
+        tuple: (抽出結果, 記事ごとのレイテンシ秒のリスト, 合計秒, ピークメモリバイト)
+    """
+    scraper = PRTimesCorrectedScraper('', '', '', fast_path=fast_path)
+    results = {}
+    latencies = []
+
+    # ウォームアップ（正規表現・パーサーの初期化を計測から除外）
+    for name, html in list(corpus.items())[:5]:
+        scraper.parse_article(html, name)
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for name, html in corpus.items():
+            t0 = time.perf_counter()
+            results[name] = scraper.parse_article(html, name)
+            latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    # ピークメモリはtracemallocのオーバーヘッドを避けるため別パスで計測
+    tracemalloc.start()
+    for name, html in corpus.items():
+        scraper.parse_article(html, name)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return results, latencies, elapsed, peak
+
+
+def evaluate(results: Dict[str, Dict[str, str]], golden: Dict[str, Dict[str, str]]) -> Dict[str, Dict[str, float]]:
+    """
+    項目ごとの適合率・再現率を算出
+
+    抽出値が正解と一致すればTP、抽出値が空でなく正解と異なればFP、
+    正解が空でなく一致する抽出値がなければFNとして数える。
+    """
+    scores = {}
+    for field in FIELDS:
+        tp = fp = fn = 0
+        for name, expected_row in golden.items():
+            if name not in results:
+                continue
+            expected = (expected_row.get(field) or '').strip()
+            actual = results[name][field].strip()
+            if actual and actual == expected:
+                tp += 1
+            else:
+                if actual:
+                    fp += 1
+                if expected:
+                    fn += 1
+        scores[field] = {
+            'precision': tp / (tp + fp) if tp + fp else 0.0,
+            'recall': tp / (tp + fn) if tp + fn else 0.0,
+            'tp': tp, 'fp': fp, 'fn': fn,
+        }
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PR Times 抽出ベンチマーク（保存済みHTMLをオフラインで解析）')
+    parser.add_argument('--corpus', required=True, help='記事HTML（*.html）を置いたディレクトリ')
+    parser.add_argument('--golden', help='正解CSV（列: ファイル名, 会社名, 担当者名, メールアドレス, 電話番号）')
+    parser.add_argument('--repeat', type=int, default=3, help='計測の繰り返し回数（デフォルト: 3）')
+    parser.add_argument('--write-golden', metavar='PATH', help='現在の抽出結果を正解CSVとして書き出す')
+    parser.add_argument('--no-fast-path', action='store_true', help='高速抽出を使わず、常に記事全体を解析')
+    args = parser.parse_args()
+
+    # 記事ごとのINFOログを抑制
+    logger.setLevel(logging.WARNING)
+
+    corpus = load_corpus(args.corpus)
+    if not corpus:
+        print(f"記事HTMLが見つかりません: {args.corpus}")
+        return
+
+    results, latencies, elapsed, peak = run_benchmark(corpus, repeat=max(1, args.repeat),
+                                                      fast_path=not args.no_fast_path)
+
+    print(f"記事数: {len(corpus)}件 × {max(1, args.repeat)}回")
+    print(f"処理速度: {len(latencies) / elapsed:.1f} 記事/秒")
+    print(f"レイテンシ: p50 {percentile(latencies, 50) * 1000:.2f}ms / "
+          f"p99 {percentile(latencies, 99) * 1000:.2f}ms / "
+          f"平均 {statistics.mean(latencies) * 1000:.2f}ms")
+    print(f"ピークメモリ（Python割り当て）: {peak / 1024 / 1024:.1f}MB")
+    rss = peak_rss_bytes()
+    if rss is not None:
+        print(f"ピークメモリ（プロセスの最大RSS、lxml/libxml2を含む）: {rss / 1024 / 1024:.1f}MB")
+    fast_count = metrics.value('extraction_path_total', path='fast')
+    full_count = metrics.value('extraction_path_total', path='full')
+    if fast_count + full_count:
+        print(f"抽出経路: 高速抽出 {fast_count / (fast_count + full_count):.1%} / "
+              f"通常の抽出 {full_count / (fast_count + full_count):.1%}")
+
+    if args.write_golden:
+        write_golden(results, args.write_golden)
+
+    if args.golden:
+        golden = load_golden(args.golden)
+        missing = [name for name in golden if name not in results]
+        if missing:
+            print(f"警告: コーパスにない正解データ {len(missing)}件をスキップしました")
+        print(f"\n{'項目':<10}{'適合率':>8}{'再現率':>8}{'TP':>6}{'FP':>6}{'FN':>6}")
+        for field, score in evaluate(results, golden).items():
+            print(f"{field:<10}{score['precision']:>8.3f}{score['recall']:>8.3f}"
+                  f"{score['tp']:>6}{score['fp']:>6}{score['fn']:>6}")
+
+
+if __name__ == '__main__':
+    main()
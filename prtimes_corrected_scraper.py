@@ -2,13 +2,14 @@
 # -*- coding: utf-8 -*-
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, NavigableString
+import lxml.html
 import re
 import gspread
 from google.oauth2.service_account import Credentials
 import time
 import logging
-from typing import List, Dict, Optional
+from typing import Callable, Iterable, Iterator, List, Dict, Optional
 import csv
 import urllib.parse
 import pandas as pd
@@ -18,780 +19,3867 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException
 import unicodedata
 from webdriver_manager.chrome import ChromeDriverManager
+import requests.adapters
+import requests.structures
 import requests.utils
+from urllib3.util.retry import Retry
+import http.client
+from types import SimpleNamespace
 import os
+import email.utils
+import hashlib
+import json
+import sqlite3
+import ssl
+import zlib
 import subprocess
 import platform
-from datetime import datetime
+import sys
+import threading
+import queue
+import signal
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
 
 # ログ設定
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-class PRTimesCorrectedScraper:
-    def __init__(self, email: str, password: str, credentials_path: str, headless: bool = True):
+# 問い合わせ先セクションを示すキーワード（先頭ほど優先）
+MEDIA_KEYWORDS = [
+    'メディア関係者限定', '本件に関するお問い合わせ', 'プレスリリースに関するお問い合わせ',
+    '報道関係者お問い合わせ先', '広報担当', 'PR担当', '取材依頼', '問い合わせ先',
+    'お問合せ先', 'お問合わせ先', '問合せ先', '問合わせ先', '連絡先',
+    'ご連絡先', 'Contact', 'CONTACT', '広報窓口', 'プレスお問い合わせ',
+    '報道関係者', 'メディア問い合わせ', '取材申し込み', 'プレスコンタクト'
+]
+
+# 抽出用の正規表現（記事ごと・要素ごとのコンパイルを避けるためモジュール読み込み時に1回だけコンパイル）
+_MEDIA_KEYWORD_RE = re.compile('|'.join(map(re.escape, MEDIA_KEYWORDS)))
+_COMPANY_CLASS_RE = re.compile('company')
+_EXCLUDE_CLASS_RE = re.compile(r'header|footer|nav|menu|sidebar')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+_CONTACT_SECTION_RES = [re.compile(pattern, re.DOTALL) for pattern in [
+    r'(?:【[^】]*(?:問い?合わ?せ|連絡先|広報)[^】]*】)([^【]+)',
+    r'(?:■[^■\n]*(?:問い?合わ?せ|連絡先|広報)[^■\n]*)([^■]+)',
+    r'(?:▼[^▼\n]*(?:問い?合わ?せ|連絡先|広報)[^▼\n]*)([^▼]+)',
+    r'(?:●[^●\n]*(?:問い?合わ?せ|連絡先|広報)[^●\n]*)([^●]+)',
+    r'(?:＜[^＞]*(?:問い?合わ?せ|連絡先|広報)[^＞]*＞)([^＜]+)'
+]]
+_COMPANY_TEXT_RE = re.compile(r'(株式会社[^\s、。；;]{1,30})')
+_PERSON_RES = [re.compile(pattern) for pattern in [
+    r'(?:担当者?[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:広報担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:PR担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'([一-龥]{2,4}[\s　]+[一-龥]{2,4})(?:\s*(?:まで|宛|様|氏))',
+    r'(?:連絡先[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:問い合わせ先[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:お問い?合わ?せ先?[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:広報[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:ご担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
+    r'(?:責任者[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})'
+]]
+_PERSON_EXCLUDE_WORDS = ('会社', '株式', '法人', '企業', '部', '課', '室', 'チーム')
+
+# メールアドレスの難読化表記（[at]/(at)/&#64;/ at は@、[dot]/(dot)/&#46;/ dot は.）を1回の走査でデコード
+# 「@」側の表記だけがグループを持つため、m.lastindexの有無で置換文字を判定できる
+_EMAIL_OBFUSCATION_RE = re.compile(
+    r'(?=[\s\[(&ad])(?:\s*(?:(at)|dot)\s*|\[(?:(at)|dot)\]|\((?:(at)|dot)\)|&#(?:(64)|46);)',
+    re.IGNORECASE
+)
+_EMAIL_LABEL_RE = re.compile(r'メール|Mail|Email|E-mail|e-mail')
+_EMAIL_RES = [
+    re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
+    re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Zぁ-ゔァ-ヴー]{2,}'),  # 日本語ドメイン対応
+]
+_EMAIL_CONTEXT_RE = re.compile(r'(?:メール|Mail|Email|E-mail|e-mail|連絡先)[^。\n]{0,50}', re.IGNORECASE)
+_FULLTEXT_EMAIL_RE = re.compile(r'([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})')
+
+# 電話番号のラベル（TEL/電話/℡/Phone/T: などを1つの選択パターンに統合）
+_PHONE_KEYWORD_RE = re.compile(r'TEL|ＴＥＬ|電話|℡|☎|Phone|[TＴ][:：]', re.IGNORECASE)
+_PHONE_RES = [re.compile(pattern) for pattern in [
+    # キーワード付きパターン
+    r'(?:TEL|Tel|tel|電話|℡|ＴＥＬ)[:：\s]*([0-9０-９\-－\(\)\s（）]{10,20})',
+    r'(?:T[:：]\s*)([0-9０-９\-－\(\)\s（）]{10,20})',
+    r'(?:電話番号[:：]\s*)([0-9０-９\-－\(\)\s（）]{10,20})',
+    # 標準的な日本の電話番号
+    r'(0\d{1,4}[-－]\d{1,4}[-－]\d{3,4})',
+    r'(０[\d０-９]{1,4}[－-][\d０-９]{1,4}[－-][\d０-９]{3,4})',
+    # 括弧付き
+    r'(\(0\d{1,4}\)\s*\d{1,4}[-－]?\d{3,4})',
+    r'(（0[\d０-９]{1,4}）\s*[\d０-９]{1,4}[－-]?[\d０-９]{3,4})',
+    # ハイフンなし
+    r'(0\d{9,10})',
+    r'(０[\d０-９]{9,10})',
+    # 国際電話番号
+    r'(\+81[-\s]?\d{1,4}[-\s]?\d{1,4}[-\s]?\d{3,4})',
+]]
+_PHONE_KEYWORD_RES = _PHONE_RES[:3]  # キーワード付きパターンのみ
+_PHONE_CONTACT_RE = re.compile(r'(?:問い?合わ?せ|連絡先|Contact|広報)[^。]*?([0-9０-９\-－\(\)\s（）]{10,20})',
+                               re.IGNORECASE | re.DOTALL)
+_FULLTEXT_PHONE_RE = re.compile(r'(?:TEL|Tel|tel|電話)[:：\s]*([0-9０-９\-－\(\)\s]{10,20})')
+_PHONE_TRANSLATION = str.maketrans('０１２３４５６７８９－（）　', '0123456789-() ')
+_PHONE_INVALID_CHARS_RE = re.compile(r'[^\d\-\(\)\+\s]')
+_PHONE_PAREN_RE = re.compile(r'\((\d+)\)')
+_HYPHENS_RE = re.compile(r'-+')
+_PHONE_SPACES_PARENS_RE = re.compile(r'[\s\(\)]')
+
+
+class Metrics:
+    """
+    処理段階ごとの所要時間（ヒストグラム）と件数（カウンター）を集計するメトリクス
+    
+    名前とラベルの組ごとに値を保持し、JSONの集計ファイルと
+    Prometheusのテキスト形式で出力できる。全スレッドから記録できる。
+    """
+    
+    # 所要時間ヒストグラムのバケット上限（秒）
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    
+    def __init__(self, prefix: str = 'prtimes'):
         """
-        PR Timesスクレイパーの修正版
+        Args:
+            prefix: Prometheus出力時のメトリクス名の接頭辞
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: Dict[tuple, float] = {}
+        self._histograms: Dict[tuple, list] = {}  # キー → [バケットごとの件数..., 合計, 件数, 最小, 最大]
+    
+    @staticmethod
+    def _key(name: str, labels: Dict[str, str]) -> tuple:
+        return (name,) + tuple(sorted((k, str(v)) for k, v in labels.items()))
+    
+    def inc(self, name: str, value: float = 1, **labels):
+        """カウンターを加算"""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+    
+    def value(self, name: str, **labels) -> float:
+        """カウンターの現在値（未記録の場合0）"""
+        with self._lock:
+            return self._counters.get(self._key(name, labels), 0)
+    
+    def observe(self, name: str, seconds: float, **labels):
+        """所要時間をヒストグラムに記録"""
+        key = self._key(name, labels)
+        n = len(self.BUCKETS)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = [0] * n + [0.0, 0, seconds, seconds]
+            for i, bound in enumerate(self.BUCKETS):
+                if seconds <= bound:
+                    hist[i] += 1
+                    break
+            hist[n] += seconds
+            hist[n + 1] += 1
+            hist[n + 2] = min(hist[n + 2], seconds)
+            hist[n + 3] = max(hist[n + 3], seconds)
+    
+    class _Timer:
+        def __init__(self, metrics: 'Metrics', name: str, labels: Dict[str, str]):
+            self.metrics, self.name, self.labels = metrics, name, labels
+        
+        def __enter__(self):
+            self.started = time.perf_counter()
+            return self
+        
+        def __exit__(self, *exc):
+            self.metrics.observe(self.name, time.perf_counter() - self.started, **self.labels)
+    
+    def timer(self, name: str, **labels) -> '_Timer':
+        """with文で囲んだ処理の所要時間を記録"""
+        return self._Timer(self, name, labels)
+    
+    def snapshot(self, reset: bool = False) -> Dict[str, Dict]:
+        """
+        現在の集計値をコピー（解析プロセスから親プロセスへ渡す用）
         
         Args:
-            email: PR Timesログイン用メールアドレス
-            password: PR Timesログイン用パスワード
-            credentials_path: Google認証用JSONファイルのパス
-            headless: ヘッドレスモードで実行するか（デフォルト: True）
+            reset: コピー後に集計値をリセットするか
         """
-        self.email = email
-        self.password = password
-        self.credentials_path = credentials_path
-        self.headless = headless
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'DNT': '1',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1'
-        })
-        self.logged_in = False
+        with self._lock:
+            data = {'counters': dict(self._counters),
+                    'histograms': {key: list(hist) for key, hist in self._histograms.items()}}
+            if reset:
+                self._counters.clear()
+                self._histograms.clear()
+        return data
+    
+    def merge(self, data: Dict[str, Dict]):
+        """snapshotで取得した集計値を加算"""
+        n = len(self.BUCKETS)
+        with self._lock:
+            for key, value in data['counters'].items():
+                self._counters[key] = self._counters.get(key, 0) + value
+            for key, other in data['histograms'].items():
+                hist = self._histograms.get(key)
+                if hist is None:
+                    self._histograms[key] = list(other)
+                    continue
+                for i in range(n + 2):
+                    hist[i] += other[i]
+                hist[n + 2] = min(hist[n + 2], other[n + 2])
+                hist[n + 3] = max(hist[n + 3], other[n + 3])
+    
+    def _quantile(self, hist: list, q: float) -> float:
+        """バケットから分位点を概算（該当バケットの上限、最大値を超えない）"""
+        n = len(self.BUCKETS)
+        target = q * hist[n + 1]
+        cumulative = 0
+        for i, bound in enumerate(self.BUCKETS):
+            cumulative += hist[i]
+            if cumulative >= target:
+                return min(bound, hist[n + 3])
+        return hist[n + 3]
     
+    def summary(self) -> Dict[str, list]:
+        """JSON出力用の集計結果"""
+        n = len(self.BUCKETS)
+        data = self.snapshot()
+        counters = [{'name': key[0], 'labels': dict(key[1:]), 'value': value}
+                    for key, value in sorted(data['counters'].items())]
+        histograms = []
+        for key, hist in sorted(data['histograms'].items()):
+            count = hist[n + 1]
+            histograms.append({
+                'name': key[0], 'labels': dict(key[1:]), 'count': count,
+                'sum_seconds': round(hist[n], 6),
+                'mean_ms': round(hist[n] / count * 1000, 3) if count else 0.0,
+                'min_ms': round(hist[n + 2] * 1000, 3), 'max_ms': round(hist[n + 3] * 1000, 3),
+                'p50_ms': round(self._quantile(hist, 0.5) * 1000, 3),
+                'p95_ms': round(self._quantile(hist, 0.95) * 1000, 3),
+            })
+        return {'counters': counters, 'histograms': histograms}
+    
+    def write_json(self, path: str):
+        """集計結果をJSONファイルに書き出す"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'generated_at': datetime.now().isoformat(timespec='seconds'), **self.summary()},
+                      f, ensure_ascii=False, indent=2)
+        logger.info(f"メトリクスを保存しました: {path}")
     
+    def prometheus_text(self) -> str:
+        """Prometheusのテキスト形式で出力"""
+        n = len(self.BUCKETS)
+        data = self.snapshot()
+        
+        def label_text(pairs) -> str:
+            if not pairs:
+                return ''
+            escaped = ((k, v.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')) for k, v in pairs)
+            return '{' + ','.join(f'{k}="{v}"' for k, v in escaped) + '}'
+        
+        lines = []
+        declared = set()
+        for key, value in sorted(data['counters'].items()):
+            name = f'{self.prefix}_{key[0]}'
+            if name not in declared:
+                lines.append(f'# TYPE {name} counter')
+                declared.add(name)
+            lines.append(f'{name}{label_text(key[1:])} {value}')
+        for key, hist in sorted(data['histograms'].items()):
+            name = f'{self.prefix}_{key[0]}'
+            if name not in declared:
+                lines.append(f'# TYPE {name} histogram')
+                declared.add(name)
+            cumulative = 0
+            for i, bound in enumerate(self.BUCKETS):
+                cumulative += hist[i]
+                lines.append(f'{name}_bucket{label_text(key[1:] + (("le", str(bound)),))} {cumulative}')
+            lines.append(f'{name}_bucket{label_text(key[1:] + (("le", "+Inf"),))} {hist[n + 1]}')
+            lines.append(f'{name}_sum{label_text(key[1:])} {hist[n]}')
+            lines.append(f'{name}_count{label_text(key[1:])} {hist[n + 1]}')
+        return '\n'.join(lines) + '\n'
     
-    def login(self) -> bool:
+    def serve(self, port: int, host: str = '127.0.0.1'):
         """
-        PR TimesにSeleniumを使ってログイン
+        Prometheus用のエンドポイント（/metrics）をバックグラウンドで起動
         
         Returns:
-            bool: ログイン成功時True、失敗時False
+            ThreadingHTTPServer: 起動したサーバー（shutdown()で停止）
         """
-        driver = None
-        try:
-            # Chrome オプション設定
-            chrome_options = Options()
-            if self.headless:
-                chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--disable-software-rasterizer')
-            chrome_options.add_argument('--remote-debugging-port=9222')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-            
-            # Chromiumのバイナリパスを明示的に指定
-            chrome_options.binary_location = '/snap/bin/chromium'
-            
-            # ChromeDriver 自動管理 - Chromium用の設定
-            from webdriver_manager.chrome import ChromeDriverManager
-            from webdriver_manager.core.driver_cache import DriverCacheManager
-            from webdriver_manager.core.os_manager import ChromeType
-            
-            # Chromium用のドライバーをインストール
-            try:
-                chromedriver_path = ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
-                logger.info(f"ChromeDriverパス: {chromedriver_path}")
-                
-                # 正しいパスが指定されているか確認
-                if not chromedriver_path.endswith('chromedriver'):
-                    # 正しいパスを構築
-                    chromedriver_dir = os.path.dirname(chromedriver_path)
-                    chromedriver_path = os.path.join(chromedriver_dir, 'chromedriver')
-                    logger.info(f"修正されたChromeDriverパス: {chromedriver_path}")
-                
-                service = Service(chromedriver_path)
-            except Exception as e:
-                logger.error(f"ChromeDriverの初期化エラー: {e}")
-                raise
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.implicitly_wait(10)
-            
-            # メディアユーザーログインURLにアクセス
-            login_url = 'https://prtimes.jp/main/html/medialogin'
-            logger.info(f"Seleniumでログインページにアクセス: {login_url}")
-            driver.get(login_url)
-            
-            # ページ読み込み待機
-            wait = WebDriverWait(driver, 20)
-            
-            # メールアドレス入力フィールドを探す
-            email_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "mail"))
-            )
-            email_field.clear()
-            email_field.send_keys(self.email)
-            logger.info("メールアドレスを入力しました")
+        import http.server
+        metrics = self
+        
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.prometheus_text().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
             
-            # パスワード入力フィールドを探す
-            password_field = driver.find_element(By.NAME, "pass")
-            password_field.clear()
-            password_field.send_keys(self.password)
-            logger.info("パスワードを入力しました")
+            def log_message(self, format, *args):
+                pass
+        
+        server = http.server.ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        logger.info(f"メトリクスのエンドポイントを起動しました: http://{host}:{server.server_port}/metrics")
+        return server
+    
+    def log_stages(self):
+        """段階ごとの所要時間をログに出力"""
+        for item in self.summary()['histograms']:
+            labels = ', '.join(f'{k}={v}' for k, v in item['labels'].items())
+            logger.info(f"  {item['name']}{{{labels}}}: {item['count']}回 / 平均 {item['mean_ms']:.1f}ms"
+                        f" / p95 {item['p95_ms']:.1f}ms / 合計 {item['sum_seconds']:.1f}秒")
+
+
+# 実行全体のメトリクス（解析プロセスでは各プロセスに1つ作られ、結果と一緒に親へ渡される）
+metrics = Metrics()
+
+
+class Profiler:
+    """
+    スクレイピング処理のプロファイラー（--profile）
+    
+    'cprofile' は全スレッドの関数呼び出しを計測してpstats形式（.prof）で保存し、
+    'sample' は一定間隔で全スレッドのスタックを採取してflamegraph用のfolded形式（.folded）で保存する。
+    どちらも上位の関数一覧と、記事解析の段階（parse_articleの各メソッド）別の内訳を出力する。
+    """
+    
+    MODES = ('cprofile', 'sample')
+    
+    # 記事解析の段階と、それを実装するメソッド名
+    SECTIONS = [
+        ('高速抽出', '_parse_fast_path'),
+        ('DOM構築', '_build_dom'),
+        ('会社名', '_extract_company'),
+        ('セクション特定', '_find_contact_section'),
+        ('担当者名', '_extract_person'),
+        ('メール: 構造', '_email_from_structure'),
+        ('メール: キーワード周辺', '_email_from_context'),
+        ('メール: セクション全文', '_email_from_text'),
+        ('電話: 構造', '_phone_from_structure'),
+        ('電話: キーワード', '_phone_from_keywords'),
+        ('電話: 問い合わせ先', '_phone_from_contact'),
+        ('全文フォールバック', '_extract_from_full_text'),
+    ]
+    
+    def __init__(self, mode: str = 'cprofile', output_prefix: str = None, interval: float = 0.005,
+                 top: int = 30):
+        """
+        Args:
+            mode: 'cprofile'（決定的プロファイラー）または 'sample'（サンプリング）
+            output_prefix: 出力ファイル名の接頭辞（省略時は prtimes_profile_日時）
+            interval: サンプリング間隔（秒、'sample'のみ）
+            top: 上位の関数一覧に出力する件数
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"modeは {', '.join(self.MODES)} のいずれかを指定してください: {mode}")
+        self.mode = mode
+        self.output_prefix = output_prefix or f"prtimes_profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.interval = interval
+        self.top = top
+        self._profiles = []
+        self._lock = threading.Lock()
+        self._stacks: Dict[tuple, int] = {}
+        self._stop = threading.Event()
+        self._sampler = None
+    
+    def start(self):
+        """計測を開始（以降に起動したスレッドも計測対象）"""
+        if self.mode == 'cprofile':
+            import cProfile
             
-            # ログインボタンを探してクリック
-            # 複数のセレクタを試す
-            login_button = None
-            button_selectors = [
-                (By.XPATH, "//button[contains(text(), 'ログイン')]"),
-                (By.XPATH, "//input[@type='submit' and (@value='ログイン' or @value='Login')]"),
-                (By.XPATH, "//button[@type='submit']"),
-                (By.CSS_SELECTOR, "button[type='submit']"),
-                (By.CSS_SELECTOR, "input[type='submit']")
-            ]
+            def enable_in_thread(*args):
+                # 新しいスレッドの最初のイベントで、そのスレッド用のプロファイラーに切り替える
+                sys.setprofile(None)
+                profile = cProfile.Profile()
+                with self._lock:
+                    self._profiles.append(profile)
+                profile.enable()
             
-            for selector_type, selector_value in button_selectors:
-                try:
-                    login_button = driver.find_element(selector_type, selector_value)
-                    if login_button:
-                        break
-                except:
+            # 3.12以降のcProfileはsys.monitoringで全スレッドを計測し、同時に1つしか有効にできないため
+            # メインスレッドのプロファイラーだけを使う（スレッドごとに有効にするとValueErrorになる）
+            if sys.version_info < (3, 12):
+                threading.setprofile(enable_in_thread)
+            main_profile = cProfile.Profile()
+            self._profiles.append(main_profile)
+            main_profile.enable()
+        else:
+            self._sampler = threading.Thread(target=self._sample, name='profiler-sampler', daemon=True)
+            self._sampler.start()
+        logger.info(f"プロファイルを開始しました（{self.mode}）")
+    
+    def _sample(self):
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
                     continue
-            
-            if not login_button:
-                logger.error("ログインボタンが見つかりませんでした")
-                return False
-            
-            # スクリーンショット（デバッグ用）
-            if not self.headless:
-                driver.save_screenshot("before_login.png")
-            
-            login_button.click()
-            logger.info("ログインボタンをクリックしました")
-            
-            # ログイン処理の待機（ページ遷移またはエラーメッセージ）
-            time.sleep(3)
-            
-            # ログイン成功の確認
-            current_url = driver.current_url
-            page_source = driver.page_source.lower()
-            
-            # 成功判定
-            success_indicators = ['logout', 'ログアウト', 'mypage', 'マイページ', 'dashboard', 'ダッシュボード']
-            failure_indicators = ['error', 'エラー', 'invalid', '無効', 'incorrect', '間違い', 'ログインできませんでした']
-            
-            login_success = False
-            if any(indicator in page_source for indicator in success_indicators):
-                logger.info("ログインに成功しました")
-                login_success = True
-            elif any(indicator in page_source for indicator in failure_indicators):
-                logger.error("ログインに失敗しました（認証エラー）")
-                if not self.headless:
-                    driver.save_screenshot("login_error.png")
-                return False
-            elif current_url != login_url:
-                # URLが変わっていればログイン成功の可能性が高い
-                logger.info(f"ログイン後のURL: {current_url}")
-                login_success = True
-            else:
-                logger.warning("ログイン結果の判定ができませんでした")
-                if not self.headless:
-                    driver.save_screenshot("login_unknown.png")
-            
-            if login_success:
-                # Cookieを取得してrequests.Sessionにコピー
-                logger.info("CookieをSeleniumからrequestsにコピー中...")
-                selenium_cookies = driver.get_cookies()
-                
-                for cookie in selenium_cookies:
-                    # requests用のCookie形式に変換
-                    cookie_obj = {
-                        'name': cookie['name'],
-                        'value': cookie['value'],
-                        'domain': cookie.get('domain', ''),
-                        'path': cookie.get('path', '/'),
-                        'secure': cookie.get('secure', False),
-                        'expires': cookie.get('expiry', None)
-                    }
-                    
-                    # requestsのセッションにCookieを追加
-                    self.session.cookies.set(
-                        cookie_obj['name'],
-                        cookie_obj['value'],
-                        domain=cookie_obj['domain'],
-                        path=cookie_obj['path'],
-                        secure=cookie_obj['secure']
-                    )
-                
-                logger.info(f"{len(selenium_cookies)}個のCookieをコピーしました")
-                self.logged_in = True
-                
-                # ログイン確認のためマイページにアクセス
-                mypage_urls = [
-                    'https://prtimes.jp/mypage',
-                    'https://prtimes.jp/main/mypage',
-                    'https://prtimes.jp/main/action.php?run=html&page=mypage'
-                ]
-                
-                for mypage_url in mypage_urls:
-                    try:
-                        test_response = self.session.get(mypage_url)
-                        if test_response.status_code == 200 and 'logout' in test_response.text.lower():
-                            logger.info(f"ログイン確認完了: {mypage_url}")
-                            return True
-                    except:
-                        continue
-                
-                return True
-            
-            return False
-                
-        except Exception as e:
-            logger.error(f"Seleniumログイン中にエラーが発生しました: {e}")
-            if not self.headless and driver:
-                driver.save_screenshot("login_exception.png")
-            return False
-        finally:
-            if driver:
-                driver.quit()
-                logger.info("Seleniumドライバーを終了しました")
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                key = tuple(reversed(stack))
+                self._stacks[key] = self._stacks.get(key, 0) + 1
     
-    def search_articles(self, keyword: str, max_articles: int = 80) -> List[str]:
+    def stop(self) -> List[str]:
         """
-        キーワードで検索し、記事URLを収集（requests.Session維持）
+        計測を終了して結果を書き出す
         
-        Args:
-            keyword: 検索キーワード
-            max_articles: 収集する最大記事数
-            
         Returns:
-            List[str]: 記事URLのリスト
+            List[str]: 書き出したファイルのパス
         """
-        article_urls = []
-        encoded_keyword = urllib.parse.quote(keyword)
-        
-        # セッションを維持したまま検索
-        base_url = f'https://prtimes.jp/main/action.php?run=html&page=searchkey&search_word={encoded_keyword}'
+        if self.mode == 'cprofile':
+            threading.setprofile(None)
+            for profile in self._profiles:
+                profile.disable()
+            return self._write_cprofile()
+        self._stop.set()
+        self._sampler.join()
+        return self._write_samples()
+    
+    def _write_cprofile(self) -> List[str]:
+        import pstats
         
-        page = 0
-        while len(article_urls) < max_articles and page < 5:
-            if page == 0:
-                url = base_url
-            else:
-                url = f'{base_url}&search_page={page}'
-            
+        stats = pstats.Stats(self._profiles[0])
+        for profile in self._profiles[1:]:
             try:
-                logger.info(f"検索中: {url}")
-                response = self.session.get(url)  # セッション維持
-                
-                if response.status_code != 200:
-                    logger.warning(f"ステータスコード {response.status_code}: {url}")
-                    break
-                
-                response.encoding = 'utf-8'
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                links = soup.select('a[href*="/main/html/rd/p/"]')
-                
-                if not links:
-                    logger.info("これ以上記事が見つかりません")
-                    break
-                
-                for link in links:
-                    href = link.get('href', '')
-                    if href:
-                        if href.startswith('/'):
-                            href = f'https://prtimes.jp{href}'
-                        elif not href.startswith('http'):
-                            href = f'https://prtimes.jp/{href}'
-                        
-                        if href not in article_urls:
-                            article_urls.append(href)
-                            
-                            if len(article_urls) >= max_articles:
-                                break
-                
-                logger.info(f"ページ {page + 1} から {len(links)} 件の記事を発見（累計: {len(article_urls)}件）")
-                
-                page += 1
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"検索エラー: {e}")
-                break
+                stats.add(profile)
+            except TypeError:
+                continue  # 計測対象の関数を1つも呼ばなかったスレッド
+        prof_path = f'{self.output_prefix}.prof'
+        stats.dump_stats(prof_path)
         
-        logger.info(f"合計 {len(article_urls)} 件の記事URLを収集しました")
-        return article_urls[:max_articles]
-    
-    def normalize_text(self, text: str) -> str:
-        """テキストの正規化処理"""
-        # Unicode正規化
-        text = unicodedata.normalize('NFKC', text)
-        # 余分な空白を削除
-        text = re.sub(r'\s+', ' ', text)
-        # 改行を空白に変換
-        text = text.replace('\n', ' ').replace('\r', ' ')
-        return text.strip()
+        # (関数名, 自己時間, 累積時間, 呼び出し回数)
+        rows = []
+        for (filename, line, name), (_, calls, self_time, cumulative, _) in stats.stats.items():
+            label = f"{name} ({os.path.basename(filename)}:{line})"
+            rows.append((label, name, self_time, cumulative, calls))
+        total = max((row[3] for row in rows if row[1] == 'parse_article'), default=0.0)
+        
+        def section_time(function: str) -> float:
+            return sum(row[3] for row in rows if row[1] == function)
+        
+        lines = [f"記事解析（parse_article）の累積時間: {total:.3f}秒", '', '段階別の内訳（累積時間）:']
+        for label, function in self.SECTIONS:
+            seconds = section_time(function)
+            share = f"{seconds / total:6.1%}" if total else '     -'
+            lines.append(f"  {label:<16}{seconds:9.3f}秒 {share}  {function}")
+        lines += ['', f'自己時間の上位{self.top}関数:', f"  {'自己時間':>10}{'累積時間':>10}{'呼出回数':>10}  関数"]
+        for label, _, self_time, cumulative, calls in sorted(rows, key=lambda r: r[2], reverse=True)[:self.top]:
+            lines.append(f"  {self_time:10.3f}{cumulative:10.3f}{calls:10d}  {label}")
+        return [prof_path, self._write_report(lines)]
     
-    def decode_email(self, text: str) -> str:
-        """難読化されたメールアドレスをデコード"""
-        # メールアドレスの難読化パターン
-        email_replacements = [
-            (r'\[at\]', '@'),
-            (r'\(at\)', '@'),
-            (r'\[dot\]', '.'),
-            (r'\(dot\)', '.'),
-            (r'＠', '@'),
-            (r'@', '@'),  # 全角アットマーク
-            (r'．', '.'),  # 全角ピリオド
-            (r'\s*at\s*', '@'),
-            (r'\s*dot\s*', '.'),
-            (r'&#64;', '@'),
-            (r'&#46;', '.'),
-        ]
+    def _write_samples(self) -> List[str]:
+        folded_path = f'{self.output_prefix}.folded'
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self._stacks.items()):
+                f.write(';'.join(frame.replace(';', ',') for frame in stack) + f' {count}\n')
         
-        decoded = text
-        for pattern, replacement in email_replacements:
-            decoded = re.sub(pattern, replacement, decoded, flags=re.IGNORECASE)
-        return decoded
-    
-    def normalize_phone(self, phone: str) -> str:
-        """電話番号の正規化"""
-        # 全角を半角に変換
-        phone = phone.translate(str.maketrans('０１２３４５６７８９－（）　', '0123456789-() '))
-        # 余分な文字を削除
-        phone = re.sub(r'[^\d\-\(\)\+\s]', '', phone)
-        # 空白を削除
-        phone = re.sub(r'\s+', '', phone)
-        # 括弧を処理
-        phone = re.sub(r'\((\d+)\)', r'\1-', phone)
-        # 複数のハイフンを一つに
-        phone = re.sub(r'-+', '-', phone)
-        # 先頭と末尾のハイフンを削除
-        phone = phone.strip('-')
+        total_samples = sum(self._stacks.values())
+        parse_samples = sum(count for stack, count in self._stacks.items()
+                            if any('parse_article' in frame for frame in stack))
         
-        # ハイフンがない10桁の電話番号にハイフンを追加
-        if re.match(r'^\d{10}$', phone):
-            if phone.startswith('03') or phone.startswith('06'):
-                phone = f"{phone[:2]}-{phone[2:6]}-{phone[6:]}"
-            else:
-                phone = f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
-        elif re.match(r'^\d{11}$', phone):
-            phone = f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
+        def section_samples(function: str) -> int:
+            return sum(count for stack, count in self._stacks.items()
+                       if any(frame.startswith(function + ' ') or f'.{function} ' in frame for frame in stack))
         
-        return phone
+        lines = [f"サンプル数: {total_samples}（間隔 {self.interval * 1000:.0f}ms）",
+                 f"記事解析（parse_article）中のサンプル: {parse_samples}", '', '段階別の内訳（サンプル数）:']
+        for label, function in self.SECTIONS:
+            count = section_samples(function)
+            share = f"{count / parse_samples:6.1%}" if parse_samples else '     -'
+            lines.append(f"  {label:<16}{count:9d} {share}  {function}")
+        
+        # 関数ごとの自己サンプル数（スタックの末端）と累積サンプル数
+        self_counts: Dict[str, int] = {}
+        total_counts: Dict[str, int] = {}
+        for stack, count in self._stacks.items():
+            self_counts[stack[-1]] = self_counts.get(stack[-1], 0) + count
+            for frame in set(stack):
+                total_counts[frame] = total_counts.get(frame, 0) + count
+        lines += ['', f'自己サンプル数の上位{self.top}関数:', f"  {'自己':>8}{'累積':>8}  関数"]
+        for frame, count in sorted(self_counts.items(), key=lambda item: item[1], reverse=True)[:self.top]:
+            lines.append(f"  {count:8d}{total_counts[frame]:8d}  {frame}")
+        return [folded_path, self._write_report(lines)]
     
-    def extract_info(self, article_url: str, keyword: str = '') -> Dict[str, str]:
+    def _write_report(self, lines: List[str]) -> str:
+        report_path = f'{self.output_prefix}_top.txt'
+        with open(report_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        for line in lines[:len(self.SECTIONS) + 4]:
+            logger.info(line)
+        return report_path
+
+
+class RequestRateLimiter:
+    """
+    全スレッド共通のトークンバケット型レートリミッター
+    
+    429/5xxを受けたら送信レートを下げて指数的に待機し（Retry-Afterを優先）、
+    正常な応答が続く間は少しずつレートを上限まで戻す。
+    """
+    
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+    
+    def __init__(self, requests_per_second: float = 2.0, max_requests_per_second: float = None,
+                 burst: int = 1, min_requests_per_second: float = 0.2,
+                 backoff_base: float = 2.0, backoff_max: float = 120.0,
+                 recovery_step: float = 0.1, recovery_after: int = 10):
         """
-        記事ページから情報を抽出（セッション維持）
+        Args:
+            requests_per_second: 開始時の1秒あたりのリクエスト数（0以下で制限なし）
+            max_requests_per_second: 回復時に到達できる上限（省略時は開始時のレート）
+            burst: バケットに貯められるトークン数（連続送信できる最大数）
+            min_requests_per_second: バックオフ時の下限レート
+            backoff_base: 連続エラー時の待機秒数の基数（base * 2^n）
+            backoff_max: 1回の待機秒数の上限
+            recovery_step: 回復時に加算するレート
+            recovery_after: レートを回復させるまでに必要な連続成功回数
+        """
+        self.rate = requests_per_second
+        self.max_rate = max(max_requests_per_second or requests_per_second, requests_per_second)
+        self.min_rate = min(min_requests_per_second, requests_per_second) if requests_per_second > 0 else 0.0
+        self.burst = max(1, burst)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.recovery_step = recovery_step
+        self.recovery_after = recovery_after
+        self._lock = threading.Lock()
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._blocked_until = 0.0
+        self._consecutive_errors = 0
+        self._consecutive_successes = 0
+    
+    def _refill(self, now: float):
+        """経過時間に応じてトークンを補充（ロック取得済みで呼ぶ）"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+    
+    def wait(self):
+        """トークンが得られるまで待機（レート制限なしの場合もバックオフ中は待機）"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if self.rate > 0:
+                    self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self.rate <= 0:
+                    return
+                elif self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                else:
+                    delay = (1.0 - self._tokens) / self.rate
+            time.sleep(delay)
+    
+    def backoff_delay(self, retry_after: Optional[str] = None) -> float:
+        """次の再試行までの待機秒数（Retry-Afterヘッダーがあれば優先）"""
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                try:
+                    retry_at = email.utils.parsedate_to_datetime(retry_after)
+                    return min(max(0.0, retry_at.timestamp() - time.time()), self.backoff_max)
+                except (TypeError, ValueError):
+                    pass
+        return min(self.backoff_base * (2 ** max(0, self._consecutive_errors - 1)), self.backoff_max)
+    
+    def record_response(self, status_code: int, retry_after: Optional[str] = None) -> float:
+        """
+        応答結果をレート制御に反映
         
         Args:
-            article_url: 記事のURL
-            keyword: 検索キーワード
+            status_code: HTTPステータスコード
+            retry_after: Retry-Afterヘッダーの値
             
         Returns:
-            Dict[str, str]: 抽出した情報
+            float: 再試行前に必要な待機秒数（正常応答時は0）
         """
-        info = {
-            '記事URL': article_url,
-            '検索キーワード': keyword,
-            '会社名': '',
-            '担当者名': '',
-            'メールアドレス': '',
-            '電話番号': ''
-        }
-        
-        try:
-            # デバッグログ: 処理対象URL
-            logger.debug(f"処理対象URL: {article_url}")
-            
-            response = self.session.get(article_url)  # セッション維持
-            response.encoding = 'utf-8'
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 会社名の抽出（既存ロジックを維持）
-            company_elem = soup.find('div', {'class': 'release-company'})
-            if not company_elem:
-                company_elem = soup.find('a', {'class': 'link-to-company'})
-            if not company_elem:
-                company_elem = soup.find(['div', 'span', 'a'], class_=re.compile('company'))
-            if not company_elem:
-                # PR Times特有のセレクタを追加
-                company_elem = soup.select_one('.content-header-sub-text, .release-header__company')
-            
-            if company_elem:
-                info['会社名'] = company_elem.text.strip()
-            else:
-                # メタデータから会社名を取得
-                meta_company = soup.find('meta', {'property': 'og:site_name'})
-                if meta_company and meta_company.get('content'):
-                    company_name = meta_company.get('content').replace('のプレスリリース', '').strip()
-                    if company_name and company_name != 'PR TIMES':
-                        info['会社名'] = company_name
-            
-            # 記事本文エリアを特定（フッター・ヘッダーを除外）
-            main_content = None
-            content_selectors = [
-                'main', 'article', '.content', '.main-content', 
-                '.article-content', '.release-content', '.press-release'
-            ]
-            
-            for selector in content_selectors:
-                main_content = soup.select_one(selector)
-                if main_content:
-                    logger.debug(f"記事本文エリア特定: {selector}")
-                    break
-            
-            # 本文エリアが見つからない場合は、フッター・ヘッダーを除外したbody
-            if not main_content:
-                main_content = soup.find('body')
-                if main_content:
-                    # フッター・ヘッダーを除外
-                    for exclude_tag in main_content.find_all(['header', 'footer', 'nav']):
-                        exclude_tag.decompose()
-                    # PR TIMESの共通要素を除外
-                    for exclude_class in main_content.find_all(class_=re.compile(r'header|footer|nav|menu|sidebar')):
-                        exclude_class.decompose()
-                    logger.debug("記事本文エリア: body（フッター・ヘッダー除外後）")
-            
-            # メディア関係者限定セクションを優先的に探す（本文エリア内で）
-            section = None
-            media_keywords = [
-                'メディア関係者限定', '本件に関するお問い合わせ', 'プレスリリースに関するお問い合わせ',
-                '報道関係者お問い合わせ先', '広報担当', 'PR担当', '取材依頼', '問い合わせ先',
-                'お問合せ先', 'お問合わせ先', '問合せ先', '問合わせ先', '連絡先',
-                'ご連絡先', 'Contact', 'CONTACT', '広報窓口', 'プレスお問い合わせ',
-                '報道関係者', 'メディア問い合わせ', '取材申し込み', 'プレスコンタクト'
-            ]
-            
-            search_area = main_content if main_content else soup
-            
-            for keyword in media_keywords:
-                # キーワードを含む要素を探す（本文エリア内で）
-                elements = search_area.find_all(string=re.compile(keyword))
-                for element in elements:
-                    if element.parent:
-                        # 親要素を遡って適切なセクションを見つける
-                        parent = element.parent
-                        while parent and parent.name not in ['div', 'section', 'p', 'td']:
-                            parent = parent.parent
-                        if parent:
-                            # PR TIMESの共通フッターでないことを確認
-                            parent_text = parent.get_text(strip=True)
-                            if not ('Copyright' in parent_text and 'PR TIMES' in parent_text):
-                                section = parent
-                                logger.debug(f"対象セクション発見: {keyword}")
-                                break
-                if section:
-                    break
-            
-            # 問い合わせ先テーブルを探す（PR Times特有の構造）
-            if not section:
-                # テーブル形式の問い合わせ先情報を探す
-                tables = search_area.find_all('table')
-                for table in tables:
-                    table_text = table.get_text()
-                    if any(keyword in table_text for keyword in media_keywords):
-                        section = table
-                        logger.debug("問い合わせ先テーブルを発見")
-                        break
-            
-            # デバッグログ: 抽出対象セクションのHTML
-            if section:
-                section_html = str(section)[:500]  # 最初の500文字
-                logger.debug(f"対象セクションHTML: {section_html}...")
-            else:
-                logger.debug("対象セクションが見つからず、全文を使用")
+        with self._lock:
+            if status_code in self.RETRY_STATUS_CODES:
+                # 再試行の待機はレート制限なし（0以下）の場合も行う
+                self._consecutive_errors += 1
+                self._consecutive_successes = 0
+                delay = self.backoff_delay(retry_after)
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                self._tokens = 0.0
+                if self.rate <= 0:
+                    logger.warning(f"ステータスコード {status_code} のため {delay:.1f}秒待機します")
+                    return delay
+                self.rate = max(self.min_rate, self.rate / 2)
+                logger.warning(f"ステータスコード {status_code} のため {delay:.1f}秒待機し、"
+                               f"レートを {self.rate:.2f} req/s に下げます")
+                return delay
             
-            # セクションが見つかった場合はその範囲内のテキストを使用
-            if section:
-                text = section.get_text(separator=' ', strip=True)
+            self._consecutive_errors = 0
+            self._consecutive_successes += 1
+            if self.rate > 0 and self._consecutive_successes >= self.recovery_after and self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+                self._consecutive_successes = 0
+                logger.debug(f"レートを {self.rate:.2f} req/s に回復")
+            return 0.0
+
+
+class _Http2StreamBody:
+    """
+    stream=Trueで送信したhttpxのレスポンス本文をrequestsのResponse.rawとして読ませるラッパー
+    
+    Response.iter_contentはrawのstream()を使うため、受信した分だけ本文を渡せる。
+    """
+    
+    def __init__(self, result, httpx_module, message: http.client.HTTPMessage):
+        self._result = result
+        self._httpx = httpx_module
+        # Session側でSet-CookieをCookieJarへ取り込めるようにヘッダーを渡す
+        self._original_response = SimpleNamespace(msg=message)
+    
+    def stream(self, chunk_size: int = 8192, decode_content: bool = True) -> Iterator[bytes]:
+        """本文を展開済みのチャンクとして順に返す（Content-Encodingはhttpxで展開）"""
+        try:
+            yield from self._result.iter_bytes(chunk_size)
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e)
+    
+    def close(self):
+        self._result.close()
+
+
+class Http2Adapter(requests.adapters.BaseAdapter):
+    """
+    httpx（HTTP/2）で送信するrequests用のトランスポートアダプター
+    
+    requests.Sessionにマウントして使うため、Cookie・リダイレクト・ヘッダーの扱いは
+    これまで通りrequests側で行われる。証明書の検証・クライアント証明書・プロキシ
+    （環境変数から解決したものを含む）とstream=Trueもrequestsと同じく扱う。
+    httpxは任意の依存（pip install 'httpx[http2]'）。
+    """
+    
+    HOP_BY_HOP_HEADERS = ('connection', 'keep-alive', 'proxy-connection', 'transfer-encoding', 'upgrade')
+    
+    def __init__(self, pool_maxsize: int = 10):
+        """
+        Args:
+            pool_maxsize: 保持する最大接続数（証明書・プロキシの組み合わせごと）
+        """
+        super().__init__()
+        import httpx
+        self._httpx = httpx
+        self._pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        # (verify, cert, プロキシURL) → httpx.Client（httpxでは接続単位の設定のため組み合わせごとに保持）
+        self._clients: Dict[tuple, object] = {}
+    
+    @staticmethod
+    def _ssl_context(verify, cert):
+        """requestsのverify/cert引数をhttpxのverify引数（bool または ssl.SSLContext）に変換"""
+        if not cert and isinstance(verify, bool):
+            return verify
+        if verify is False:
+            context = ssl.create_default_context()
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        elif verify is True:
+            context = ssl.create_default_context(cafile=requests.utils.DEFAULT_CA_BUNDLE_PATH)
+        elif os.path.isdir(verify):
+            context = ssl.create_default_context(capath=verify)
+        else:
+            context = ssl.create_default_context(cafile=verify)
+        if cert:
+            if isinstance(cert, (tuple, list)):
+                context.load_cert_chain(*cert)
             else:
-                # フォールバック1: 記事本文エリアから抽出
-                if main_content:
-                    text = main_content.get_text(separator=' ', strip=True)
-                    logger.debug("フォールバック1: 記事本文エリア全体を使用")
-                else:
-                    # フォールバック2: 全文テキストを使用（最後の手段）
-                    text = soup.get_text(separator=' ', strip=True)
-                    logger.debug("フォールバック2: 全文テキストを使用")
-            
-            # デバッグログ: 抜き出したテキストの詳細情報
-            logger.debug(f"抽出対象テキスト（冒頭100文字）: {text[:100]}")
-            logger.debug(f"抽出対象テキスト長: {len(text)}文字")
-            
-            # 問い合わせ先の可能性が高い部分を抽出
-            contact_section_patterns = [
-                r'(?:【[^】]*(?:問い?合わ?せ|連絡先|広報)[^】]*】)([^【]+)',
-                r'(?:■[^■\n]*(?:問い?合わ?せ|連絡先|広報)[^■\n]*)([^■]+)',
-                r'(?:▼[^▼\n]*(?:問い?合わ?せ|連絡先|広報)[^▼\n]*)([^▼]+)',
-                r'(?:●[^●\n]*(?:問い?合わ?せ|連絡先|広報)[^●\n]*)([^●]+)',
-                r'(?:＜[^＞]*(?:問い?合わ?せ|連絡先|広報)[^＞]*＞)([^＜]+)'
-            ]
-            
-            for pattern in contact_section_patterns:
-                contact_match = re.search(pattern, text, re.DOTALL)
-                if contact_match:
-                    contact_text = contact_match.group(1)[:500]  # 最大500文字
-                    logger.debug(f"問い合わせセクション検出: {contact_text[:100]}...")
-                    # このセクションから優先的に情報を抽出
-                    text = contact_text + ' ' + text  # 前に追加して優先度を上げる
-            
-            # 主要キーワードの有無をチェック
-            keywords_check = {
-                'お問い合わせ': 'お問い合わせ' in text,
-                '担当': '担当' in text,
-                'TEL': 'TEL' in text or '電話' in text,
-                '@': '@' in text
-            }
-            logger.debug(f"キーワード存在チェック: {keywords_check}")
-            
-            # ピンポイント正規表現による抽出
-            
-            # 会社名の抽出（HTML要素から取得できなかった場合）
-            if not info['会社名']:
-                company_match = re.search(r'(株式会社[^\s、。；;]{1,30})', text)
-                if company_match:
-                    info['会社名'] = company_match.group(1)
-                    logger.debug(f"会社名をテキストから抽出: {info['会社名']}")
-            
-            # 担当者名の抽出（複数パターン）
-            person_patterns = [
-                r'(?:担当者?[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:広報担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:PR担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'([一-龥]{2,4}[\s　]+[一-龥]{2,4})(?:\s*(?:まで|宛|様|氏))',
-                r'(?:連絡先[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:問い合わせ先[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:お問い?合わ?せ先?[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:広報[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:ご担当[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})',
-                r'(?:責任者[:：]\s*)([一-龥ぁ-んァ-ヶー]{2,10})'
-            ]
-            
-            for pattern in person_patterns:
-                person_match = re.search(pattern, text)
-                if person_match:
-                    candidate = person_match.group(1).strip()
-                    # 無効な候補を除外
-                    if (candidate and len(candidate) >= 2 and len(candidate) <= 10 and
-                        '会社' not in candidate and '株式' not in candidate and
-                        '法人' not in candidate and '企業' not in candidate and
-                        '部' not in candidate and '課' not in candidate and
-                        '室' not in candidate and 'チーム' not in candidate):
-                        info['担当者名'] = candidate
-                        logger.debug(f"担当者名を抽出: {info['担当者名']} (パターン: {pattern})")
-                        break
-            
-            # メールアドレスの抽出（改良版）
-            # まず難読化されたメールアドレスをデコード
-            decoded_text = self.decode_email(text)
-            
-            # HTMLのテーブルやリストから構造的に抽出を試みる
-            potential_emails = []
-            
-            # テーブル形式の情報を探す
-            for table in soup.find_all('table'):
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    for i in range(len(cells) - 1):
-                        cell_text = self.normalize_text(cells[i].get_text())
-                        if any(keyword in cell_text for keyword in ['メール', 'Mail', 'Email', 'E-mail', 'e-mail']):
-                            next_cell_text = self.normalize_text(cells[i + 1].get_text())
-                            potential_emails.append(self.decode_email(next_cell_text))
-            
-            # リスト形式の情報を探す
-            for li in soup.find_all('li'):
-                li_text = self.normalize_text(li.get_text())
-                if '@' in li_text or any(pattern in li_text for pattern in ['[at]', '(at)', '[dot]', '(dot)']):
-                    potential_emails.append(self.decode_email(li_text))
-            
-            # メールアドレスの正規表現パターン
-            email_patterns = [
-                r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}',
-                r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Zぁ-ゔァ-ヴー]{2,}',  # 日本語ドメイン対応
-            ]
-            
-            # 構造から抽出した候補を優先的にチェック
-            for candidate in potential_emails:
-                for pattern in email_patterns:
-                    matches = re.findall(pattern, candidate)
-                    for email in matches:
-                        if 'prtimes' not in email.lower():
-                            info['メールアドレス'] = email
-                            logger.debug(f"メールアドレスを抽出（構造）: {info['メールアドレス']}")
-                            break
-                    if info['メールアドレス']:
-                        break
-                if info['メールアドレス']:
-                    break
-            
-            # 見つからなければキーワード周辺を検索
-            if not info['メールアドレス']:
-                email_contexts = re.findall(
-                    r'(?:メール|Mail|Email|E-mail|e-mail|連絡先)[^。\n]{0,50}',
-                    decoded_text,
-                    re.IGNORECASE
+                context.load_cert_chain(cert)
+        return context
+    
+    def _client(self, verify, cert, proxy: Optional[str]):
+        key = (verify, tuple(cert) if isinstance(cert, list) else cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                # プロキシ・CAバンドルの環境変数はrequests側で解決済みのため、httpxでは参照しない
+                client = self._clients[key] = self._httpx.Client(
+                    http2=True, follow_redirects=False, trust_env=False,
+                    verify=self._ssl_context(verify, cert), proxy=proxy,
+                    limits=self._httpx.Limits(max_connections=self._pool_maxsize,
+                                              max_keepalive_connections=self._pool_maxsize),
                 )
-                for context in email_contexts:
-                    for pattern in email_patterns:
-                        matches = re.findall(pattern, context)
-                        for email in matches:
-                            if 'prtimes' not in email.lower():
-                                info['メールアドレス'] = email
-                                logger.debug(f"メールアドレスを抽出（コンテキスト）: {info['メールアドレス']}")
-                                break
-                        if info['メールアドレス']:
-                            break
-                    if info['メールアドレス']:
-                        break
-            
-            # それでも見つからなければ全文検索
-            if not info['メールアドレス']:
-                for pattern in email_patterns:
-                    matches = re.findall(pattern, decoded_text)
-                    for email in matches:
-                        if 'prtimes' not in email.lower():
-                            info['メールアドレス'] = email
-                            logger.debug(f"メールアドレスを抽出（全文）: {info['メールアドレス']}")
-                            break
-                    if info['メールアドレス']:
-                        break
-            
-            # 電話番号の抽出（改良版）
-            # HTMLのテーブルやリストから構造的に抽出を試みる
-            potential_phones = []
-            
-            # 電話番号のキーワードパターン
-            phone_keywords = [
-                r'TEL', r'Tel', r'tel', r'ＴＥＬ', r'Ｔｅｌ',
-                r'電話', r'℡', r'☎', r'Phone', r'phone',
-                r'電話番号', r'お電話', r'連絡先.*電話',
-                r'T[:：]', r'Ｔ[:：]'
-            ]
-            
-            # テーブル形式の情報を探す
-            for table in soup.find_all('table'):
-                rows = table.find_all('tr')
-                for row in rows:
-                    cells = row.find_all(['td', 'th'])
-                    for i in range(len(cells) - 1):
-                        cell_text = self.normalize_text(cells[i].get_text())
-                        if any(re.search(keyword, cell_text, re.IGNORECASE) for keyword in phone_keywords):
-                            next_cell_text = self.normalize_text(cells[i + 1].get_text())
-                            potential_phones.append(next_cell_text)
-            
-            # リスト形式の情報を探す
-            for li in soup.find_all('li'):
-                li_text = self.normalize_text(li.get_text())
-                if any(re.search(keyword, li_text, re.IGNORECASE) for keyword in phone_keywords):
-                    potential_phones.append(li_text)
-            
-            # strongタグの後の電話番号を探す
-            for strong in soup.find_all(['strong', 'b']):
-                strong_text = self.normalize_text(strong.get_text())
-                if any(re.search(keyword, strong_text, re.IGNORECASE) for keyword in phone_keywords):
-                    next_text = strong.next_sibling
-                    if next_text:
-                        potential_phones.append(str(next_text).strip())
-            
-            # 電話番号の正規表現パターン
-            phone_patterns = [
-                # キーワード付きパターン
-                r'(?:TEL|Tel|tel|電話|℡|ＴＥＬ)[:：\s]*([0-9０-９\-－\(\)\s（）]{10,20})',
-                r'(?:T[:：]\s*)([0-9０-９\-－\(\)\s（）]{10,20})',
-                r'(?:電話番号[:：]\s*)([0-9０-９\-－\(\)\s（）]{10,20})',
-                # 標準的な日本の電話番号
-                r'(0\d{1,4}[-－]\d{1,4}[-－]\d{3,4})',
-                r'(０[\d０-９]{1,4}[－-][\d０-９]{1,4}[－-][\d０-９]{3,4})',
-                # 括弧付き
-                r'(\(0\d{1,4}\)\s*\d{1,4}[-－]?\d{3,4})',
-                r'(（0[\d０-９]{1,4}）\s*[\d０-９]{1,4}[－-]?[\d０-９]{3,4})',
-                # ハイフンなし
-                r'(0\d{9,10})',
-                r'(０[\d０-９]{9,10})',
-                # 国際電話番号
-                r'(\+81[-\s]?\d{1,4}[-\s]?\d{1,4}[-\s]?\d{3,4})',
-            ]
-            
-            # 構造から抽出した候補を優先的にチェック
-            for candidate in potential_phones:
-                for pattern in phone_patterns:
-                    matches = re.findall(pattern, candidate)
-                    for phone in matches:
-                        normalized = self.normalize_phone(phone)
-                        if len(normalized.replace('-', '')) >= 10 and normalized[0] in '0+':
-                            info['電話番号'] = normalized
-                            logger.debug(f"電話番号を抽出（構造）: {info['電話番号']}")
-                            break
-                    if info['電話番号']:
-                        break
-                if info['電話番号']:
-                    break
-            
-            # 見つからなければキーワード周辺を検索
-            if not info['電話番号']:
-                for pattern in phone_patterns[:3]:  # キーワード付きパターンのみ
-                    matches = re.findall(pattern, text)
-                    for phone in matches:
-                        normalized = self.normalize_phone(phone)
-                        if len(normalized.replace('-', '')) >= 10 and normalized[0] in '0+':
-                            info['電話番号'] = normalized
-                            logger.debug(f"電話番号を抽出（キーワード）: {info['電話番号']}")
+            return client
+    
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if isinstance(timeout, tuple):
+            connect_timeout, read_timeout = timeout
+            timeout = self._httpx.Timeout(read_timeout, connect=connect_timeout)
+        proxy = requests.utils.select_proxy(request.url, proxies)
+        client = self._client(verify, cert, proxy)
+        # HTTP/2では接続単位のヘッダーは送信できない
+        headers = {k: v for k, v in request.headers.items() if k.lower() not in self.HOP_BY_HOP_HEADERS}
+        started = time.perf_counter()
+        try:
+            result = client.send(client.build_request(request.method, request.url, headers=headers,
+                                                      content=request.body, timeout=timeout), stream=True)
+            elapsed = timedelta(seconds=time.perf_counter() - started)
+            if not stream:
+                result.read()
+        except self._httpx.ConnectTimeout as e:
+            raise requests.exceptions.ConnectTimeout(e, request=request)
+        except self._httpx.TimeoutException as e:
+            raise requests.exceptions.ReadTimeout(e, request=request)
+        except self._httpx.ProxyError as e:
+            raise requests.exceptions.ProxyError(e, request=request)
+        except self._httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request)
+        
+        response = requests.Response()
+        response.status_code = result.status_code
+        response.reason = result.reason_phrase
+        response.url = request.url
+        response.request = request
+        # httpxで展開した本文を渡す（Content-Encodingの二重展開を避けるため削除）
+        response.headers = requests.structures.CaseInsensitiveDict(
+            (k, v) for k, v in result.headers.multi_items() if k.lower() != 'content-encoding'
+        )
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.elapsed = elapsed  # requestsと同じくヘッダー受信までの時間
+        response.http_version = result.http_version
+        message = http.client.HTTPMessage()
+        for name, value in result.headers.multi_items():
+            message[name] = value
+        response.raw = _Http2StreamBody(result, self._httpx, message)
+        if not stream:
+            response._content = result.content
+            response._content_consumed = True
+        return response
+    
+    def close(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+class TransportStats:
+    """
+    リクエストごとのレイテンシと接続の再利用状況を集計（全スレッド共通）
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.http_versions: Dict[str, int] = {}
+    
+    def record(self, response: requests.Response):
+        """レスポンスヘッダー受信までの時間とHTTPバージョンを記録"""
+        latency = response.elapsed.total_seconds()
+        version = getattr(response, 'http_version', None)
+        if version is None:
+            raw_version = getattr(response.raw, 'version', None)
+            version = {10: 'HTTP/1.0', 11: 'HTTP/1.1', 20: 'HTTP/2'}.get(raw_version, 'HTTP/1.1')
+        with self._lock:
+            self.requests += 1
+            self.total_latency += latency
+            self.max_latency = max(self.max_latency, latency)
+            self.http_versions[version] = self.http_versions.get(version, 0) + 1
+    
+    @staticmethod
+    def pool_connections(session: requests.Session) -> Optional[tuple]:
+        """
+        urllib3の接続プールで (新規接続数, リクエスト数) を集計
+        
+        Returns:
+            Optional[tuple]: 集計できない（HTTP/2アダプター等の）場合None
+        """
+        connections = requests_sent = 0
+        found = False
+        for adapter in session.adapters.values():
+            manager = getattr(adapter, 'poolmanager', None)
+            if manager is None:
+                continue
+            for key in list(manager.pools.keys()):
+                pool = manager.pools.get(key)
+                if pool is None:
+                    continue
+                found = True
+                connections += pool.num_connections
+                requests_sent += pool.num_requests
+        return (connections, requests_sent) if found else None
+    
+    def summary(self, session: requests.Session) -> str:
+        """ログ出力用の集計結果"""
+        with self._lock:
+            if not self.requests:
+                return "リクエストなし"
+            text = (f"リクエスト {self.requests}件 / 平均レイテンシ {self.total_latency / self.requests * 1000:.0f}ms"
+                    f" / 最大 {self.max_latency * 1000:.0f}ms / "
+                    + ', '.join(f"{v}: {n}件" for v, n in sorted(self.http_versions.items())))
+        pool = self.pool_connections(session)
+        if pool and pool[1]:
+            connections, requests_sent = pool
+            text += f" / 新規接続 {connections}件（再利用率 {max(0.0, 1 - connections / requests_sent):.0%}）"
+        return text
+
+
+class ResponseCache:
+    """
+    記事ページのHTMLをURLごとに保存するディスクキャッシュ（SQLite + zlib圧縮）
+    
+    プレスリリース本文は公開後に変わらないため、再実行やパーサー調整時の
+    再ダウンロードを省く。TTLと合計サイズの上限で古いエントリを削除する。
+    ETag・Last-Modifiedも保存し、再取得時は条件付きリクエストで変更の有無だけを確認する。
+    """
+    
+    def __init__(self, cache_dir: str, ttl_days: Optional[float] = 90, max_size_mb: Optional[float] = 1024):
+        """
+        Args:
+            cache_dir: キャッシュを保存するディレクトリ
+            ttl_days: エントリの有効日数（Noneで無期限）
+            max_size_mb: 圧縮後の合計サイズの上限MB（Noneで無制限）
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, 'responses.sqlite3')
+        self.ttl = ttl_days * 86400 if ttl_days else None
+        self.max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS responses ('
+            ' key TEXT PRIMARY KEY,'
+            ' url TEXT NOT NULL,'
+            ' body BLOB NOT NULL,'
+            ' size INTEGER NOT NULL,'
+            ' fetched_at REAL NOT NULL,'
+            ' accessed_at REAL NOT NULL)'
+        )
+        # 条件付きリクエスト用の列（この列がない以前のキャッシュには追加する）
+        columns = {row[1] for row in self._conn.execute('PRAGMA table_info(responses)')}
+        for column in ('etag', 'last_modified'):
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE responses ADD COLUMN {column} TEXT')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)')
+        self._conn.commit()
+        self.evict()
+    
+    @staticmethod
+    def _key(url: str) -> str:
+        """URLからキャッシュキーを生成"""
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+    
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        キャッシュからレスポンス本文を取得
+        
+        Returns:
+            Optional[bytes]: キャッシュ済みの本文（未登録または期限切れの場合None）
+        """
+        key = self._key(url)
+        with self._lock:
+            row = self._conn.execute('SELECT body, fetched_at FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            body, fetched_at = row
+            if self.ttl and time.time() - fetched_at > self.ttl:
+                self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+        return zlib.decompress(body)
+    
+    def put(self, url: str, content: bytes, etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """
+        レスポンス本文を圧縮してキャッシュに保存
+        
+        Args:
+            url: 記事のURL
+            content: レスポンス本文
+            etag: レスポンスのETagヘッダー
+            last_modified: レスポンスのLast-Modifiedヘッダー
+        """
+        body = zlib.compress(content, 6)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, url, body, size, fetched_at, accessed_at, etag, last_modified)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._key(url), url, body, len(body), now, now, etag, last_modified)
+            )
+            self._conn.commit()
+    
+    def validators(self, url: str) -> Dict[str, str]:
+        """
+        保存済みのエントリを条件付きで再取得するためのリクエストヘッダー
+        
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since（未登録・検証子なしの場合は空）
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT etag, last_modified FROM responses WHERE key = ?',
+                                     (self._key(url),)).fetchone()
+        headers = {}
+        if row and row[0]:
+            headers['If-None-Match'] = row[0]
+        if row and row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+    
+    def revalidate(self, url: str) -> Optional[bytes]:
+        """
+        304 Not Modifiedを受けたエントリの取得日時を更新し、保存済みの本文を返す
+        
+        Returns:
+            Optional[bytes]: キャッシュ済みの本文（エントリが削除されていた場合None）
+        """
+        key = self._key(url)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT body FROM responses WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?', (now, now, key))
+            self._conn.commit()
+        return zlib.decompress(row[0])
+    
+    def evict(self):
+        """期限切れのエントリと、サイズ上限を超えた分の古いエントリを削除"""
+        with self._lock:
+            if self.ttl:
+                self._conn.execute('DELETE FROM responses WHERE fetched_at < ?', (time.time() - self.ttl,))
+            if self.max_bytes:
+                total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+                if total > self.max_bytes:
+                    removed = 0
+                    for key, size in self._conn.execute('SELECT key, size FROM responses ORDER BY accessed_at').fetchall():
+                        if total - removed <= self.max_bytes:
                             break
-                    if info['電話番号']:
-                        break
-            
-            # それでも見つからなければ全文検索（ただし慎重に）
-            if not info['電話番号']:
-                # 問い合わせセクション内のみ検索
-                contact_section = re.search(
-                    r'(?:問い?合わ?せ|連絡先|Contact|広報)[^。]*?([0-9０-９\-－\(\)\s（）]{10,20})',
-                    text,
-                    re.IGNORECASE | re.DOTALL
-                )
-                if contact_section:
-                    phone_text = contact_section.group(1)
-                    normalized = self.normalize_phone(phone_text)
-                    if len(normalized.replace('-', '')) >= 10 and normalized[0] in '0+':
-                        info['電話番号'] = normalized
-                        logger.debug(f"電話番号を抽出（問い合わせセクション）: {info['電話番号']}")
-            
-            # 抽出結果が不十分な場合の追加処理
-            if not info['メールアドレス'] and not info['電話番号'] and not info['担当者名']:
-                logger.debug("セクション抽出で結果が得られなかったため、全文検索を実行")
-                full_text = soup.get_text(separator=' ', strip=True)
-                
-                # 全文からメールアドレスを再検索
-                if not info['メールアドレス']:
-                    email_match = re.search(r'([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})', full_text)
-                    if email_match:
-                        email = email_match.group(1)
-                        if 'prtimes' not in email.lower():
-                            info['メールアドレス'] = email
-                            logger.debug(f"全文検索でメールアドレスを抽出: {info['メールアドレス']}")
-                
-                # 全文から電話番号を再検索
-                if not info['電話番号']:
-                    phone_match = re.search(r'(?:TEL|Tel|tel|電話)[:：\s]*([0-9０-９\-－\(\)\s]{10,20})', full_text)
-                    if phone_match:
-                        phone = phone_match.group(1)
-                        phone_clean = phone.translate(str.maketrans('０１２３４５６７８９－（）　', '0123456789-() '))
-                        phone_clean = re.sub(r'[\s\(\)]', '', phone_clean)
-                        if len(phone_clean) >= 10:
-                            info['電話番号'] = phone_clean
-                            logger.debug(f"全文検索で電話番号を抽出: {info['電話番号']}")
-            
-            # 抽出結果のサマリー
-            extraction_summary = {
-                '会社名': bool(info['会社名']),
-                '担当者名': bool(info['担当者名']),
-                'メールアドレス': bool(info['メールアドレス']),
-                '電話番号': bool(info['電話番号'])
-            }
-            logger.debug(f"抽出結果サマリー: {extraction_summary}")
-            
-            if not any(extraction_summary.values()):
-                logger.warning(f"連絡先情報が一切抽出できませんでした: {article_url}")
+                        self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+                        removed += size
+                    logger.info(f"キャッシュ容量超過のため {removed / 1024 / 1024:.1f}MB を削除しました")
+            self._conn.commit()
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class ArticleIndex:
+    """
+    実行全体で記事URLと、その記事がヒットした検索キーワードを管理するインデックス
+    
+    同じ記事が複数のキーワードにヒットしても取得・解析は1回だけにし、
+    全てのキーワードを結果に紐付ける。
+    """
+    
+    KEYWORD_SEPARATOR = ', '
+    
+    def __init__(self):
+        self._keywords: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+    
+    def add(self, url: str, keyword: str) -> bool:
+        """
+        記事URLとキーワードの組を登録
+        
+        Returns:
+            bool: 実行中に初めて見つかったURLの場合True
+        """
+        with self._lock:
+            keywords = self._keywords.get(url)
+            if keywords is None:
+                self._keywords[url] = [keyword]
+                return True
+            if keyword not in keywords:
+                keywords.append(keyword)
+            return False
+    
+    def __contains__(self, url: str) -> bool:
+        return url in self._keywords
+    
+    def __len__(self) -> int:
+        return len(self._keywords)
+    
+    def keywords(self, url: str) -> List[str]:
+        """記事がヒットした検索キーワードの一覧（ヒット順）"""
+        return list(self._keywords.get(url, []))
+    
+    def keyword_label(self, url: str) -> str:
+        """結果の「検索キーワード」列に出力する文字列"""
+        return self.KEYWORD_SEPARATOR.join(self._keywords.get(url, []))
+
+
+class CheckpointStore:
+    """
+    抽出済みの記事情報を1件ごとに保存するチェックポイント（SQLite）
+    
+    途中で異常終了しても --resume で取得済みの記事をスキップでき、
+    --since-last-run では前回までに見た記事以降の差分だけを取得する。
+    """
+    
+    def __init__(self, path: str = 'prtimes_checkpoint.sqlite3'):
+        """
+        Args:
+            path: チェックポイントのSQLiteファイルのパス
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS articles ('
+            ' url TEXT PRIMARY KEY,'
+            ' info TEXT NOT NULL,'
+            ' run_id TEXT NOT NULL,'
+            ' extracted_at REAL NOT NULL)'
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS runs ('
+            ' run_id TEXT PRIMARY KEY,'
+            ' started_at REAL NOT NULL,'
+            ' finished_at REAL)'
+        )
+        self._conn.commit()
+        self.run_id = None
+    
+    def start_run(self) -> str:
+        """実行の開始を記録し、実行IDを返す"""
+        self.run_id = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        with self._lock:
+            self._conn.execute('INSERT INTO runs (run_id, started_at) VALUES (?, ?)', (self.run_id, time.time()))
+            self._conn.commit()
+        return self.run_id
+    
+    def finish_run(self):
+        """実行の正常終了を記録"""
+        with self._lock:
+            self._conn.execute('UPDATE runs SET finished_at = ? WHERE run_id = ?', (time.time(), self.run_id))
+            self._conn.commit()
+    
+    def last_finished_run(self) -> Optional[datetime]:
+        """前回正常終了した実行の終了日時"""
+        with self._lock:
+            row = self._conn.execute('SELECT MAX(finished_at) FROM runs').fetchone()
+        return datetime.fromtimestamp(row[0]) if row and row[0] else None
+    
+    def record(self, info: Dict[str, str]):
+        """抽出した記事情報をすぐにディスクへ保存"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO articles (url, info, run_id, extracted_at) VALUES (?, ?, ?, ?)',
+                (info['記事URL'], json.dumps(info, ensure_ascii=False), self.run_id or '', time.time())
+            )
+            self._conn.commit()
+    
+    def interrupted_run(self) -> Optional[str]:
+        """直前の実行が正常終了していない（異常終了した）場合、その実行ID"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT run_id, finished_at FROM runs WHERE run_id != ? ORDER BY started_at DESC LIMIT 1',
+                (self.run_id or '',)
+            ).fetchone()
+        return row[0] if row and row[1] is None else None
+    
+    def get(self, url: str, run_id: Optional[str] = None) -> Optional[Dict[str, str]]:
+        """
+        保存済みの記事情報（未保存の場合None）
+        
+        Args:
+            url: 記事URL
+            run_id: 指定した場合、その実行で保存された記事だけを返す
+        """
+        with self._lock:
+            if run_id is None:
+                row = self._conn.execute('SELECT info FROM articles WHERE url = ?', (url,)).fetchone()
+            else:
+                row = self._conn.execute('SELECT info FROM articles WHERE url = ? AND run_id = ?',
+                                         (url, run_id)).fetchone()
+        return json.loads(row[0]) if row else None
+    
+    def previous_urls(self) -> set:
+        """
+        この実行より前に保存された記事URLの集合
+        
+        検索と抽出が並行して進むため、実行中に保存された記事で
+        別キーワードの検索が打ち切られないよう、開始時点の集合で判定する。
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT url FROM articles WHERE run_id != ?', (self.run_id or '',)).fetchall()
+        return {row[0] for row in rows}
+    
+    def __contains__(self, url: str) -> bool:
+        with self._lock:
+            return self._conn.execute('SELECT 1 FROM articles WHERE url = ?', (url,)).fetchone() is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM articles').fetchone()[0]
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class SQLiteWorkQueue:
+    """
+    1台のホスト上の複数プロセスで1回のクロールを分担するための作業キュー（SQLiteファイル）
+    
+    検索側（コーディネーター）が記事URLを登録し、ワーカーが一定時間の期限付きで借り受けて抽出する。
+    期限内に完了しなかった記事は別のワーカーに再配布され、結果は記事URLごとに最初の1件だけを保存する。
+    WALモードを使うためネットワークファイルシステム上には置けない。複数ノードで分担する場合はRedisWorkQueueを使う。
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: キューのSQLiteファイルのパス
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS tasks ('
+            ' seq INTEGER PRIMARY KEY,'  # 登録順
+            ' url TEXT NOT NULL UNIQUE,'
+            ' state TEXT NOT NULL,'  # pending / leased / done
+            ' worker TEXT,'
+            ' lease_expires REAL,'
+            ' attempts INTEGER NOT NULL DEFAULT 0)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks (state, seq)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS task_keywords (url TEXT NOT NULL, keyword TEXT NOT NULL,'
+                           ' PRIMARY KEY (url, keyword))')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS results (url TEXT PRIMARY KEY, info TEXT NOT NULL,'
+                           ' worker TEXT, completed_at REAL NOT NULL)')
+        self._conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+    
+    def _transaction(self, func: Callable[[sqlite3.Connection], object]):
+        """書き込みロックを取得したトランザクション内で実行（他のノードとの競合を防ぐ）"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                result = func(self._conn)
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+            return result
+    
+    def clear(self):
+        """全ての記事・結果を削除（新しいクロールを始める場合）"""
+        def clear(conn):
+            for table in ('tasks', 'task_keywords', 'results', 'meta'):
+                conn.execute(f'DELETE FROM {table}')
+        self._transaction(clear)
+    
+    def push(self, url: str, keyword: str) -> bool:
+        """
+        記事URLを登録（登録済みの場合はキーワードだけを追加）
+        
+        Returns:
+            bool: 新しく登録した場合True
+        """
+        def push(conn):
+            conn.execute('INSERT OR IGNORE INTO task_keywords (url, keyword) VALUES (?, ?)', (url, keyword))
+            return conn.execute("INSERT OR IGNORE INTO tasks (url, state) VALUES (?, 'pending')", (url,)).rowcount == 1
+        return self._transaction(push)
+    
+    def lease(self, worker: str, lease_seconds: float = 300) -> Optional[tuple]:
+        """
+        未処理（または期限切れ）の記事を1件借り受ける
+        
+        Returns:
+            Optional[tuple]: (記事URL, 検索キーワード)（処理できる記事がない場合None）
+        """
+        def lease(conn):
+            now = time.time()
+            row = conn.execute(
+                "SELECT url FROM tasks WHERE state = 'pending' OR (state = 'leased' AND lease_expires < ?)"
+                ' ORDER BY seq LIMIT 1', (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE tasks SET state = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1"
+                         ' WHERE url = ?', (worker, now + lease_seconds, row[0]))
+            keyword = conn.execute('SELECT keyword FROM task_keywords WHERE url = ? ORDER BY rowid LIMIT 1',
+                                   (row[0],)).fetchone()
+            return row[0], keyword[0] if keyword else ''
+        return self._transaction(lease)
+    
+    def complete(self, url: str, info: Dict[str, str], worker: str = '') -> bool:
+        """
+        抽出結果を保存して記事を完了にする（記事URLごとに最初の1回だけ保存）
+        
+        Returns:
+            bool: 結果を保存した場合True（他のワーカーが先に完了していた場合False）
+        """
+        def complete(conn):
+            if conn.execute("UPDATE tasks SET state = 'done', lease_expires = NULL WHERE url = ? AND state != 'done'",
+                            (url,)).rowcount != 1:
+                return False
+            conn.execute('INSERT INTO results (url, info, worker, completed_at) VALUES (?, ?, ?, ?)',
+                         (url, json.dumps(info, ensure_ascii=False), worker, time.time()))
+            return True
+        return self._transaction(complete)
+    
+    def set_search_done(self, done: bool = True):
+        """検索（記事URLの登録）が終わったことを記録"""
+        self._transaction(lambda conn: conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('search_done', ?)", ('1' if done else '0',)))
+    
+    def counts(self) -> Dict[str, int]:
+        """状態ごとの記事数（pending / leased / done）"""
+        with self._lock:
+            rows = self._conn.execute('SELECT state, COUNT(*) FROM tasks GROUP BY state').fetchall()
+        counts = {'pending': 0, 'leased': 0, 'done': 0}
+        counts.update(dict(rows))
+        return counts
+    
+    def finished(self) -> bool:
+        """検索が終わり、全ての記事が完了したか"""
+        with self._lock:
+            done = self._conn.execute("SELECT value FROM meta WHERE key = 'search_done'").fetchone()
+            remaining = self._conn.execute("SELECT 1 FROM tasks WHERE state != 'done' LIMIT 1").fetchone()
+        return bool(done and done[0] == '1') and remaining is None
+    
+    def iter_results(self) -> Iterator[tuple]:
+        """
+        Yields:
+            tuple: (抽出結果, ヒットしたキーワードのリスト)（登録順）
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT r.url, r.info FROM results r JOIN tasks t ON t.url = r.url ORDER BY t.seq').fetchall()
+            keywords: Dict[str, List[str]] = {}
+            for url, keyword in self._conn.execute('SELECT url, keyword FROM task_keywords ORDER BY rowid'):
+                keywords.setdefault(url, []).append(keyword)
+        for url, info in rows:
+            yield json.loads(info), keywords.get(url, [])
+    
+    def close(self):
+        """データベース接続を閉じる"""
+        with self._lock:
+            self._conn.close()
+
+
+class RedisWorkQueue:
+    """
+    Redis（互換サーバー）を使う作業キュー（SQLiteWorkQueueと同じ操作）
+    
+    登録・貸し出し・完了はそれぞれWATCH/MULTIのトランザクションで実行するため、途中で接続が切れても
+    記事が未処理・貸し出し中のどちらからも消えることはなく、同じ記事の結果は最初の1件だけが残る。
+    redisパッケージは任意の依存（pip install redis）。検証にはfakeredis等の互換クライアントを渡せる。
+    """
+    
+    def __init__(self, client, prefix: str = 'prtimes'):
+        """
+        Args:
+            client: redis.Redis互換のクライアント（decode_responses=Trueで作成したもの）
+            prefix: キーの接頭辞（クロールごとに分ける場合に変える）
+        """
+        self.client = client
+        self.prefix = prefix
+    
+    @classmethod
+    def from_url(cls, url: str, prefix: str = 'prtimes') -> 'RedisWorkQueue':
+        """redis://host:port/db 形式のURLから作成"""
+        import redis
+        return cls(redis.Redis.from_url(url, decode_responses=True), prefix)
+    
+    def _key(self, name: str) -> str:
+        return f'{self.prefix}:{name}'
+    
+    def clear(self):
+        """全ての記事・結果を削除（新しいクロールを始める場合）"""
+        keys = list(self.client.scan_iter(match=self._key('*')))
+        if keys:
+            self.client.delete(*keys)
+    
+    def push(self, url: str, keyword: str) -> bool:
+        """記事URLを登録（登録済みの場合はキーワードだけを追加）"""
+        known, keyword_set = self._key('known'), self._key(f'keyword_set:{url}')
+        
+        def push(pipe) -> bool:
+            is_new = not pipe.sismember(known, url)
+            new_keyword = not pipe.sismember(keyword_set, keyword)
+            pipe.multi()
+            if new_keyword:
+                pipe.sadd(keyword_set, keyword)
+                pipe.rpush(self._key(f'keywords:{url}'), keyword)
+            if is_new:
+                pipe.sadd(known, url)
+                pipe.rpush(self._key('pending'), url)
+            return is_new
+        return self.client.transaction(push, known, keyword_set, value_from_callable=True)
+    
+    def _requeue_expired(self):
+        """期限切れの貸し出しを未処理に戻す"""
+        leases, results = self._key('leases'), self._key('results')
+        for url in self.client.zrangebyscore(leases, '-inf', time.time()):
+            def requeue(pipe):
+                expires = pipe.zscore(leases, url)
+                if expires is None or expires > time.time():
+                    return  # 他のノードが戻した、または再度貸し出された記事
+                done = pipe.hexists(results, url)
+                pipe.multi()
+                pipe.zrem(leases, url)
+                if not done:
+                    pipe.lpush(self._key('pending'), url)
+            self.client.transaction(requeue, leases, results)
+    
+    def lease(self, worker: str, lease_seconds: float = 300) -> Optional[tuple]:
+        """未処理（または期限切れ）の記事を1件借り受ける"""
+        self._requeue_expired()
+        pending, results = self._key('pending'), self._key('results')
+        
+        def lease(pipe) -> Optional[tuple]:
+            url = pipe.lindex(pending, 0)
+            if url is None:
+                return None
+            done = pipe.hexists(results, url)
+            pipe.multi()
+            pipe.lpop(pending)
+            if not done:
+                pipe.zadd(self._key('leases'), {url: time.time() + lease_seconds})
+            return url, done
+        
+        while True:
+            leased = self.client.transaction(lease, pending, results, value_from_callable=True)
+            if leased is None:
+                return None
+            url, done = leased
+            if done:
+                continue  # 再配布後に元のワーカーが完了させた記事
+            keyword = self.client.lindex(self._key(f'keywords:{url}'), 0)
+            return url, keyword or ''
+    
+    def complete(self, url: str, info: Dict[str, str], worker: str = '') -> bool:
+        """抽出結果を保存して記事を完了にする（記事URLごとに最初の1回だけ保存）"""
+        results = self._key('results')
+        
+        def complete(pipe) -> bool:
+            if pipe.hexists(results, url):
+                return False
+            pipe.multi()
+            pipe.hset(results, url, json.dumps(info, ensure_ascii=False))
+            pipe.zrem(self._key('leases'), url)
+            pipe.rpush(self._key('done'), url)
+            return True
+        return self.client.transaction(complete, results, value_from_callable=True)
+    
+    def set_search_done(self, done: bool = True):
+        """検索（記事URLの登録）が終わったことを記録"""
+        self.client.set(self._key('search_done'), '1' if done else '0')
+    
+    def counts(self) -> Dict[str, int]:
+        """状態ごとの記事数（pending / leased / done）"""
+        done = self.client.hlen(self._key('results'))
+        return {'pending': self.client.llen(self._key('pending')),
+                'leased': self.client.zcard(self._key('leases')),
+                'done': done}
+    
+    def finished(self) -> bool:
+        """検索が終わり、全ての記事が完了したか"""
+        return (self.client.get(self._key('search_done')) == '1'
+                and self.client.hlen(self._key('results')) >= self.client.scard(self._key('known')))
+    
+    def iter_results(self) -> Iterator[tuple]:
+        """
+        Yields:
+            tuple: (抽出結果, ヒットしたキーワードのリスト)（完了順）
+        """
+        for url in self.client.lrange(self._key('done'), 0, -1):
+            info = self.client.hget(self._key('results'), url)
+            if info is not None:
+                yield json.loads(info), self.client.lrange(self._key(f'keywords:{url}'), 0, -1)
+    
+    def close(self):
+        """接続を閉じる"""
+        self.client.close()
+
+
+def open_work_queue(spec: str):
+    """
+    作業キューを開く
+    
+    Args:
+        spec: 'redis://host:port/db'（Redis）、それ以外はSQLiteファイルのパス（'sqlite:///path' も可）
+    """
+    if spec.startswith(('redis://', 'rediss://', 'unix://')):
+        return RedisWorkQueue.from_url(spec)
+    if spec.startswith('sqlite:///'):
+        spec = spec[len('sqlite:///'):]
+    return SQLiteWorkQueue(spec)
+
+
+# 高速抽出（lxmlで問い合わせ先ブロックのみを処理）で使う要素の名前・XPath
+_LXML_SKIP_TAGS = frozenset(['script', 'style', 'template'])
+_LXML_SECTION_TAGS = frozenset(['div', 'section', 'p', 'td'])
+_LXML_EXCLUDE_TAGS = frozenset(['header', 'footer', 'nav'])
+
+
+def _class_xpath(class_name: str) -> str:
+    """class属性に指定のクラスを含む要素を表すXPathの条件"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+
+# 記事本文エリアの候補（_find_contact_sectionのcontent_selectorsと同じ順）
+_LXML_CONTENT_XPATHS = ['//main', '//article'] + [
+    f'//*[{_class_xpath(name)}]'
+    for name in ['content', 'main-content', 'article-content', 'release-content', 'press-release']
+]
+
+
+def _lxml_text(element, separator: str = '', strip: bool = False) -> str:
+    """
+    lxml要素のテキスト（BeautifulSoupのget_textと同じく、script・style・コメントは含めない）
+    """
+    parts = []
+    
+    def walk(node):
+        if node.tag in _LXML_SKIP_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+    
+    if isinstance(element.tag, str):
+        walk(element)
+    if strip:
+        parts = [part.strip() for part in parts]
+        parts = [part for part in parts if part]
+    return separator.join(parts)
+
+
+class _ContactSectionDetector:
+    """
+    受信途中の記事HTMLを逐次解析し、問い合わせ先を含む本文エリアを受信し終えたかを判定
+    
+    本文エリア（最も外側のmain/article）が閉じた時点で、その中に問い合わせ先キーワードと
+    メールアドレスまたは電話番号の手がかりがあれば、以降（フッター等）は抽出に使わないため
+    受信を打ち切ってよいと判断する。
+    """
+    
+    def __init__(self):
+        self._parser = lxml.etree.HTMLPullParser(events=('end',), tag=('main', 'article'), encoding='utf-8')
+    
+    def feed(self, chunk: bytes) -> bool:
+        """
+        受信したチャンクを解析
+        
+        Returns:
+            bool: 問い合わせ先を含む本文エリアを受信し終えた場合True
+        """
+        self._parser.feed(chunk)
+        for _, element in self._parser.read_events():
+            if next(element.iterancestors('main', 'article'), None) is not None:
+                continue  # 入れ子の要素は外側の要素が閉じるまで待つ
+            text = _lxml_text(element)
+            if _MEDIA_KEYWORD_RE.search(text) and ('@' in text or _PHONE_KEYWORD_RE.search(text)):
+                return True
+        return False
+
+
+class _DocumentIndex:
+    """
+    記事の解析に必要な要素を1回の走査でまとめて収集する索引
+    
+    テーブル行・セル、li、strong/b、問い合わせ先キーワードを含むテキストを
+    文書順に保持し、find_allによる木全体の再走査を不要にする。
+    要素のテキストも初回に取り出した値を保持し、抽出の各段階で共有する。
+    """
+    
+    def __init__(self, soup, search_area, string_filter: Callable[[str], bool],
+                 normalize: Callable[[str], str] = None):
+        """
+        Args:
+            soup: 解析済みの文書全体
+            search_area: 問い合わせ先セクションを探す範囲（本文エリア）
+            string_filter: contact_stringsに集めるテキストの条件
+            normalize: normalized_textで使う正規化関数
+        """
+        self.soup = soup
+        self.normalize = normalize
+        self._texts: Dict[tuple, str] = {}  # (id(要素), 種類) → テキスト（要素はsoupが保持している間有効）
+        self.tables = []           # [(table, [(tr, [td/th, ...]), ...]), ...]（文書全体）
+        self.area_tables = []      # 本文エリア内のtable
+        self.list_items = []       # 文書全体のli
+        self.emphasis = []         # 文書全体のstrong/b
+        self.contact_strings = []  # 本文エリア内で条件に合うテキスト
+        
+        # (ノード, 本文エリア内か, 開いているtableの行リスト, 開いているtrのセルリスト)
+        stack = [(soup, soup is search_area, (), ())]
+        while stack:
+            node, in_area, open_tables, open_rows = stack.pop()
+            if isinstance(node, NavigableString):
+                if in_area and string_filter(node):
+                    self.contact_strings.append(node)
+                continue
+            
+            name = node.name
+            if name == 'table':
+                rows = []
+                self.tables.append((node, rows))
+                if in_area:
+                    self.area_tables.append(node)
+                open_tables = open_tables + (rows,)
+            elif name == 'tr':
+                cells = []
+                for rows in open_tables:
+                    rows.append((node, cells))
+                open_rows = open_rows + (cells,)
+            elif name == 'td' or name == 'th':
+                for cells in open_rows:
+                    cells.append(node)
+            elif name == 'li':
+                self.list_items.append(node)
+            elif name == 'strong' or name == 'b':
+                self.emphasis.append(node)
+            
+            child_in_area = in_area or node is search_area
+            stack.extend((child, child_in_area, open_tables, open_rows) for child in reversed(node.contents))
+    
+    def text(self, node, separator: str = '', strip: bool = False) -> str:
+        """要素のget_text()の結果（同じ要素・引数では1回だけ取り出す）"""
+        key = (id(node), separator, strip)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = node.get_text(separator=separator, strip=strip)
+        return text
+    
+    def normalized_text(self, node) -> str:
+        """要素のテキストを正規化した結果（同じ要素では1回だけ正規化する）"""
+        key = (id(node), None, None)
+        text = self._texts.get(key)
+        if text is None:
+            text = self._texts[key] = self.normalize(self.text(node))
+        return text
+
+
+class PRTimesCorrectedScraper:
+    def __init__(self, email: str, password: str, credentials_path: str, headless: bool = True,
+                 requests_per_second: float = 2.0, max_requests_per_second: float = None,
+                 max_retries: int = 3, cache: Optional[ResponseCache] = None, refresh_cache: bool = False,
+                 session_path: Optional[str] = None, login_mode: str = 'http', login_url: Optional[str] = None,
+                 pool_size: int = 10, connect_timeout: float = 10.0, read_timeout: float = 30.0,
+                 connection_retries: int = 2, http2: bool = False, fast_path: bool = True,
+                 stream_fetch: bool = False, max_download_kb: Optional[float] = 2048):
+        """
+        PR Timesスクレイパーの修正版
+        
+        Args:
+            email: PR Timesログイン用メールアドレス
+            password: PR Timesログイン用パスワード
+            credentials_path: Google認証用JSONファイルのパス
+            headless: ヘッドレスモードで実行するか（デフォルト: True）
+            requests_per_second: 全スレッド合計の1秒あたりの開始リクエスト数
+            max_requests_per_second: 正常応答が続いた場合に到達できるリクエスト数の上限
+            max_retries: 429/5xx応答時の最大再試行回数
+            cache: 記事HTMLのディスクキャッシュ（省略時はキャッシュしない）
+            refresh_cache: キャッシュを読まずに再取得するか（取得結果はキャッシュに保存）
+            session_path: ログインCookieとChromeDriverパスの保存先JSON（省略時は保存しない）
+            login_mode: ログイン方法（'http': フォーム送信のみ、'selenium': ブラウザ操作、
+                        'auto': フォーム送信に失敗した場合のみSeleniumを使用）
+            login_url: ログインページのURL（省略時はPR Timesのメディアユーザーログイン。
+                       ローカルの検証用サーバーを指定するとマイページの確認もそのサーバーに対して行う）
+            pool_size: ホストごとに保持するkeep-alive接続数（同時リクエスト数以上にする）
+            connect_timeout: 接続タイムアウト秒数
+            read_timeout: 応答待ちタイムアウト秒数
+            connection_retries: 接続エラー・読み取りエラー時にアダプターで再試行する回数
+            http2: HTTP/2対応のトランスポート（httpx）を使用するか
+            fast_path: 問い合わせ先ブロックだけを処理する高速抽出を先に試すか
+            stream_fetch: 記事ページを逐次受信し、問い合わせ先を含む本文エリアを受信した時点で打ち切るか
+            max_download_kb: 逐次受信時に1記事あたり受信する上限KB（Noneで無制限）
+        """
+        if login_mode not in self.LOGIN_MODES:
+            raise ValueError(f"login_modeは {', '.join(self.LOGIN_MODES)} のいずれかを指定してください: {login_mode}")
+        self.email = email
+        self.password = password
+        self.credentials_path = credentials_path
+        self.headless = headless
+        self.rate_limiter = RequestRateLimiter(requests_per_second, max_requests_per_second)
+        self.max_retries = max_retries
+        self.cache = cache
+        self.refresh_cache = refresh_cache
+        self.session = requests.Session()
+        self.timeout = (connect_timeout, read_timeout)
+        self.transport_stats = TransportStats()
+        self._mount_transport(pool_size, connection_retries, http2)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Language': 'ja,en-US;q=0.9,en;q=0.8',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Encoding': 'gzip, deflate, br',
+            'DNT': '1',
+            'Connection': 'keep-alive',
+            'Upgrade-Insecure-Requests': '1'
+        })
+        self.logged_in = False
+        self.session_path = session_path
+        self.login_mode = login_mode
+        self.login_url = login_url or self.LOGIN_URL
+        self.fast_path = fast_path
+        self.stream_fetch = stream_fetch
+        self.max_download_bytes = int(max_download_kb * 1024) if max_download_kb else None
+    
+    LOGIN_MODES = ('http', 'selenium', 'auto')
+    LOGIN_URL = 'https://prtimes.jp/main/html/medialogin'
+    
+    # 逐次受信時に1回で読み込むバイト数
+    STREAM_CHUNK_SIZE = 16 * 1024
+    
+    # ログイン状態の確認に使うマイページ（ログインURLからの相対パス、先頭から順に試す）
+    MYPAGE_PATHS = [
+        '/mypage',
+        '/main/mypage',
+        '/main/action.php?run=html&page=mypage',
+    ]
+    
+    # ログイン後のページで成功・失敗を判定する文字列（小文字で比較）
+    LOGIN_SUCCESS_INDICATORS = ['logout', 'ログアウト', 'mypage', 'マイページ', 'dashboard', 'ダッシュボード']
+    LOGIN_FAILURE_INDICATORS = ['error', 'エラー', 'invalid', '無効', 'incorrect', '間違い', 'ログインできませんでした']
+    
+    def _mount_transport(self, pool_size: int, connection_retries: int, http2: bool):
+        """
+        接続プールの大きさと再試行方針を設定したアダプターをセッションにマウント
+        
+        429/5xxの再試行はレートリミッターと連動させるため_getで行い、
+        アダプターでは接続エラー・読み取りエラーのみ再試行する。
+        """
+        if http2:
+            try:
+                adapter = Http2Adapter(pool_maxsize=pool_size)
+                self.session.mount('https://', adapter)
+                logger.info("HTTP/2対応のトランスポート（httpx）を使用します")
+                return
+            except ImportError:
+                logger.warning("httpxがインストールされていないため、HTTP/1.1で接続します（pip install 'httpx[http2]'）")
+        
+        retry = Retry(total=connection_retries, connect=connection_retries, read=connection_retries,
+                      status=0, redirect=None, backoff_factor=0.5, allowed_methods=frozenset(['GET', 'HEAD']),
+                      raise_on_status=False)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(1, pool_size),
+                                                max_retries=retry, pool_block=False)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+    
+    def _post(self, url: str, data: Dict[str, str], **kwargs) -> requests.Response:
+        """
+        レートリミッターを経由してPOSTリクエストを送信（副作用があるため再試行はしない）
+        
+        Args:
+            url: リクエスト先URL
+            data: 送信するフォームデータ
+            **kwargs: requests.Session.postに渡す追加引数
+            
+        Returns:
+            requests.Response: 受け取ったレスポンス
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        self.rate_limiter.wait()
+        response = self.session.post(url, data=data, **kwargs)
+        self.transport_stats.record(response)
+        metrics.inc('http_requests_total', method='POST', status=response.status_code)
+        metrics.inc('http_response_bytes_total', len(response.content))
+        metrics.observe('http_request_seconds', response.elapsed.total_seconds(), method='POST')
+        self.rate_limiter.record_response(response.status_code, response.headers.get('Retry-After'))
+        return response
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """
+        レートリミッターを経由してGETリクエストを送信（429/5xxは待機後に再試行）
+        
+        Args:
+            url: リクエスト先URL
+            **kwargs: requests.Session.getに渡す追加引数（stream=Trueの場合、本文の受信量は呼び出し側で記録する）
+            
+        Returns:
+            requests.Response: 最後に受け取ったレスポンス
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        stream = kwargs.get('stream', False)
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            response = self.session.get(url, **kwargs)
+            self.transport_stats.record(response)
+            metrics.inc('http_requests_total', method='GET', status=response.status_code)
+            if not stream:
+                metrics.inc('http_response_bytes_total', len(response.content))
+            metrics.observe('http_request_seconds', response.elapsed.total_seconds(), method='GET')
+            logger.debug(f"GET {response.status_code} {response.elapsed.total_seconds() * 1000:.0f}ms {url}")
+            self.rate_limiter.record_response(response.status_code, response.headers.get('Retry-After'))
+            # Retry-After: 0 の場合も再試行する（待機時間ではなくステータスコードで判定）
+            if response.status_code not in self.rate_limiter.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                return response
+            response.close()
+            attempt += 1
+            logger.info(f"再試行 {attempt}/{self.max_retries}: {url}")
+    
+    def _load_session_state(self) -> Dict:
+        """保存済みのセッション情報（Cookie・ChromeDriverパス）を読み込む"""
+        if not self.session_path or not os.path.exists(self.session_path):
+            return {}
+        try:
+            with open(self.session_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"セッションファイルを読み込めませんでした: {e}")
+            return {}
+    
+    def _save_session_state(self, **updates):
+        """セッション情報を更新して保存（Cookieを含むため所有者のみ読み書き可能にする）"""
+        if not self.session_path:
+            return
+        state = self._load_session_state()
+        state.update(updates)
+        try:
+            fd = os.open(self.session_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logger.warning(f"セッションファイルを保存できませんでした: {e}")
+    
+    def save_cookies(self, mypage_url: Optional[str] = None):
+        """
+        requests.SessionのCookieをセッションファイルに保存
+        
+        Args:
+            mypage_url: ログイン確認に成功したマイページURL（次回の確認で最初に試す）
+        """
+        cookies = [
+            {'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path,
+             'secure': c.secure, 'expires': c.expires}
+            for c in self.session.cookies
+        ]
+        self._save_session_state(email=self.email, cookies=cookies, mypage_url=mypage_url,
+                                 saved_at=datetime.now().isoformat(timespec='seconds'))
+        logger.info(f"{len(cookies)}個のCookieを保存しました: {self.session_path}")
+    
+    def restore_cookies(self) -> bool:
+        """
+        保存済みのCookieを読み込み、ログイン状態が有効か確認
+        
+        Returns:
+            bool: 保存済みCookieでログイン済みの状態を復元できた場合True
+        """
+        state = self._load_session_state()
+        if not state.get('cookies') or state.get('email') != self.email:
+            return False
+        
+        now = time.time()
+        restored = 0
+        for cookie in state['cookies']:
+            if cookie.get('expires') and cookie['expires'] < now:
+                continue
+            self.session.cookies.set(cookie['name'], cookie['value'], domain=cookie.get('domain', ''),
+                                     path=cookie.get('path', '/'), secure=cookie.get('secure', False),
+                                     expires=cookie.get('expires'))
+            restored += 1
+        if not restored:
+            logger.info("保存済みのCookieは全て期限切れです")
+            return False
+        
+        mypage_url = self.check_login(preferred_url=state.get('mypage_url'))
+        if mypage_url:
+            logger.info(f"保存済みのCookieでログイン状態を復元しました（保存日時: {state.get('saved_at')}）")
+            self.logged_in = True
+            return True
+        
+        logger.info("保存済みのCookieは無効になっていました。再ログインします")
+        self.session.cookies.clear()
+        return False
+    
+    def check_login(self, preferred_url: Optional[str] = None) -> Optional[str]:
+        """
+        マイページにアクセスしてログイン状態を確認
+        
+        Args:
+            preferred_url: 最初に試すマイページURL（前回確認に成功したURL）
+            
+        Returns:
+            Optional[str]: ログイン状態を確認できたマイページURL（確認できない場合None）
+        """
+        urls = [preferred_url] if preferred_url else []
+        mypage_urls = [urllib.parse.urljoin(self.login_url, path) for path in self.MYPAGE_PATHS]
+        urls += [url for url in mypage_urls if url != preferred_url]
+        for mypage_url in urls:
+            try:
+                response = self._get(mypage_url, timeout=10)
+                if response.status_code == 200 and 'logout' in response.text.lower():
+                    logger.info(f"ログイン確認完了: {mypage_url}")
+                    return mypage_url
+            except requests.RequestException:
+                continue
+        return None
+    
+    def _chromedriver_path(self) -> str:
+        """ChromeDriverのパス（解決済みのパスはセッションファイルに保存して再利用）"""
+        cached_path = self._load_session_state().get('chromedriver_path')
+        if cached_path and os.path.isfile(cached_path) and os.access(cached_path, os.X_OK):
+            logger.info(f"ChromeDriverパス（保存済み）: {cached_path}")
+            return cached_path
+        
+        # ChromeDriver 自動管理 - Chromium用の設定
+        from webdriver_manager.chrome import ChromeDriverManager
+        from webdriver_manager.core.os_manager import ChromeType
+        
+        # Chromium用のドライバーをインストール
+        chromedriver_path = ChromeDriverManager(chrome_type=ChromeType.CHROMIUM).install()
+        logger.info(f"ChromeDriverパス: {chromedriver_path}")
+        
+        # 正しいパスが指定されているか確認
+        if not chromedriver_path.endswith('chromedriver'):
+            # 正しいパスを構築
+            chromedriver_dir = os.path.dirname(chromedriver_path)
+            chromedriver_path = os.path.join(chromedriver_dir, 'chromedriver')
+            logger.info(f"修正されたChromeDriverパス: {chromedriver_path}")
+        
+        self._save_session_state(chromedriver_path=chromedriver_path)
+        return chromedriver_path
+    
+    def login(self, force: bool = False) -> bool:
+        """
+        PR Timesにログイン
+        
+        保存済みのCookieが有効ならそれを使い、無効・未保存の場合のみlogin_modeに応じてログインする。
+        
+        Args:
+            force: 保存済みのCookieを使わずにログインし直すか
+            
+        Returns:
+            bool: ログイン成功時True、失敗時False
+        """
+        with metrics.timer('stage_seconds', stage='login'):
+            if self.session_path and not force and self.restore_cookies():
+                return True
+            if self.login_mode == 'selenium':
+                return self.login_with_selenium()
+            if self.login_with_form():
+                return True
+            if self.login_mode == 'auto':
+                logger.info("フォーム送信でログインできなかったため、Seleniumでログインします")
+                return self.login_with_selenium()
+            return False
+    
+    def login_with_form(self) -> bool:
+        """
+        ブラウザを使わずにログインフォームをHTTPで送信してログイン
+        
+        ログインページのフォームからhidden項目（CSRFトークン等）を引き継ぎ、
+        mail/passを設定してフォームのaction先へ送信する。
+        
+        Returns:
+            bool: ログイン成功時True、失敗時False
+        """
+        try:
+            logger.info(f"ログインページを取得: {self.login_url}")
+            response = self._get(self.login_url, timeout=30)
+            if response.status_code != 200:
+                logger.error(f"ログインページの取得に失敗しました: ステータスコード {response.status_code}")
+                return False
+            
+            soup = BeautifulSoup(response.content, 'lxml')
+            form = next((f for f in soup.find_all('form') if f.find('input', attrs={'name': 'mail'})), None)
+            if form is None:
+                logger.error("ログインフォームが見つかりませんでした")
+                return False
+            
+            # hidden項目（CSRFトークン等）を含むフォームの初期値を引き継ぐ
+            data = {}
+            for field in form.find_all(['input', 'select', 'textarea']):
+                name = field.get('name')
+                field_type = (field.get('type') or '').lower()
+                if not name or field_type in ('submit', 'button', 'image', 'reset'):
+                    continue
+                if field_type in ('checkbox', 'radio') and not field.has_attr('checked'):
+                    continue
+                data[name] = field.get('value', '')
+            data['mail'] = self.email
+            data['pass'] = self.password
+            
+            # 名前付きの送信ボタンは値も送る（サーバー側で押下ボタンを判定する場合がある）
+            submit = form.find(['button', 'input'], attrs={'type': 'submit', 'name': True})
+            if submit is not None:
+                data[submit['name']] = submit.get('value', '')
+            
+            headers = {'Referer': response.url}
+            csrf_meta = soup.find('meta', attrs={'name': re.compile(r'^csrf[-_]token$', re.IGNORECASE)})
+            if csrf_meta is not None and csrf_meta.get('content'):
+                headers['X-CSRF-Token'] = csrf_meta['content']
+            
+            action_url = urllib.parse.urljoin(response.url, form.get('action') or response.url)
+            logger.info("ログインフォームを送信しました")
+            result = self._post(action_url, data, headers=headers, timeout=30)
+            page_source = result.text.lower()
+            
+            if result.status_code >= 400:
+                logger.error(f"ログインに失敗しました: ステータスコード {result.status_code}")
+                return False
+            
+            # フォームが再表示された場合は認証エラー
+            returned_to_form = result.url.split('?')[0] == action_url.split('?')[0] and 'name="pass"' in page_source
+            if returned_to_form or (not any(i in page_source for i in self.LOGIN_SUCCESS_INDICATORS)
+                                    and any(i in page_source for i in self.LOGIN_FAILURE_INDICATORS)):
+                logger.error("ログインに失敗しました（認証エラー）")
+                return False
+            
+            # ログイン確認のためマイページにアクセス
+            mypage_url = self.check_login()
+            if mypage_url is None and not any(i in page_source for i in self.LOGIN_SUCCESS_INDICATORS):
+                logger.warning("ログイン結果の判定ができませんでした")
+                return False
+            
+            logger.info(f"フォーム送信でログインに成功しました（Cookie {len(self.session.cookies)}個）")
+            self.logged_in = True
+            if self.session_path:
+                self.save_cookies(mypage_url)
+            return True
+        
+        except requests.RequestException as e:
+            logger.error(f"フォーム送信によるログイン中にエラーが発生しました: {e}")
+            return False
+    
+    def login_with_selenium(self) -> bool:
+        """
+        PR TimesにSeleniumを使ってログイン
+        
+        Returns:
+            bool: ログイン成功時True、失敗時False
+        """
+        driver = None
+        try:
+            # Chrome オプション設定
+            chrome_options = Options()
+            if self.headless:
+                chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--disable-software-rasterizer')
+            chrome_options.add_argument('--remote-debugging-port=9222')
+            chrome_options.add_argument('--window-size=1920,1080')
+            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            
+            # Chromiumのバイナリパスを明示的に指定
+            chrome_options.binary_location = '/snap/bin/chromium'
+            
+            try:
+                service = Service(self._chromedriver_path())
+            except Exception as e:
+                logger.error(f"ChromeDriverの初期化エラー: {e}")
+                raise
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver.implicitly_wait(10)
+            
+            # メディアユーザーログインURLにアクセス
+            login_url = self.login_url
+            logger.info(f"Seleniumでログインページにアクセス: {login_url}")
+            driver.get(login_url)
+            
+            # ページ読み込み待機
+            wait = WebDriverWait(driver, 20)
+            
+            # メールアドレス入力フィールドを探す
+            email_field = wait.until(
+                EC.presence_of_element_located((By.NAME, "mail"))
+            )
+            email_field.clear()
+            email_field.send_keys(self.email)
+            logger.info("メールアドレスを入力しました")
+            
+            # パスワード入力フィールドを探す
+            password_field = driver.find_element(By.NAME, "pass")
+            password_field.clear()
+            password_field.send_keys(self.password)
+            logger.info("パスワードを入力しました")
+            
+            # ログインボタンを探してクリック
+            # 複数のセレクタを試す
+            login_button = None
+            button_selectors = [
+                (By.XPATH, "//button[contains(text(), 'ログイン')]"),
+                (By.XPATH, "//input[@type='submit' and (@value='ログイン' or @value='Login')]"),
+                (By.XPATH, "//button[@type='submit']"),
+                (By.CSS_SELECTOR, "button[type='submit']"),
+                (By.CSS_SELECTOR, "input[type='submit']")
+            ]
+            
+            for selector_type, selector_value in button_selectors:
+                try:
+                    login_button = driver.find_element(selector_type, selector_value)
+                    if login_button:
+                        break
+                except:
+                    continue
+            
+            if not login_button:
+                logger.error("ログインボタンが見つかりませんでした")
+                return False
+            
+            # スクリーンショット（デバッグ用）
+            if not self.headless:
+                driver.save_screenshot("before_login.png")
+            
+            login_button.click()
+            logger.info("ログインボタンをクリックしました")
+            
+            # ログイン処理の待機（ページ遷移したら最大3秒を待たずに判定へ進む）
+            try:
+                WebDriverWait(driver, 3).until(EC.url_changes(login_url))
+            except TimeoutException:
+                pass
+            
+            # ログイン成功の確認
+            current_url = driver.current_url
+            page_source = driver.page_source.lower()
+            
+            # 成功判定
+            success_indicators = self.LOGIN_SUCCESS_INDICATORS
+            failure_indicators = self.LOGIN_FAILURE_INDICATORS
+            
+            login_success = False
+            if any(indicator in page_source for indicator in success_indicators):
+                logger.info("ログインに成功しました")
+                login_success = True
+            elif any(indicator in page_source for indicator in failure_indicators):
+                logger.error("ログインに失敗しました（認証エラー）")
+                if not self.headless:
+                    driver.save_screenshot("login_error.png")
+                return False
+            elif current_url != login_url:
+                # URLが変わっていればログイン成功の可能性が高い
+                logger.info(f"ログイン後のURL: {current_url}")
+                login_success = True
+            else:
+                logger.warning("ログイン結果の判定ができませんでした")
+                if not self.headless:
+                    driver.save_screenshot("login_unknown.png")
+            
+            if login_success:
+                # Cookieを取得してrequests.Sessionにコピー
+                logger.info("CookieをSeleniumからrequestsにコピー中...")
+                selenium_cookies = driver.get_cookies()
+                
+                for cookie in selenium_cookies:
+                    # requests用のCookie形式に変換
+                    cookie_obj = {
+                        'name': cookie['name'],
+                        'value': cookie['value'],
+                        'domain': cookie.get('domain', ''),
+                        'path': cookie.get('path', '/'),
+                        'secure': cookie.get('secure', False),
+                        'expires': cookie.get('expiry', None)
+                    }
+                    
+                    # requestsのセッションにCookieを追加
+                    self.session.cookies.set(
+                        cookie_obj['name'],
+                        cookie_obj['value'],
+                        domain=cookie_obj['domain'],
+                        path=cookie_obj['path'],
+                        secure=cookie_obj['secure']
+                    )
+                
+                logger.info(f"{len(selenium_cookies)}個のCookieをコピーしました")
+                self.logged_in = True
+                
+                # ログイン確認のためマイページにアクセス
+                mypage_url = self.check_login()
+                
+                # 次回の実行ではSeleniumを起動せずにこのCookieを再利用する
+                if self.session_path:
+                    self.save_cookies(mypage_url)
+                
+                return True
+            
+            return False
+                
+        except Exception as e:
+            logger.error(f"Seleniumログイン中にエラーが発生しました: {e}")
+            if not self.headless and driver:
+                driver.save_screenshot("login_exception.png")
+            return False
+        finally:
+            if driver:
+                driver.quit()
+                logger.info("Seleniumドライバーを終了しました")
+    
+    def search_articles(self, keyword: str, max_articles: int = 80, known_urls=None) -> List[str]:
+        """
+        キーワードで検索し、記事URLを収集（requests.Session維持）
+        
+        Args:
+            keyword: 検索キーワード
+            max_articles: 収集する最大記事数
+            known_urls: 前回までに取得済みの記事URL（in演算子で判定できるもの）。
+                指定時は取得済みの記事を除外し、それが現れたページで検索を打ち切る
+            
+        Returns:
+            List[str]: 記事URLのリスト
+        """
+        article_urls = list(self.iter_search_results(keyword, max_articles, known_urls))
+        logger.info(f"合計 {len(article_urls)} 件の記事URLを収集しました")
+        return article_urls
+    
+    def iter_search_results(self, keyword: str, max_articles: int = 80, known_urls=None,
+                            prefetch: bool = True, max_pages: int = 5) -> Iterator[str]:
+        """
+        キーワードの検索結果から記事URLを見つけ次第返す
+        
+        現在のページを解析している間に次のsearch_pageを先読みする。
+        最終ページでは先読みした1リクエストが無駄になる。
+        
+        Args:
+            keyword: 検索キーワード
+            max_articles: 収集する最大記事数
+            known_urls: 前回までに取得済みの記事URL（search_articlesと同じ）
+            prefetch: 次のページを先読みするか
+            max_pages: 検索するページ数の上限
+            
+        Yields:
+            str: 記事URL
+        """
+        seen_urls = set()
+        encoded_keyword = urllib.parse.quote(keyword)
+        
+        # セッションを維持したまま検索
+        base_url = f'https://prtimes.jp/main/action.php?run=html&page=searchkey&search_word={encoded_keyword}'
+        
+        def page_url(page: int) -> str:
+            return base_url if page == 0 else f'{base_url}&search_page={page}'
+        
+        def fetch(page: int):
+            logger.info(f"検索中: {page_url(page)}")
+            with metrics.timer('stage_seconds', stage='search_fetch'):
+                return self._get(page_url(page))  # セッション維持
+        
+        page = 0
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(fetch, page)
+            while pending is not None:
+                try:
+                    response = pending.result()
+                    pending = None
+                    
+                    if response.status_code != 200:
+                        logger.warning(f"ステータスコード {response.status_code}: {page_url(page)}")
+                        break
+                    
+                    # 解析している間に次のページを取得
+                    if prefetch and page + 1 < max_pages:
+                        pending = prefetcher.submit(fetch, page + 1)
+                    
+                    response.encoding = 'utf-8'
+                    with metrics.timer('stage_seconds', stage='search_parse'):
+                        soup = BeautifulSoup(response.text, 'lxml')
+                        links = soup.select('a[href*="/main/html/rd/p/"]')
+                    
+                    if not links:
+                        logger.info("これ以上記事が見つかりません")
+                        break
+                    
+                    reached_known = False
+                    for link in links:
+                        href = link.get('href', '')
+                        if href:
+                            if href.startswith('/'):
+                                href = f'https://prtimes.jp{href}'
+                            elif not href.startswith('http'):
+                                href = f'https://prtimes.jp/{href}'
+                            
+                            if known_urls is not None and href in known_urls:
+                                # 検索結果は新しい順のため、以降のページは取得済みの記事のみ
+                                reached_known = True
+                                continue
+                            
+                            if href not in seen_urls:
+                                seen_urls.add(href)
+                                yield href
+                                
+                                if len(seen_urls) >= max_articles:
+                                    break
+                    
+                    logger.info(f"ページ {page + 1} から {len(links)} 件の記事を発見（累計: {len(seen_urls)}件）")
+                    if reached_known:
+                        logger.info("前回までに取得済みの記事に到達したため検索を終了します")
+                        break
+                    if len(seen_urls) >= max_articles or page + 1 >= max_pages:
+                        break
+                    
+                    page += 1
+                    if pending is None:
+                        pending = prefetcher.submit(fetch, page)
+                    
+                except Exception as e:
+                    logger.error(f"検索エラー: {e}")
+                    break
+            
+            # 使われなかった先読みは、未開始であれば取り消す
+            if pending is not None:
+                pending.cancel()
+    
+    def normalize_text(self, text: str) -> str:
+        """テキストの正規化処理"""
+        # Unicode正規化
+        text = unicodedata.normalize('NFKC', text)
+        # 余分な空白を削除
+        text = _WHITESPACE_RE.sub(' ', text)
+        # 改行を空白に変換
+        text = text.replace('\n', ' ').replace('\r', ' ')
+        return text.strip()
+    
+    def decode_email(self, text: str) -> str:
+        """難読化されたメールアドレスをデコード"""
+        # 全角の＠・．を半角に置換
+        decoded = text.replace('＠', '@').replace('．', '.')
+        # 難読化表記を含まないテキスト（日本語のセル等）は正規表現を走らせない
+        lowered = decoded.lower()
+        if 'at' not in lowered and 'dot' not in lowered and '&#' not in lowered:
+            return decoded
+        return _EMAIL_OBFUSCATION_RE.sub(lambda m: '@' if m.lastindex else '.', decoded)
+    
+    def normalize_phone(self, phone: str) -> str:
+        """電話番号の正規化"""
+        # 全角を半角に変換
+        phone = phone.translate(_PHONE_TRANSLATION)
+        # 余分な文字を削除
+        phone = _PHONE_INVALID_CHARS_RE.sub('', phone)
+        # 空白を削除
+        phone = _WHITESPACE_RE.sub('', phone)
+        # 括弧を処理
+        phone = _PHONE_PAREN_RE.sub(r'\1-', phone)
+        # 複数のハイフンを一つに
+        phone = _HYPHENS_RE.sub('-', phone)
+        # 先頭と末尾のハイフンを削除
+        phone = phone.strip('-')
+        
+        # ハイフンがない10桁の電話番号にハイフンを追加
+        if len(phone) == 10 and phone.isdecimal():
+            if phone.startswith('03') or phone.startswith('06'):
+                phone = f"{phone[:2]}-{phone[2:6]}-{phone[6:]}"
+            else:
+                phone = f"{phone[:3]}-{phone[3:6]}-{phone[6:]}"
+        elif len(phone) == 11 and phone.isdecimal():
+            phone = f"{phone[:3]}-{phone[3:7]}-{phone[7:]}"
+        
+        return phone
+    
+    def fetch_article_content(self, article_url: str) -> bytes:
+        """
+        記事ページの本文をバイト列のまま取得（キャッシュがあればネットワークにアクセスしない）
+        
+        Args:
+            article_url: 記事のURL
+            
+        Returns:
+            bytes: 記事ページのレスポンス本文
+        """
+        if self.cache and not self.refresh_cache:
+            cached = self.cache.get(article_url)
+            if cached is not None:
+                logger.debug(f"キャッシュから取得: {article_url}")
+                metrics.inc('cache_requests_total', result='hit')
+                return cached
+            metrics.inc('cache_requests_total', result='miss')
+        
+        # 再取得時は保存済みのETag・Last-Modifiedで変更の有無だけを確認する
+        headers = self.cache.validators(article_url) if self.cache else {}
+        with metrics.timer('stage_seconds', stage='fetch'):
+            response = self._get(article_url, headers=headers, stream=self.stream_fetch)  # セッション維持
+            if self.stream_fetch:
+                content, complete = self._read_article_body(response, article_url)
+            else:
+                content, complete = response.content, True
+        
+        if response.status_code == 304 and self.cache:
+            cached = self.cache.revalidate(article_url)
+            if cached is not None:
+                logger.debug(f"変更なし（304）のためキャッシュを使用: {article_url}")
+                metrics.inc('cache_requests_total', result='revalidated')
+                return cached
+        # 途中で打ち切った本文はキャッシュしない（ETagで再検証されると不完全な本文が使われ続けるため）
+        if self.cache and response.status_code == 200 and complete:
+            self.cache.put(article_url, content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        return content
+    
+    def _read_article_body(self, response: requests.Response, article_url: str) -> tuple:
+        """
+        記事ページの本文を逐次受信（問い合わせ先を含む本文エリアを受信するか上限に達した時点で打ち切る）
+        
+        打ち切った場合は接続を閉じるため、残りの本文（フッター等）は受信しない。
+        
+        Args:
+            response: stream=Trueで送信したリクエストのレスポンス
+            article_url: 記事のURL
+            
+        Returns:
+            tuple: (受信した本文, 最後まで受信したか)
+        """
+        detector = _ContactSectionDetector() if response.status_code == 200 else None
+        chunks = []
+        received = 0
+        reason = 'complete'
+        try:
+            for chunk in response.iter_content(self.STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                received += len(chunk)
+                if detector and detector.feed(chunk):
+                    reason = 'contact'
+                    break
+                if self.max_download_bytes and received >= self.max_download_bytes:
+                    reason = 'size_cap'
+                    logger.warning(f"受信量の上限（{self.max_download_bytes // 1024}KB）に達したため打ち切りました: {article_url}")
+                    break
+        finally:
+            response.close()
+        
+        metrics.inc('http_response_bytes_total', received)
+        metrics.inc('stream_fetch_total', reason=reason)
+        if reason == 'contact':
+            logger.debug(f"問い合わせ先を受信したため打ち切りました（{received / 1024:.0f}KB）: {article_url}")
+        return b''.join(chunks), reason == 'complete'
+    
+    @staticmethod
+    def decode_html(content: bytes) -> str:
+        """レスポンス本文をHTML文字列に変換（PR TimesはUTF-8）"""
+        return content.decode('utf-8', errors='replace')
+    
+    def fetch_article_html(self, article_url: str) -> str:
+        """
+        記事ページのHTMLを取得
+        
+        Args:
+            article_url: 記事のURL
+            
+        Returns:
+            str: 記事ページのHTML
+        """
+        return self.decode_html(self.fetch_article_content(article_url))
+    
+    def extract_info(self, article_url: str, keyword: str = '') -> Dict[str, str]:
+        """
+        記事ページから情報を抽出（セッション維持）
+        
+        Args:
+            article_url: 記事のURL
+            keyword: 検索キーワード
+            
+        Returns:
+            Dict[str, str]: 抽出した情報
+        """
+        # デバッグログ: 処理対象URL
+        logger.debug(f"処理対象URL: {article_url}")
+        
+        try:
+            html = self.fetch_article_html(article_url)
+        except Exception as e:
+            logger.error(f"記事の取得中にエラーが発生しました ({article_url}): {e}")
+            return self.empty_info(article_url, keyword)
+        
+        return self.parse_article(html, article_url, keyword)
+    
+    @staticmethod
+    def empty_info(article_url: str, keyword: str = '') -> Dict[str, str]:
+        """抽出結果の初期値（全項目空）を作成"""
+        return {
+            '記事URL': article_url,
+            '検索キーワード': keyword,
+            '会社名': '',
+            '担当者名': '',
+            'メールアドレス': '',
+            '電話番号': ''
+        }
+    
+    def parse_article(self, html: str, article_url: str, keyword: str = '') -> Dict[str, str]:
+        """
+        取得済みの記事HTMLから情報を抽出
+        
+        Args:
+            html: 記事ページのHTML
+            article_url: 記事のURL
+            keyword: 検索キーワード
+            
+        Returns:
+            Dict[str, str]: 抽出した情報
+        """
+        info = self.empty_info(article_url, keyword)
+        cpu_start = time.process_time()
+        parse_start = time.perf_counter()
+        
+        # 段階ごとの所要時間（同じ段階が複数回に分かれる場合は合算して1回分として記録）
+        stage_times = {}
+        clock = [parse_start]
+        
+        def lap(stage: str):
+            now = time.perf_counter()
+            stage_times[stage] = stage_times.get(stage, 0.0) + now - clock[0]
+            clock[0] = now
+        
+        # 項目ごとにどの段階で値が得られたか
+        tiers = {'会社名': 'none', '担当者名': 'none', 'メールアドレス': 'none', '電話番号': 'none'}
+        
+        try:
+            # 問い合わせ先ブロックだけを処理する高速抽出（見つからなければ全体を解析）
+            fast_hit = self.fast_path and self._parse_fast_path(html, info, tiers)
+            if self.fast_path:
+                lap('fast')
+            metrics.inc('extraction_path_total', path='fast' if fast_hit else 'full')
+            if not fast_hit:
+                self._parse_full_path(html, info, tiers, lap)
+            
+            # 抽出結果のサマリー
+            extraction_summary = {
+                '会社名': bool(info['会社名']),
+                '担当者名': bool(info['担当者名']),
+                'メールアドレス': bool(info['メールアドレス']),
+                '電話番号': bool(info['電話番号'])
+            }
+            logger.debug(f"抽出結果サマリー: {extraction_summary}")
+            
+            if not any(extraction_summary.values()):
+                logger.warning(f"連絡先情報が一切抽出できませんでした: {article_url}")
+            
+            logger.info(f"記事から情報を抽出: {article_url}")
+            
+        except Exception as e:
+            logger.error(f"情報抽出中にエラーが発生しました ({article_url}): {e}")
+            metrics.inc('parse_errors_total')
+        
+        metrics.observe('stage_seconds', time.perf_counter() - parse_start, stage='parse')
+        for stage, seconds in stage_times.items():
+            metrics.observe('extract_stage_seconds', seconds, stage=stage)
+        for field, tier in tiers.items():
+            metrics.inc('extraction_tier_total', field=field, tier=tier)
+        metrics.inc('articles_parsed_total')
+        
+        logger.debug(f"解析CPU時間: {(time.process_time() - cpu_start) * 1000:.1f}ms ({article_url})")
+        return info
+    
+    def _parse_full_path(self, html: str, info: Dict[str, str], tiers: Dict[str, str], lap: Callable[[str], None]):
+        """
+        記事全体をBeautifulSoupで解析し、段階的に情報を抽出（高速抽出で見つからなかった場合）
+        
+        Args:
+            html: 記事ページのHTML
+            info: 抽出結果（この中に書き込む）
+            tiers: 項目ごとの取得元（この中に書き込む）
+            lap: 段階ごとの所要時間を記録する関数
+        """
+        soup = self._build_dom(html)
+        lap('dom')
+        
+        # 会社名の抽出（既存ロジックを維持）
+        info['会社名'], tiers['会社名'] = self._extract_company(soup)
+        lap('company')
+        
+        # 問い合わせ先セクションを特定し、抽出対象のテキストを作成
+        doc, text = self._find_contact_section(soup)
+        lap('section')
+        
+        # ピンポイント正規表現による抽出
+        
+        # 会社名の抽出（HTML要素から取得できなかった場合）
+        if not info['会社名']:
+            info['会社名'] = self._extract_company_from_text(text)
+            if info['会社名']:
+                tiers['会社名'] = 'text'
+        lap('company')
+        
+        # 担当者名の抽出（複数パターン）
+        info['担当者名'] = self._extract_person(text)
+        if info['担当者名']:
+            tiers['担当者名'] = 'text'
+        lap('person')
+        
+        # メールアドレスの抽出（構造 → キーワード周辺 → セクション全文）
+        info['メールアドレス'], tiers['メールアドレス'] = self._extract_email(doc, text)
+        lap('email')
+        
+        # 電話番号の抽出（構造 → キーワード → 問い合わせセクション）
+        info['電話番号'], tiers['電話番号'] = self._extract_phone(doc, text)
+        lap('phone')
+        
+        # 抽出結果が不十分な場合の追加処理
+        if not info['メールアドレス'] and not info['電話番号'] and not info['担当者名']:
+            email, phone = self._extract_from_full_text(doc)
+            if email:
+                info['メールアドレス'] = email
+                tiers['メールアドレス'] = 'fulltext'
+            if phone:
+                info['電話番号'] = phone
+                tiers['電話番号'] = 'fulltext'
+            lap('fulltext')
+    
+    def _parse_fast_path(self, html: str, info: Dict[str, str], tiers: Dict[str, str]) -> bool:
+        """
+        問い合わせ先ブロックのテキストだけをlxmlで処理する高速抽出
+        
+        通常の抽出と同じ優先順位で結果を求める。テーブル・li・strong/bの構造抽出は
+        通常の抽出と同じく文書全体を対象にし、キーワード周辺・全文の段階は
+        _find_contact_sectionと同じ手順で特定した問い合わせ先ブロックのテキストに限定する。
+        メール・電話番号の両方が見つかった場合のみ結果を採用し、
+        見つからなければFalseを返して通常の抽出に任せる。
+        
+        Args:
+            html: 記事ページのHTML
+            info: 抽出結果（ヒット時のみ更新）
+            tiers: 項目ごとの取得元（ヒット時のみ更新）
+            
+        Returns:
+            bool: 高速抽出で結果が得られた場合True
+        """
+        try:
+            root = lxml.html.document_fromstring(html)
+        except (ValueError, lxml.etree.ParserError):
+            return False
+        
+        block, excluded = self._locate_contact_block(root)
+        if block is None:
+            return False
+        result = self._extract_from_block(root, block, excluded)
+        if result is None:
+            return False
+        
+        values, block_tiers = result
+        company, company_tier = self._company_from_lxml(root)
+        if not company:
+            company, company_tier = values['会社名'], block_tiers['会社名']
+        info.update(values)
+        tiers.update(block_tiers)
+        info['会社名'] = company
+        tiers['会社名'] = company_tier if company else 'none'
+        return True
+    
+    def _extract_from_block(self, root, block, excluded: set) -> Optional[tuple]:
+        """
+        問い合わせ先ブロックのテキストと文書全体の構造からメール・電話番号・担当者名を抽出
+        
+        Args:
+            root: lxmlの文書
+            block: 問い合わせ先ブロックの要素
+            excluded: 通常の抽出で取り除かれるヘッダー・フッター等の要素（本文エリアがない場合）
+        
+        Returns:
+            Optional[tuple]: (抽出した値, 項目ごとの取得元)。メールと電話番号の両方が
+                             見つからない場合None
+        """
+        text = _lxml_text(block, separator=' ', strip=True)
+        for pattern in _CONTACT_SECTION_RES:
+            contact_match = pattern.search(text)
+            if contact_match:
+                text = contact_match.group(1)[:500] + ' ' + text
+        
+        normalized = {}
+        
+        def cell_text(element) -> str:
+            if element not in normalized:
+                normalized[element] = self.normalize_text(_lxml_text(element))
+            return normalized[element]
+        
+        # _DocumentIndexと同じく、行はtable配下の全tr、セルはtr配下の全td/th（文書順）
+        label_pairs = []
+        for table in root.iter('table'):
+            if table in excluded:
+                continue
+            for row in table.iter('tr'):
+                cells = [cell for cell in row.iter('td', 'th') if cell not in excluded]
+                label_pairs.extend(zip(cells, cells[1:]))
+        list_items = [cell_text(li) for li in root.iter('li') if li not in excluded]
+        
+        # メールアドレス（構造 → キーワード周辺 → ブロック全文）
+        decoded_text = self.decode_email(text)
+        email_candidates = [self.decode_email(cell_text(value)) for label, value in label_pairs
+                            if _EMAIL_LABEL_RE.search(cell_text(label))]
+        email_candidates += [self.decode_email(li_text) for li_text in list_items
+                             if '@' in li_text or any(p in li_text for p in ['[at]', '(at)', '[dot]', '(dot)'])]
+        email, email_tier = self._first_email(email_candidates), 'fast_structure'
+        if not email:
+            email, email_tier = self._email_from_context(decoded_text), 'fast_context'
+        if not email:
+            email, email_tier = self._email_from_text(decoded_text), 'fast_text'
+        if not email:
+            return None
+        
+        # 電話番号（構造 → キーワード → 問い合わせ先）
+        phone_candidates = [cell_text(value) for label, value in label_pairs
+                            if _PHONE_KEYWORD_RE.search(cell_text(label))]
+        phone_candidates += [li_text for li_text in list_items if _PHONE_KEYWORD_RE.search(li_text)]
+        for strong in root.iter('strong', 'b'):
+            if strong in excluded or not _PHONE_KEYWORD_RE.search(cell_text(strong)):
+                continue
+            # BeautifulSoupのnext_siblingと同じく、直後のテキストがなければ次の要素のHTML
+            if strong.tail:
+                phone_candidates.append(strong.tail.strip())
+            elif strong.getnext() is not None:
+                phone_candidates.append(lxml.etree.tostring(strong.getnext(), encoding='unicode',
+                                                            method='html', with_tail=False).strip())
+        phone, phone_tier = self._first_phone(phone_candidates, _PHONE_RES), 'fast_structure'
+        if not phone:
+            phone, phone_tier = self._phone_from_keywords(text), 'fast_keyword'
+        if not phone:
+            phone, phone_tier = self._phone_from_contact(text), 'fast_contact'
+        if not phone:
+            return None
+        
+        person = self._extract_person(text)
+        company = self._extract_company_from_text(text)
+        return ({'会社名': company, '担当者名': person, 'メールアドレス': email, '電話番号': phone},
+                {'会社名': 'fast_text', '担当者名': 'fast_text' if person else 'none',
+                 'メールアドレス': email_tier, '電話番号': phone_tier})
+    
+    def _locate_contact_block(self, root) -> tuple:
+        """
+        lxmlの文書から問い合わせ先ブロックを特定（_find_contact_sectionと同じ優先順位）
+        
+        本文エリアがない場合、通常の抽出はbodyからヘッダー・フッター等を取り除いてから探すため、
+        それらの要素を除外対象として返す。ブロックが除外対象を含む場合はテキストが
+        通常の抽出と変わるため、ブロックなしとして通常の抽出に任せる。
+        
+        Returns:
+            tuple: (問い合わせ先ブロックの要素（見つからない場合None）, 除外対象の要素のset)
+        """
+        area = None
+        for xpath in _LXML_CONTENT_XPATHS:
+            found = root.xpath(xpath)
+            if found:
+                area = found[0]
+                break
+        # 本文エリアがない場合はbody（ヘッダー・フッター等の中の要素は対象外）
+        excluded = set()
+        if area is None:
+            area = root.find('body')
+            if area is None:
+                return None, excluded
+            for element in area.iter():
+                if element not in excluded and isinstance(element.tag, str) and (
+                        element.tag in _LXML_EXCLUDE_TAGS or _EXCLUDE_CLASS_RE.search(element.get('class', ''))):
+                    excluded.update(element.iter())
+        
+        def contains_excluded(element) -> bool:
+            return bool(excluded) and any(node in excluded for node in element.iter())
+        
+        # 問い合わせ先キーワードを含むテキストと、そのテキストを持つ要素
+        strings = []
+        for string in area.xpath('.//text()'):
+            if not _MEDIA_KEYWORD_RE.search(string):
+                continue
+            owner = string.getparent()
+            if string.is_tail:
+                owner = owner.getparent()
+            elif not isinstance(owner.tag, str) or owner.tag in _LXML_SKIP_TAGS:
+                continue  # コメント・スクリプト内のテキスト
+            if owner is None or owner in excluded:
+                continue
+            strings.append((string, owner))
+        
+        for keyword in MEDIA_KEYWORDS:
+            for string, owner in strings:
+                if keyword not in string:
+                    continue
+                parent = owner
+                while parent is not None and parent.tag not in _LXML_SECTION_TAGS:
+                    parent = parent.getparent()
+                if parent is not None:
+                    if contains_excluded(parent):
+                        return None, excluded
+                    # PR TIMESの共通フッターでないことを確認
+                    parent_text = _lxml_text(parent, strip=True)
+                    if not ('Copyright' in parent_text and 'PR TIMES' in parent_text):
+                        return parent, excluded
+        
+        # テーブル形式の問い合わせ先情報
+        for table in area.iter('table'):
+            if table in excluded:
+                continue
+            if contains_excluded(table):
+                return None, excluded
+            if _MEDIA_KEYWORD_RE.search(_lxml_text(table)):
+                return table, excluded
+        return None, excluded
+    
+    def _company_from_lxml(self, root) -> tuple:
+        """
+        lxmlの文書から会社名を抽出（_extract_companyと同じ優先順位）
+        
+        Returns:
+            tuple: (会社名, 取得元 'fast_element' / 'fast_meta' / 'none')
+        """
+        for xpath in [f"//div[{_class_xpath('release-company')}]",
+                      f"//a[{_class_xpath('link-to-company')}]",
+                      "//*[self::div or self::span or self::a][contains(@class, 'company')]",
+                      f"//*[{_class_xpath('content-header-sub-text')} or {_class_xpath('release-header__company')}]"]:
+            found = root.xpath(xpath)
+            if found:
+                return _lxml_text(found[0]).strip(), 'fast_element'
+        
+        for content in root.xpath("//meta[@property='og:site_name']/@content"):
+            company_name = content.replace('のプレスリリース', '').strip()
+            if company_name and company_name != 'PR TIMES':
+                return company_name, 'fast_meta'
+            break
+        return '', 'none'
+    
+    @staticmethod
+    def _build_dom(html: str):
+        """記事HTMLを解析してDOMを構築"""
+        return BeautifulSoup(html, 'lxml')
+    
+    def _extract_company(self, soup) -> tuple:
+        """
+        会社名をHTML要素・メタデータから抽出
+        
+        Returns:
+            tuple: (会社名, 取得元 'element' / 'meta' / 'none')
+        """
+        company_elem = soup.find('div', {'class': 'release-company'})
+        if not company_elem:
+            company_elem = soup.find('a', {'class': 'link-to-company'})
+        if not company_elem:
+            company_elem = soup.find(['div', 'span', 'a'], class_=_COMPANY_CLASS_RE)
+        if not company_elem:
+            # PR Times特有のセレクタを追加
+            company_elem = soup.select_one('.content-header-sub-text, .release-header__company')
+        
+        if company_elem:
+            return company_elem.text.strip(), 'element'
+        
+        # メタデータから会社名を取得
+        meta_company = soup.find('meta', {'property': 'og:site_name'})
+        if meta_company and meta_company.get('content'):
+            company_name = meta_company.get('content').replace('のプレスリリース', '').strip()
+            if company_name and company_name != 'PR TIMES':
+                return company_name, 'meta'
+        return '', 'none'
+    
+    def _find_contact_section(self, soup) -> tuple:
+        """
+        記事本文エリアと問い合わせ先セクションを特定し、抽出対象のテキストを作成
+        
+        Returns:
+            tuple: (文書の索引 _DocumentIndex, 抽出対象テキスト)
+        """
+        # 記事本文エリアを特定（フッター・ヘッダーを除外）
+        main_content = None
+        content_selectors = [
+            'main', 'article', '.content', '.main-content', 
+            '.article-content', '.release-content', '.press-release'
+        ]
+        
+        for selector in content_selectors:
+            main_content = soup.select_one(selector)
+            if main_content:
+                logger.debug(f"記事本文エリア特定: {selector}")
+                break
+        
+        # 本文エリアが見つからない場合は、フッター・ヘッダーを除外したbody
+        if not main_content:
+            main_content = soup.find('body')
+            if main_content:
+                # フッター・ヘッダーを除外
+                for exclude_tag in main_content.find_all(['header', 'footer', 'nav']):
+                    exclude_tag.decompose()
+                # PR TIMESの共通要素を除外
+                for exclude_class in main_content.find_all(class_=_EXCLUDE_CLASS_RE):
+                    exclude_class.decompose()
+                logger.debug("記事本文エリア: body（フッター・ヘッダー除外後）")
+        
+        # メディア関係者限定セクションを優先的に探す（本文エリア内で）
+        section = None
+        
+        search_area = main_content if main_content else soup
+        
+        # テーブル・li・strong/b・キーワードを含むテキストを1回の走査で収集
+        doc = _DocumentIndex(soup, search_area, _MEDIA_KEYWORD_RE.search, self.normalize_text)
+        
+        for keyword in MEDIA_KEYWORDS:
+            # キーワードを含む要素を探す（本文エリア内で）
+            elements = [string for string in doc.contact_strings if keyword in string]
+            for element in elements:
+                if element.parent:
+                    # 親要素を遡って適切なセクションを見つける
+                    parent = element.parent
+                    while parent and parent.name not in ['div', 'section', 'p', 'td']:
+                        parent = parent.parent
+                    if parent:
+                        # PR TIMESの共通フッターでないことを確認
+                        parent_text = doc.text(parent, strip=True)
+                        if not ('Copyright' in parent_text and 'PR TIMES' in parent_text):
+                            section = parent
+                            logger.debug(f"対象セクション発見: {keyword}")
+                            break
+            if section:
+                break
+        
+        # 問い合わせ先テーブルを探す（PR Times特有の構造）
+        if not section:
+            # テーブル形式の問い合わせ先情報を探す
+            for table in doc.area_tables:
+                table_text = doc.text(table)
+                if _MEDIA_KEYWORD_RE.search(table_text):
+                    section = table
+                    logger.debug("問い合わせ先テーブルを発見")
+                    break
+        
+        # デバッグログ: 抽出対象セクションのHTML
+        if section:
+            section_html = str(section)[:500]  # 最初の500文字
+            logger.debug(f"対象セクションHTML: {section_html}...")
+        else:
+            logger.debug("対象セクションが見つからず、全文を使用")
+        
+        # セクションが見つかった場合はその範囲内のテキストを使用
+        if section:
+            text = doc.text(section, separator=' ', strip=True)
+        else:
+            # フォールバック1: 記事本文エリアから抽出
+            if main_content:
+                text = doc.text(main_content, separator=' ', strip=True)
+                logger.debug("フォールバック1: 記事本文エリア全体を使用")
+            else:
+                # フォールバック2: 全文テキストを使用（最後の手段）
+                text = doc.text(soup, separator=' ', strip=True)
+                logger.debug("フォールバック2: 全文テキストを使用")
+        
+        # デバッグログ: 抜き出したテキストの詳細情報
+        logger.debug(f"抽出対象テキスト（冒頭100文字）: {text[:100]}")
+        logger.debug(f"抽出対象テキスト長: {len(text)}文字")
+        
+        # 問い合わせ先の可能性が高い部分を抽出
+        for pattern in _CONTACT_SECTION_RES:
+            contact_match = pattern.search(text)
+            if contact_match:
+                contact_text = contact_match.group(1)[:500]  # 最大500文字
+                logger.debug(f"問い合わせセクション検出: {contact_text[:100]}...")
+                # このセクションから優先的に情報を抽出
+                text = contact_text + ' ' + text  # 前に追加して優先度を上げる
+        
+        # 主要キーワードの有無をチェック
+        keywords_check = {
+            'お問い合わせ': 'お問い合わせ' in text,
+            '担当': '担当' in text,
+            'TEL': 'TEL' in text or '電話' in text,
+            '@': '@' in text
+        }
+        logger.debug(f"キーワード存在チェック: {keywords_check}")
+        
+        return doc, text
+    
+    def _extract_company_from_text(self, text: str) -> str:
+        """抽出対象テキストから会社名を抽出（HTML要素から取得できなかった場合）"""
+        company_match = _COMPANY_TEXT_RE.search(text)
+        if company_match:
+            logger.debug(f"会社名をテキストから抽出: {company_match.group(1)}")
+            return company_match.group(1)
+        return ''
+    
+    def _extract_person(self, text: str) -> str:
+        """抽出対象テキストから担当者名を抽出"""
+        for pattern in _PERSON_RES:
+            person_match = pattern.search(text)
+            if person_match:
+                candidate = person_match.group(1).strip()
+                # 無効な候補を除外
+                if (candidate and len(candidate) >= 2 and len(candidate) <= 10 and
+                    not any(word in candidate for word in _PERSON_EXCLUDE_WORDS)):
+                    logger.debug(f"担当者名を抽出: {candidate} (パターン: {pattern.pattern})")
+                    return candidate
+        return ''
+    
+    @staticmethod
+    def _first_email(candidates: Iterable[str]) -> str:
+        """候補テキストを順に調べ、PR TIMES以外の最初のメールアドレスを返す"""
+        for candidate in candidates:
+            for pattern in _EMAIL_RES:
+                for email in pattern.findall(candidate):
+                    if 'prtimes' not in email.lower():
+                        return email
+        return ''
+    
+    def _extract_email(self, doc: '_DocumentIndex', text: str) -> tuple:
+        """
+        メールアドレスを段階的に抽出
+        
+        Returns:
+            tuple: (メールアドレス, 取得元 'structure' / 'context' / 'section_text' / 'none')
+        """
+        # まず難読化されたメールアドレスをデコード
+        decoded_text = self.decode_email(text)
+        
+        email = self._email_from_structure(doc)
+        if email:
+            logger.debug(f"メールアドレスを抽出（構造）: {email}")
+            return email, 'structure'
+        
+        email = self._email_from_context(decoded_text)
+        if email:
+            logger.debug(f"メールアドレスを抽出（コンテキスト）: {email}")
+            return email, 'context'
+        
+        email = self._email_from_text(decoded_text)
+        if email:
+            logger.debug(f"メールアドレスを抽出（全文）: {email}")
+            return email, 'section_text'
+        return '', 'none'
+    
+    def _email_from_structure(self, doc: '_DocumentIndex') -> str:
+        """HTMLのテーブルやリストから構造的にメールアドレスを抽出"""
+        potential_emails = []
+        
+        # テーブル形式の情報を探す
+        for table, rows in doc.tables:
+            for row, cells in rows:
+                for i in range(len(cells) - 1):
+                    cell_text = doc.normalized_text(cells[i])
+                    if _EMAIL_LABEL_RE.search(cell_text):
+                        next_cell_text = doc.normalized_text(cells[i + 1])
+                        potential_emails.append(self.decode_email(next_cell_text))
+        
+        # リスト形式の情報を探す
+        for li in doc.list_items:
+            li_text = doc.normalized_text(li)
+            if '@' in li_text or any(pattern in li_text for pattern in ['[at]', '(at)', '[dot]', '(dot)']):
+                potential_emails.append(self.decode_email(li_text))
+        
+        # 構造から抽出した候補を優先的にチェック
+        return self._first_email(potential_emails)
+    
+    def _email_from_context(self, decoded_text: str) -> str:
+        """メール関連のキーワード周辺からメールアドレスを抽出"""
+        return self._first_email(_EMAIL_CONTEXT_RE.findall(decoded_text))
+    
+    def _email_from_text(self, decoded_text: str) -> str:
+        """抽出対象テキスト全体からメールアドレスを抽出"""
+        return self._first_email([decoded_text])
+    
+    def _first_phone(self, candidates: Iterable[str], patterns: List) -> str:
+        """候補テキストを順に調べ、電話番号として妥当な最初の番号を正規化して返す"""
+        for candidate in candidates:
+            for pattern in patterns:
+                for phone in pattern.findall(candidate):
+                    normalized = self.normalize_phone(phone)
+                    if len(normalized.replace('-', '')) >= 10 and normalized[0] in '0+':
+                        return normalized
+        return ''
+    
+    def _extract_phone(self, doc: '_DocumentIndex', text: str) -> tuple:
+        """
+        電話番号を段階的に抽出
+        
+        Returns:
+            tuple: (電話番号, 取得元 'structure' / 'keyword' / 'contact' / 'none')
+        """
+        phone = self._phone_from_structure(doc)
+        if phone:
+            logger.debug(f"電話番号を抽出（構造）: {phone}")
+            return phone, 'structure'
+        
+        phone = self._phone_from_keywords(text)
+        if phone:
+            logger.debug(f"電話番号を抽出（キーワード）: {phone}")
+            return phone, 'keyword'
+        
+        # それでも見つからなければ全文検索（ただし慎重に）
+        phone = self._phone_from_contact(text)
+        if phone:
+            logger.debug(f"電話番号を抽出（問い合わせセクション）: {phone}")
+            return phone, 'contact'
+        return '', 'none'
+    
+    def _phone_from_structure(self, doc: '_DocumentIndex') -> str:
+        """HTMLのテーブル・リスト・strongタグから構造的に電話番号を抽出"""
+        potential_phones = []
+        
+        # テーブル形式の情報を探す
+        for table, rows in doc.tables:
+            for row, cells in rows:
+                for i in range(len(cells) - 1):
+                    cell_text = doc.normalized_text(cells[i])
+                    if _PHONE_KEYWORD_RE.search(cell_text):
+                        next_cell_text = doc.normalized_text(cells[i + 1])
+                        potential_phones.append(next_cell_text)
+        
+        # リスト形式の情報を探す
+        for li in doc.list_items:
+            li_text = doc.normalized_text(li)
+            if _PHONE_KEYWORD_RE.search(li_text):
+                potential_phones.append(li_text)
+        
+        # strongタグの後の電話番号を探す
+        for strong in doc.emphasis:
+            strong_text = doc.normalized_text(strong)
+            if _PHONE_KEYWORD_RE.search(strong_text):
+                next_text = strong.next_sibling
+                if next_text:
+                    potential_phones.append(str(next_text).strip())
+        
+        # 構造から抽出した候補を優先的にチェック
+        return self._first_phone(potential_phones, _PHONE_RES)
+    
+    def _phone_from_keywords(self, text: str) -> str:
+        """TEL・電話などのキーワードに続く電話番号を抽出"""
+        return self._first_phone([text], _PHONE_KEYWORD_RES)  # キーワード付きパターンのみ
+    
+    def _phone_from_contact(self, text: str) -> str:
+        """問い合わせセクション内の番号を電話番号として抽出"""
+        contact_section = _PHONE_CONTACT_RE.search(text)
+        if contact_section:
+            normalized = self.normalize_phone(contact_section.group(1))
+            if len(normalized.replace('-', '')) >= 10 and normalized[0] in '0+':
+                return normalized
+        return ''
+    
+    def _extract_from_full_text(self, doc: '_DocumentIndex') -> tuple:
+        """
+        セクション抽出で結果が得られなかった場合に、文書全体からメール・電話番号を再検索
+        
+        Returns:
+            tuple: (メールアドレス, 電話番号)（見つからない項目は空文字）
+        """
+        logger.debug("セクション抽出で結果が得られなかったため、全文検索を実行")
+        full_text = doc.text(doc.soup, separator=' ', strip=True)
+        email = phone = ''
+        
+        # 全文からメールアドレスを再検索
+        email_match = _FULLTEXT_EMAIL_RE.search(full_text)
+        if email_match:
+            candidate = email_match.group(1)
+            if 'prtimes' not in candidate.lower():
+                email = candidate
+                logger.debug(f"全文検索でメールアドレスを抽出: {email}")
+        
+        # 全文から電話番号を再検索
+        phone_match = _FULLTEXT_PHONE_RE.search(full_text)
+        if phone_match:
+            phone_clean = phone_match.group(1).translate(_PHONE_TRANSLATION)
+            phone_clean = _PHONE_SPACES_PARENS_RE.sub('', phone_clean)
+            if len(phone_clean) >= 10:
+                phone = phone_clean
+                logger.debug(f"全文検索で電話番号を抽出: {phone}")
+        
+        return email, phone
+    
+    def extract_stream(self, items: Iterable[tuple], workers: int = 1,
+                       on_result: Optional[Callable[[Dict[str, str]], None]] = None) -> int:
+        """
+        (記事URL, 検索キーワード) を受け取り次第、並列に情報を抽出
+        
+        itemsは検索中のジェネレータでもよく、見つかった記事から順に取得を始める。
+        
+        Args:
+            items: (記事URL, 検索キーワード) のイテラブル
+            workers: 同時に取得するスレッド数
+            on_result: 1記事の抽出が終わるたびに呼ばれるコールバック（完了順）
+            
+        Returns:
+            int: 処理した記事数
+        """
+        workers = max(1, workers)
+        # 投入済み・未完了の件数を制限し、itemsを必要な分だけ読み進める
+        slots = threading.BoundedSemaphore(workers * 2)
+        
+        def extract(index: int, url: str, keyword: str):
+            try:
+                logger.info(f"処理中: {index} - {keyword}")
+                info = self.extract_info(url, keyword)
+                if on_result:
+                    on_result(info)
+            except Exception as e:
+                logger.error(f"抽出結果の処理中にエラーが発生しました ({url}): {e}")
+            finally:
+                slots.release()
+        
+        count = 0
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for url, keyword in items:
+                slots.acquire()
+                count += 1
+                executor.submit(extract, count, url, keyword)
+        return count
+    
+
+class SearchScheduler:
+    """
+    複数キーワードの検索を並行して実行し、見つかった記事URLを順次返すスケジューラ
+    
+    各キーワードの検索はiter_search_resultsで次ページを先読みしながら進み、
+    記事URLはキーワードの検索完了を待たずに抽出段階へ渡される。
+    """
+    
+    def __init__(self, scraper: 'PRTimesCorrectedScraper', keywords: List[str], max_articles: int = 100,
+                 workers: int = 4, known_urls=None):
+        """
+        Args:
+            scraper: ログイン済みのスクレイパー
+            keywords: 検索キーワードのリスト
+            max_articles: キーワードごとに収集する最大記事数
+            workers: 同時に検索するキーワード数
+            known_urls: 前回までに取得済みの記事URL（search_articlesと同じ）
+        """
+        self.scraper = scraper
+        self.keywords = keywords
+        self.max_articles = max_articles
+        self.workers = max(1, workers)
+        self.known_urls = known_urls
+        self.found_counts: Dict[str, int] = {}
+    
+    def __iter__(self) -> Iterator[tuple]:
+        """
+        Yields:
+            tuple: (検索キーワード, 記事URL)（同じキーワード内では検索結果の順）
+        """
+        discovered = queue.Queue()
+        search_done = object()
+        
+        def search(keyword_index: int, keyword: str):
+            logger.info(f"キーワード {keyword_index}/{len(self.keywords)}: '{keyword}' で検索を開始します")
+            count = 0
+            try:
+                for url in self.scraper.iter_search_results(keyword, self.max_articles, self.known_urls):
+                    count += 1
+                    discovered.put((keyword, url))
+            except Exception as e:
+                logger.error(f"検索エラー ({keyword}): {e}")
+            finally:
+                self.found_counts[keyword] = count
+                if count:
+                    logger.info(f"キーワード '{keyword}': 合計 {count} 件の記事URLを収集しました")
+                else:
+                    logger.warning(f"キーワード '{keyword}' では記事が見つかりませんでした")
+                discovered.put(search_done)
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for keyword_index, keyword in enumerate(self.keywords, 1):
+                executor.submit(search, keyword_index, keyword)
+            
+            remaining = len(self.keywords)
+            while remaining:
+                item = discovered.get()
+                if item is search_done:
+                    remaining -= 1
+                    continue
+                yield item
+
+
+class WatchScheduler:
+    """
+    キーワードごとに検索結果の1ページ目を定期的に確認し、新しく現れた記事を見つける常駐モードのスケジューラ
+    
+    新しい記事が見つかったキーワードは確認間隔を半分に、見つからなかったキーワードは1.5倍にして
+    （min_interval〜max_intervalの範囲）、更新の多いキーワードほど頻繁に確認する。
+    ログイン状態は一定間隔で確認し、切れていればログインし直す。
+    """
+    
+    SPEEDUP = 0.5
+    SLOWDOWN = 1.5
+    
+    def __init__(self, scraper: 'PRTimesCorrectedScraper', keywords: List[str], known_urls=None,
+                 interval: float = 900, min_interval: float = 300, max_interval: float = 6 * 3600,
+                 login_check_interval: float = 1800, max_articles: int = 100):
+        """
+        Args:
+            scraper: ログイン済みのスクレイパー
+            keywords: 確認するキーワードのリスト
+            known_urls: 以前の実行で取得済みの記事URL（これらは新しい記事として扱わない）
+            interval: 各キーワードの最初の確認間隔（秒）
+            min_interval: 確認間隔の下限（秒）
+            max_interval: 確認間隔の上限（秒）
+            login_check_interval: ログイン状態を確認する間隔（秒）
+            max_articles: 1回の確認で検索結果から読む最大記事数
+        """
+        self.scraper = scraper
+        self.keywords = keywords
+        self.known_urls = known_urls if known_urls is not None else set()
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.login_check_interval = login_check_interval
+        self.max_articles = max_articles
+        self.article_index = ArticleIndex()
+        initial = min(max(interval, self.min_interval), self.max_interval)
+        self.intervals: Dict[str, float] = {keyword: initial for keyword in keywords}
+        # 起動直後は全キーワードをキーワード順に確認する
+        now = time.monotonic()
+        self.next_poll: Dict[str, float] = {keyword: now for keyword in keywords}
+        self._last_login_check = now
+    
+    def next_due(self) -> tuple:
+        """
+        次に確認するキーワード
+        
+        Returns:
+            tuple: (キーワード, 確認までの待機秒数)
+        """
+        keyword = min(self.keywords, key=lambda keyword: self.next_poll[keyword])
+        return keyword, max(0.0, self.next_poll[keyword] - time.monotonic())
+    
+    def keep_session_alive(self):
+        """前回の確認からlogin_check_interval経過していれば、ログイン状態を確認して切れていればログインし直す"""
+        now = time.monotonic()
+        if now - self._last_login_check < self.login_check_interval:
+            return
+        self._last_login_check = now
+        if not self.scraper.check_login():
+            logger.info("ログインが切れていたため、ログインし直します")
+            if not self.scraper.login(force=True):
+                logger.error("再ログインに失敗しました。ログインなしで確認を続けます")
+    
+    def poll(self, keyword: str) -> List[tuple]:
+        """
+        キーワードの検索結果の1ページ目を確認し、確認間隔を調整
+        
+        Returns:
+            List[tuple]: (記事URL, 取得が必要か) のリスト。取得済みの記事が別のキーワードで
+                新たにヒットした場合は取得不要（Falseで返す）。以前の実行で取得済みの記事は含まない
+        """
+        hits = []
+        for url in self.scraper.iter_search_results(keyword, self.max_articles, prefetch=False, max_pages=1):
+            if url in self.known_urls or keyword in self.article_index.keywords(url):
+                continue
+            hits.append((url, self.article_index.add(url, keyword)))
+        
+        new_count = sum(1 for _, is_new in hits if is_new)
+        factor = self.SPEEDUP if new_count else self.SLOWDOWN
+        self.intervals[keyword] = min(max(self.intervals[keyword] * factor, self.min_interval), self.max_interval)
+        self.next_poll[keyword] = time.monotonic() + self.intervals[keyword]
+        metrics.inc('watch_polls_total', result='new' if new_count else 'none')
+        logger.info(f"キーワード '{keyword}': 新しい記事 {new_count}件"
+                    f"（次の確認は{self.intervals[keyword] / 60:.0f}分後）")
+        return hits
+
+
+# 解析用ワーカープロセス内で使うスクレイパー（プロセスごとに1つ）
+_parse_worker_scraper = None
+
+
+def _init_parse_worker(log_level: int, fast_path: bool = True):
+    """解析用ワーカープロセスの初期化"""
+    global _parse_worker_scraper, metrics
+    _parse_worker_scraper = PRTimesCorrectedScraper('', '', '', fast_path=fast_path)
+    logger.setLevel(log_level)
+    # fork時に親プロセスの集計値（とロックの状態）を引き継ぐため、解析の分だけを親へ返すよう作り直す
+    metrics = Metrics(metrics.prefix)
+
+
+def _parse_in_worker(content: bytes, article_url: str, keyword: str) -> tuple:
+    """
+    ワーカープロセスでレスポンス本文を解析
+    
+    Returns:
+        tuple: (抽出した情報, この解析で記録したメトリクス)
+    """
+    html = PRTimesCorrectedScraper.decode_html(content)
+    info = _parse_worker_scraper.parse_article(html, article_url, keyword)
+    return info, metrics.snapshot(reset=True)
+
+
+class ExtractionPipeline:
+    """
+    記事の取得（I/O、スレッド）と解析（CPU、プロセス）を分離したパイプライン
+    
+    取得スレッドはレスポンス本文をバイト列のまま有界キューに積み、解析は
+    ProcessPoolExecutorで全コアに分散する。キューと解析中の件数に上限を設けるため、
+    記事数が増えてもメモリ使用量は一定に保たれる。
+    """
+    
+    def __init__(self, scraper: 'PRTimesCorrectedScraper', fetch_workers: int = 1, parse_workers: int = 0,
+                 queue_size: int = None):
+        """
+        Args:
+            scraper: ログイン済みのスクレイパー（取得に使用）
+            fetch_workers: 取得スレッド数
+            parse_workers: 解析プロセス数（0以下でCPUコア数）
+            queue_size: 取得済み・解析待ちの本文を保持する上限（省略時は解析プロセス数の2倍）
+        """
+        self.scraper = scraper
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = parse_workers if parse_workers > 0 else (os.cpu_count() or 1)
+        self.queue_size = queue_size or self.parse_workers * 2
+        self._parse_pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            initializer=_init_parse_worker,
+            initargs=(logger.getEffectiveLevel(), scraper.fast_path)
+        )
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def close(self):
+        """解析プロセスを終了"""
+        self._parse_pool.shutdown()
+    
+    def run_stream(self, items: Iterable[tuple],
+                   on_result: Optional[Callable[[Dict[str, str]], None]] = None) -> int:
+        """
+        (記事URL, 検索キーワード) を受け取り次第、取得・解析
+        
+        Args:
+            items: (記事URL, 検索キーワード) のイテラブル（検索中のジェネレータでもよい）
+            on_result: 1記事の抽出が終わるたびに呼ばれるコールバック（完了順）
+            
+        Returns:
+            int: 処理した記事数
+        """
+        fetched = queue.Queue(maxsize=self.queue_size)
+        fetch_slots = threading.BoundedSemaphore(self.fetch_workers * 2)
+        in_flight = threading.BoundedSemaphore(self.queue_size)
+        completed = threading.Condition()
+        counts = {'submitted': 0, 'completed': 0}
+        feed_done = object()
+        
+        def fetch(index: int, url: str, keyword: str):
+            logger.info(f"処理中: {index} - {keyword}")
+            try:
+                content = self.scraper.fetch_article_content(url)
+            except Exception as e:
+                logger.error(f"記事の取得中にエラーが発生しました ({url}): {e}")
+                content = None
+            finally:
+                fetch_slots.release()
+            fetched.put((url, keyword, content))  # キューが満杯なら解析が追いつくまで待機
+        
+        def complete(info: Dict[str, str]):
+            try:
+                if on_result:
+                    on_result(info)
+            except Exception as e:
+                logger.error(f"抽出結果の処理中にエラーが発生しました ({info['記事URL']}): {e}")
+            finally:
+                with completed:
+                    counts['completed'] += 1
+                    completed.notify_all()
+        
+        def on_parsed(url: str, keyword: str, future):
+            try:
+                info, worker_metrics = future.result()
+                metrics.merge(worker_metrics)
+            except Exception as e:
+                logger.error(f"情報抽出中にエラーが発生しました ({url}): {e}")
+                info = self.scraper.empty_info(url, keyword)
+            in_flight.release()
+            complete(info)
+        
+        def feed(fetch_pool: ThreadPoolExecutor):
+            # itemsを読み進めながら取得を投入（取得待ちの件数に上限を設ける）
+            try:
+                for url, keyword in items:
+                    fetch_slots.acquire()
+                    counts['submitted'] += 1
+                    fetch_pool.submit(fetch, counts['submitted'], url, keyword)
+            finally:
+                fetched.put(feed_done)
+        
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_pool:
+            feeder = threading.Thread(target=feed, args=(fetch_pool,), daemon=True)
+            feeder.start()
+            
+            # 取得済みの本文を解析プロセスへ渡す（投入が終わり、全ての取得結果を受け取るまで）
+            received = 0
+            feed_finished = False
+            while not feed_finished or received < counts['submitted']:
+                item = fetched.get()
+                if item is feed_done:
+                    feed_finished = True
+                    continue
+                received += 1
+                url, keyword, content = item
+                if content is None:
+                    complete(self.scraper.empty_info(url, keyword))
+                    continue
+                in_flight.acquire()  # 解析中の本文が上限に達したら完了を待つ
+                future = self._parse_pool.submit(_parse_in_worker, content, url, keyword)
+                future.add_done_callback(lambda f, url=url, keyword=keyword: on_parsed(url, keyword, f))
+            feeder.join()
+        
+        # 解析結果のコールバックが全て終わるまで待機
+        with completed:
+            completed.wait_for(lambda: counts['completed'] == counts['submitted'])
+        return counts['submitted']
+
+
+class InOrderCallback:
+    """
+    順不同で完了する結果を、入力順に並べ直してからコールバックへ渡す
+    
+    並列取得で先に終わった結果は、それより前の結果が揃うまで保持する。
+    """
+    
+    def __init__(self, callback: Callable[[Dict[str, str]], None]):
+        self.callback = callback
+        self._next_index = 0
+        self._pending: Dict[int, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+    
+    def __call__(self, index: int, info: Dict[str, str]):
+        with self._lock:
+            self._pending[index] = info
+            while self._next_index in self._pending:
+                self.callback(self._pending.pop(self._next_index))
+                self._next_index += 1
+    
+    def flush(self) -> int:
+        """
+        前の結果が揃わないまま残っている結果を入力順に全て渡す（抽出できなかった記事や中断で欠番がある場合）
+        
+        Returns:
+            int: 渡した件数
+        """
+        with self._lock:
+            indexes = sorted(self._pending)
+            for index in indexes:
+                self.callback(self._pending.pop(index))
+            if indexes:
+                self._next_index = indexes[-1] + 1
+        return len(indexes)
+
+
+class ResultStreamWriter:
+    """
+    抽出結果を1件ずつファイルへ追記するストリーミング出力（拡張子で .jsonl / .csv を判定）
+    
+    1行は「記事 × ヒットしたキーワード」1件分。全結果をメモリに保持せず、
+    Excel・ページ分割CSVは実行後にこのファイルから作成する。
+    """
+    
+    COLUMNS = ['記事URL', '検索キーワード', '会社名', '担当者名', 'メールアドレス', '電話番号']
+    
+    def __init__(self, path: str, flush: bool = True, fsync: bool = False):
+        """
+        Args:
+            path: 出力ファイルのパス（.jsonl または .csv）
+            flush: 1件ごとにバッファをフラッシュするか
+            fsync: 1件ごとにfsyncしてディスクへの書き込みを保証するか
+        """
+        self.path = path
+        self.format = 'csv' if path.lower().endswith('.csv') else 'jsonl'
+        self.flush = flush or fsync
+        self.fsync = fsync
+        self.count = 0
+        self._lock = threading.Lock()
+        if self.format == 'csv':
+            self._file = open(path, 'w', newline='', encoding='utf-8-sig')
+            self._writer = csv.DictWriter(self._file, fieldnames=self.COLUMNS, extrasaction='ignore')
+            self._writer.writeheader()
+        else:
+            self._file = open(path, 'w', encoding='utf-8')
+    
+    def write(self, info: Dict[str, str]):
+        """1件の結果を追記"""
+        with self._lock:
+            if self.format == 'csv':
+                self._writer.writerow(info)
+            else:
+                self._file.write(json.dumps(info, ensure_ascii=False) + '\n')
+            if self.flush:
+                self._file.flush()
+            if self.fsync:
+                os.fsync(self._file.fileno())
+            self.count += 1
+    
+    def close(self):
+        """ファイルを閉じる"""
+        with self._lock:
+            self._file.close()
+
+
+def iter_stream_records(path: str) -> Iterator[Dict[str, str]]:
+    """ResultStreamWriterの出力ファイルを1行ずつ読み込む"""
+    if path.lower().endswith('.csv'):
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def load_keyword_membership(path: str, keyword_order: List[str] = None) -> Dict[str, List[str]]:
+    """
+    出力ファイルから記事URLごとのヒットしたキーワード一覧を作成
+    
+    Args:
+        path: ResultStreamWriterの出力ファイル
+        keyword_order: キーワードの並び順（指定時は出力順ではなくこの順に並べる）
+    """
+    membership: Dict[str, List[str]] = {}
+    for record in iter_stream_records(path):
+        keywords = membership.setdefault(record['記事URL'], [])
+        if record['検索キーワード'] not in keywords:
+            keywords.append(record['検索キーワード'])
+    if keyword_order:
+        # キーワードの検索は並行して進むため、出力順は実行ごとに変わりうる
+        rank = {keyword: i for i, keyword in enumerate(keyword_order)}
+        for keywords in membership.values():
+            keywords.sort(key=lambda keyword: rank.get(keyword, len(rank)))
+    return membership
+
+
+def iter_keyword_rows(path: str, membership: Dict[str, List[str]] = None) -> Iterator[tuple]:
+    """
+    出力ファイルから (キーワード, 結果) を出力順に返す
+    
+    結果の「検索キーワード」列には、その記事がヒットした全キーワードを設定する。
+    """
+    if membership is None:
+        membership = load_keyword_membership(path)
+    for record in iter_stream_records(path):
+        keyword = record['検索キーワード']
+        row = dict(record)
+        row['検索キーワード'] = ArticleIndex.KEYWORD_SEPARATOR.join(membership.get(record['記事URL'], [keyword]))
+        yield keyword, row
+
+
+def iter_unique_articles(path: str, membership: Dict[str, List[str]] = None) -> Iterator[Dict[str, str]]:
+    """出力ファイルから記事ごとに1件の結果を返す（検索キーワード列は全キーワード）"""
+    seen = set()
+    for _, row in iter_keyword_rows(path, membership):
+        if row['記事URL'] not in seen:
+            seen.add(row['記事URL'])
+            yield row
+
+
+# 後処理で有効とみなすメールアドレス・電話番号
+_VALID_EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+_NON_DIGIT_RE = re.compile(r'\D')
+_COMPANY_KEY_STRIP_RE = re.compile(r'\s+|株式会社|（株）|\(株\)')
+
+
+def load_results_frame(path: str) -> pd.DataFrame:
+    """
+    ResultStreamWriterの出力ファイルをDataFrameとして読み込む（全列を文字列として扱う）
+    
+    Args:
+        path: ResultStreamWriterの出力ファイル（.jsonl または .csv）
+    """
+    columns = ResultStreamWriter.COLUMNS
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return pd.DataFrame(columns=columns, dtype=str)
+    if path.lower().endswith('.csv'):
+        frame = pd.read_csv(path, dtype=str, keep_default_na=False, encoding='utf-8-sig')
+    else:
+        frame = pd.read_json(path, lines=True, dtype=False)
+    return frame.reindex(columns=columns).fillna('').astype(str)
+
+
+def normalize_phone_series(phones: pd.Series) -> pd.Series:
+    """
+    電話番号の列をまとめて正規化（PRTimesCorrectedScraper.normalize_phoneと同じ規則）
+    """
+    phones = phones.fillna('').astype(str).str.translate(_PHONE_TRANSLATION)
+    phones = phones.str.replace(_PHONE_INVALID_CHARS_RE, '', regex=True)
+    phones = phones.str.replace(_WHITESPACE_RE, '', regex=True)
+    phones = phones.str.replace(_PHONE_PAREN_RE, r'\1-', regex=True)
+    phones = phones.str.replace(_HYPHENS_RE, '-', regex=True).str.strip('-')
+    
+    # ハイフンがない10桁・11桁の電話番号にハイフンを追加
+    ten = phones.str.fullmatch(r'\d{10}')
+    two_digit_area = ten & phones.str.startswith(('03', '06'))
+    phones = phones.mask(two_digit_area, phones.str[:2] + '-' + phones.str[2:6] + '-' + phones.str[6:])
+    phones = phones.mask(ten & ~two_digit_area, phones.str[:3] + '-' + phones.str[3:6] + '-' + phones.str[6:])
+    eleven = phones.str.fullmatch(r'\d{11}')
+    return phones.mask(eleven, phones.str[:3] + '-' + phones.str[3:7] + '-' + phones.str[7:])
+
+
+def _map_unique(values: pd.Series, transform: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """
+    列の重複を除いた値にだけ変換を適用し、元の行に展開する
+    
+    同じ記事は検索キーワードごとに1行ずつ出力されるため、連絡先の値は重複が多い。
+    """
+    codes, uniques = pd.factorize(values.fillna('').astype(str))
+    transformed = transform(pd.Series(uniques, dtype=object)).to_numpy()
+    return pd.Series(transformed.take(codes), index=values.index)
+
+
+def _clean_phones(phones: pd.Series) -> pd.Series:
+    """電話番号を正規化し、桁数が電話番号として正しくないものは空にする"""
+    phones = normalize_phone_series(phones)
+    digits = phones.str.replace(_NON_DIGIT_RE, '', regex=True).str.len()
+    international = phones.str.startswith('+')
+    valid = ((~international & digits.between(10, 11) & phones.str.startswith('0'))
+             | (international & digits.between(11, 13)))
+    return phones.where(valid, '')
+
+
+def _clean_emails(emails: pd.Series) -> pd.Series:
+    """メールアドレスを小文字化し、形式が正しくないもの・PR TIMES自身のものは空にする"""
+    emails = emails.str.strip().str.lower()
+    valid = emails.str.fullmatch(_VALID_EMAIL_RE) & ~emails.str.contains('prtimes', regex=False)
+    return emails.where(valid, '')
+
+
+def postprocess_results(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    抽出結果全体の電話番号・メールアドレスをまとめて正規化・検証
+    
+    電話番号は正規化したうえで数字が10〜11桁（+から始まる国際表記は11〜13桁）のもの、
+    メールアドレスは小文字化したうえで形式が正しくPR TIMES自身のものでないものだけを残し、
+    それ以外は空にする。重複を除いた値に対して列単位の文字列演算でまとめて処理する。
+    
+    Args:
+        frame: load_results_frameで読み込んだ抽出結果
+        
+    Returns:
+        pd.DataFrame: 正規化・検証後の抽出結果（元のDataFrameは変更しない）
+    """
+    frame = frame.copy()
+    frame['電話番号'] = _map_unique(frame['電話番号'], _clean_phones)
+    frame['メールアドレス'] = _map_unique(frame['メールアドレス'], _clean_emails)
+    
+    frame['会社名'] = frame['会社名'].fillna('').astype(str).str.strip()
+    frame['担当者名'] = frame['担当者名'].fillna('').astype(str).str.strip()
+    return frame
+
+
+def keyword_statistics(frame: pd.DataFrame, keyword_order: List[str] = None) -> pd.DataFrame:
+    """
+    キーワードごとの記事数・メールアドレス取得数・電話番号取得数（1回のgroupbyで集計）
+    
+    Args:
+        frame: 抽出結果（1行が「記事 × ヒットしたキーワード」1件）
+        keyword_order: 行の並び順（指定時はこの順に並べ、結果のないキーワードは除く）
+        
+    Returns:
+        pd.DataFrame: 検索キーワードをインデックスとし、列 記事数 / メールアドレス / 電話番号 を持つ集計
+    """
+    rows = frame.drop_duplicates(['検索キーワード', '記事URL'])
+    stats = rows.assign(
+        has_email=rows['メールアドレス'].ne(''),
+        has_phone=rows['電話番号'].ne(''),
+    ).groupby('検索キーワード', sort=False).agg(
+        記事数=('記事URL', 'size'),
+        メールアドレス=('has_email', 'sum'),
+        電話番号=('has_phone', 'sum'),
+    )
+    if keyword_order:
+        stats = stats.reindex([keyword for keyword in keyword_order if keyword in stats.index])
+    return stats
+
+
+def dedupe_contacts_by_company(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    同じ会社の連絡先を1行にまとめる
+    
+    会社名は全角・半角と空白、「株式会社」等の表記ゆれを除いた名前で同一視し、
+    担当者名・メールアドレス・電話番号はそれぞれ出力順で最初に得られた値を採用する。
+    会社名が取得できなかった記事は記事ごとに1行とする。
+    
+    Args:
+        frame: postprocess_resultsで正規化した抽出結果
+        
+    Returns:
+        pd.DataFrame: 列 会社名 / 担当者名 / メールアドレス / 電話番号 / 記事数 / 検索キーワード / 記事URL を持つ連絡先一覧
+    """
+    columns = ['会社名', '担当者名', 'メールアドレス', '電話番号', '記事数', '検索キーワード', '記事URL']
+    if frame.empty:
+        return pd.DataFrame(columns=columns)
+    
+    key = _map_unique(frame['会社名'], lambda names: names.str.normalize('NFKC')
+                      .str.replace(_COMPANY_KEY_STRIP_RE, '', regex=True).str.lower())
+    key = key.mask(key.eq(''), '\0' + frame['記事URL'])
+    contacts = frame[['会社名', '担当者名', 'メールアドレス', '電話番号', '記事URL']].replace('', None).assign(_key=key)
+    grouped = contacts.groupby('_key', sort=False)
+    
+    # groupby.firstは欠損値を飛ばすため、項目ごとに最初に得られた値が残る
+    result = grouped.first()
+    result['記事数'] = grouped['記事URL'].nunique()
+    keywords = pd.DataFrame({'_key': key, '検索キーワード': frame['検索キーワード']}).drop_duplicates()
+    keywords['検索キーワード'] = keywords['検索キーワード'].str.split(ArticleIndex.KEYWORD_SEPARATOR)
+    keywords = keywords.explode('検索キーワード').drop_duplicates()
+    keywords = keywords[keywords['検索キーワード'].ne('')]
+    result['検索キーワード'] = keywords.groupby('_key', sort=False)['検索キーワード'].agg(ArticleIndex.KEYWORD_SEPARATOR.join)
+    return result.reset_index(drop=True)[columns].fillna('')
+
+
+def write_contacts_csv(contacts: pd.DataFrame, filename: str = None) -> Optional[str]:
+    """
+    会社ごとにまとめた連絡先一覧をCSVファイルに書き込む
+    
+    Args:
+        contacts: dedupe_contacts_by_companyの結果
+        filename: 出力ファイル名（省略時はタイムスタンプ付きファイル名）
+    
+    Returns:
+        str: 出力したファイルパス
+    """
+    try:
+        if filename is None:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f'prtimes_contacts_{timestamp}.csv'
+        contacts.to_csv(filename, index=False, encoding='utf-8-sig')
+        logger.info(f"会社別の連絡先一覧を作成しました: {filename}（{len(contacts)}社）")
+        return filename
+    except Exception as e:
+        logger.error(f"連絡先一覧の作成中にエラーが発生しました: {e}")
+        return None
+
+
+class ResultDataset:
+    """
+    実行ごとの抽出結果を蓄積するParquetデータセット（実行日・検索キーワードでパーティション分割）
+    
+    <root>/実行日=YYYY-MM-DD/検索キーワード=<キーワード>/part-<実行ID>-<n>.parquet に保存する。
+    問い合わせでは実行日のパーティションと必要な列だけを読み込むため、
+    数か月分の実行結果があっても全件を読み込まずに集計できる。pyarrowは任意の依存（pip install pyarrow）。
+    """
+    
+    DATE_COLUMN = '実行日'
+    KEYWORD_COLUMN = '検索キーワード'
+    RUN_ID_COLUMN = '実行ID'
+    DATA_COLUMNS = ['記事URL', '会社名', '担当者名', 'メールアドレス', '電話番号']
+    BATCH_ROWS = 50000
+    
+    def __init__(self, root: str):
+        """
+        Args:
+            root: データセットのディレクトリ
+        """
+        import pyarrow
+        import pyarrow.dataset
+        self._pa = pyarrow
+        self._ds = pyarrow.dataset
+        self.root = root
+        self.schema = pyarrow.schema(
+            [(column, pyarrow.string()) for column in self.DATA_COLUMNS + [self.RUN_ID_COLUMN]]
+            + [(self.DATE_COLUMN, pyarrow.string()), (self.KEYWORD_COLUMN, pyarrow.string())]
+        )
+        self.partitioning = pyarrow.dataset.partitioning(
+            pyarrow.schema([(self.DATE_COLUMN, pyarrow.string()), (self.KEYWORD_COLUMN, pyarrow.string())]),
+            flavor='hive'
+        )
+    
+    @staticmethod
+    def _date_text(value) -> str:
+        """日付（date/datetime/'YYYY-MM-DD'）をパーティションの値に変換"""
+        return value if isinstance(value, str) else value.strftime('%Y-%m-%d')
+    
+    def write(self, rows: Iterable[Dict[str, str]], run_id: str, run_date=None) -> int:
+        """
+        1回の実行の結果を追加（BATCH_ROWS件ずつ変換して書き込み、全件をメモリに載せない）
+        
+        Args:
+            rows: 結果（1行が「記事 × ヒットしたキーワード」1件）のイテラブル
+            run_id: 実行ID（ファイル名に使うため、同じ日の複数回の実行も別ファイルになる）
+            run_date: 実行日（省略時は今日）
             
-            logger.info(f"記事から情報を抽出: {article_url}")
+        Returns:
+            int: 書き込んだ行数
+        """
+        run_date = self._date_text(run_date or datetime.now())
+        columns = self.schema.names
+        count = 0
+        
+        def batches():
+            nonlocal count
+            buffer = []
+            for row in rows:
+                values = {**row, self.RUN_ID_COLUMN: run_id, self.DATE_COLUMN: run_date}
+                buffer.append(['' if values.get(column) is None else str(values.get(column)) for column in columns])
+                if len(buffer) >= self.BATCH_ROWS:
+                    count += len(buffer)
+                    yield self._batch(buffer)
+                    buffer = []
+            if buffer:
+                count += len(buffer)
+                yield self._batch(buffer)
+        
+        self._ds.write_dataset(
+            batches(), self.root, schema=self.schema, format='parquet', partitioning=self.partitioning,
+            basename_template=f'part-{run_id}-{{i}}.parquet', existing_data_behavior='overwrite_or_ignore'
+        )
+        return count
+    
+    def _batch(self, buffer: List[List[str]]):
+        """行のリストをRecordBatchに変換"""
+        arrays = [self._pa.array([row[i] for row in buffer], type=self._pa.string()) for i in range(len(self.schema))]
+        return self._pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+    
+    def _read(self, columns: List[str], filter=None) -> pd.DataFrame:
+        """パーティションと列を絞り込んで読み込む"""
+        if not os.path.isdir(self.root):
+            return pd.DataFrame(columns=columns)
+        dataset = self._ds.dataset(self.root, schema=self.schema, format='parquet', partitioning=self.partitioning)
+        return dataset.to_table(columns=columns, filter=filter).to_pandas()
+    
+    @staticmethod
+    def _merge_articles(frame: pd.DataFrame) -> pd.DataFrame:
+        """記事ごとに1行にまとめる（検索キーワードは全キーワード、実行日は初めて取得した日）"""
+        frame = frame.sort_values(ResultDataset.DATE_COLUMN, kind='stable')
+        grouped = frame.groupby('記事URL', sort=False)
+        result = grouped.first()
+        result[ResultDataset.KEYWORD_COLUMN] = (
+            frame.drop_duplicates(['記事URL', ResultDataset.KEYWORD_COLUMN])
+            .groupby('記事URL', sort=False)[ResultDataset.KEYWORD_COLUMN].agg(ArticleIndex.KEYWORD_SEPARATOR.join)
+        )
+        return result.reset_index()
+    
+    def new_contacts_since(self, since) -> pd.DataFrame:
+        """
+        指定日以降の実行で初めて現れた連絡先
+        
+        メールアドレス（ない場合は電話番号）が指定日より前の実行に一度も現れていないものを、
+        初めて現れた記事の情報とともに返す。指定日より前のパーティションはメール・電話番号の列だけを読み込む。
+        
+        Args:
+            since: この日以降（date/datetime/'YYYY-MM-DD'）
             
-        except Exception as e:
-            logger.error(f"情報抽出中にエラーが発生しました ({article_url}): {e}")
+        Returns:
+            pd.DataFrame: 列 実行日 / 会社名 / 担当者名 / メールアドレス / 電話番号 / 記事URL / 検索キーワード
+        """
+        since = self._date_text(since)
+        date_field = self._ds.field(self.DATE_COLUMN)
+        known = self._read(['メールアドレス', '電話番号'], filter=date_field < since)
+        known_emails = set(known['メールアドレス'].str.lower()) - {''}
+        known_phones = set(known['電話番号']) - {''}
         
-        return info
+        recent = self._read(self.DATA_COLUMNS + [self.DATE_COLUMN, self.KEYWORD_COLUMN], filter=date_field >= since)
+        columns = [self.DATE_COLUMN, '会社名', '担当者名', 'メールアドレス', '電話番号', '記事URL', self.KEYWORD_COLUMN]
+        recent = recent[recent['メールアドレス'].ne('') | recent['電話番号'].ne('')]
+        if recent.empty:
+            return pd.DataFrame(columns=columns)
+        
+        articles = self._merge_articles(recent)
+        emails = articles['メールアドレス'].str.lower()
+        key = emails.where(emails.ne(''), articles['電話番号'])
+        is_new = (emails.ne('') & ~emails.isin(known_emails)) | (emails.eq('') & ~articles['電話番号'].isin(known_phones))
+        new = articles[is_new].assign(_key=key[is_new]).drop_duplicates('_key')
+        return new[columns].reset_index(drop=True)
     
+    def releases_for_company(self, company: str) -> pd.DataFrame:
+        """
+        会社名に指定の文字列を含む全てのリリース（記事ごとに1行、初めて取得した実行日順）
+        
+        Args:
+            company: 会社名（部分一致）
+            
+        Returns:
+            pd.DataFrame: 列 実行日 / 会社名 / 担当者名 / メールアドレス / 電話番号 / 記事URL / 検索キーワード
+        """
+        import pyarrow.compute as pc
+        columns = [self.DATE_COLUMN, '会社名', '担当者名', 'メールアドレス', '電話番号', '記事URL', self.KEYWORD_COLUMN]
+        frame = self._read(self.DATA_COLUMNS + [self.DATE_COLUMN, self.KEYWORD_COLUMN],
+                           filter=pc.match_substring(self._ds.field('会社名'), company))
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+        return self._merge_articles(frame)[columns]
+
 
 def write_to_csv_with_pages(dataframe: pd.DataFrame, filename: str = None):
     """
@@ -801,10 +3889,28 @@ def write_to_csv_with_pages(dataframe: pd.DataFrame, filename: str = None):
         dataframe: 書き込むpandas DataFrame
         filename: 出力ファイル名（省略時はタイムスタンプ付きファイル名）
     
+    Returns:
+        str: 出力したファイルパス
+    """
+    columns = dataframe.columns.tolist()
+    rows = (dict(zip(columns, values)) for values in dataframe.itertuples(index=False, name=None))
+    return write_rows_to_csv_with_pages(rows, columns, filename)
+
+def write_rows_to_csv_with_pages(rows: Iterable[Dict[str, str]], columns: List[str] = None, filename: str = None):
+    """
+    結果を1件ずつCSVファイルに書き込み、記事ごとにページを分けて出力（全件をメモリに載せない）
+    
+    Args:
+        rows: 書き込む結果（辞書）のイテラブル
+        columns: 出力する列（省略時はResultStreamWriter.COLUMNS）
+        filename: 出力ファイル名（省略時はタイムスタンプ付きファイル名）
+    
     Returns:
         str: 出力したファイルパス
     """
     try:
+        columns = columns or ResultStreamWriter.COLUMNS
+        
         # ファイル名の生成
         if filename is None:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -815,18 +3921,18 @@ def write_to_csv_with_pages(dataframe: pd.DataFrame, filename: str = None):
             writer = csv.writer(csvfile)
             
             # ヘッダー行を書き込み
-            writer.writerow(dataframe.columns.tolist())
+            writer.writerow(columns)
             
             # 記事ごとにページを分けて書き込み
-            for index, row in dataframe.iterrows():
-                # 記事データを書き込み
-                writer.writerow(row.tolist())
+            for index, row in enumerate(rows):
+                # 記事の区切りとして改ページ文字を追加（最初の記事以外の前に挿入）
+                if index > 0:
+                    writer.writerow([''] * len(columns))  # 空行
+                    writer.writerow([f'--- Page Break (Article {index + 1}) ---'] + [''] * (len(columns) - 1))
+                    writer.writerow([''] * len(columns))  # 空行
                 
-                # 記事の区切りとして改ページ文字を追加（最後の記事以外）
-                if index < len(dataframe) - 1:
-                    writer.writerow([''] * len(dataframe.columns))  # 空行
-                    writer.writerow([f'--- Page Break (Article {index + 2}) ---'] + [''] * (len(dataframe.columns) - 1))
-                    writer.writerow([''] * len(dataframe.columns))  # 空行
+                # 記事データを書き込み
+                writer.writerow([row.get(column, '') for column in columns])
         
         logger.info(f"CSVファイルを作成しました: {filename}")
         return filename
@@ -835,14 +3941,131 @@ def write_to_csv_with_pages(dataframe: pd.DataFrame, filename: str = None):
         logger.error(f"CSVファイルの作成中にエラーが発生しました: {e}")
         return None
 
-def write_to_excel_with_keywords(keyword_data_dict: dict, filename: str = None):
+def _excel_sheet_name(keyword: str) -> str:
+    """キーワードをExcelのシート名に変換（31文字まで、使用できない文字は_に置換）"""
+    sheet_name = keyword[:31]
+    for char in '/\\?*[]:<>|':
+        sheet_name = sheet_name.replace(char, '_')
+    return sheet_name
+
+
+def _open_with_default_app(path: str):
+    """ファイルをOSの既定のアプリケーションで開く（WSLではWindows側のExcelで開く）"""
+    system = platform.system()
+    try:
+        if system == 'Windows':
+            os.startfile(path)
+        elif system == 'Darwin':  # macOS
+            subprocess.run(['open', path])
+        elif system == 'Linux':
+            # WSLの場合、Windows側のExcelで開く
+            if 'microsoft' in platform.uname().release.lower():
+                # WSLパスをWindowsパスに変換
+                windows_path = subprocess.check_output(['wslpath', '-w', path]).decode().strip()
+                subprocess.run(['cmd.exe', '/c', 'start', windows_path])
+            else:
+                # 通常のLinux
+                subprocess.run(['xdg-open', path])
+        
+        logger.info(f"Excelファイルを開きました: {path}")
+    except Exception as e:
+        logger.warning(f"Excelファイルの自動起動に失敗しました: {e}")
+        logger.info(f"手動でファイルを開いてください: {path}")
+
+
+class ExcelStreamWriter:
     """
-    キーワードごとのデータを別々のシートにExcelファイルとして保存
+    結果を1行ずつExcelファイルへ書き込むストリーミング出力（xlsxwriterのconstant_memoryモード）
+    
+    シートごとに書き終えた行はすぐに一時ファイルへ書き出されるため、行数が増えてもメモリ使用量は増えない。
+    列幅は書き込みと同時に各列の最大文字数を記録し、閉じる時に設定する（別の走査は不要）。
+    """
+    
+    MAX_COLUMN_WIDTH = 50
+    
+    def __init__(self, filename: str, columns: List[str] = None, header_align: Optional[str] = 'center',
+                 page_break_every: Optional[int] = 5):
+        """
+        Args:
+            filename: 出力ファイル名
+            columns: 出力する列（省略時は最初に書き込んだ行のキー）
+            header_align: ヘッダーの文字配置（Noneで指定なし）
+            page_break_every: データの下に改ページマーカーを挿入する記事数の間隔（Noneで挿入しない）
+        """
+        import xlsxwriter
+        self.filename = filename
+        self.columns = columns
+        self.page_break_every = page_break_every
+        self.workbook = xlsxwriter.Workbook(filename, {'constant_memory': True})
+        header = {'bold': True, 'bg_color': '#4472C4', 'font_color': 'white', 'border': 1}
+        if header_align:
+            header['align'] = header_align
+        self.header_format = self.workbook.add_format(header)
+        self.page_break_format = self.workbook.add_format({
+            'bold': True,
+            'bg_color': '#FFE4B5',
+            'border': 1,
+            'align': 'center'
+        })
+        self._sheets: Dict[str, list] = {}  # シート名 → [ワークシート, 次の行, 列ごとの最大文字数]
+    
+    def sheet(self, sheet_name: str) -> list:
+        """シートを取得（初めて書き込む場合は作成してヘッダーを書き込む）"""
+        sheet = self._sheets.get(sheet_name)
+        if sheet is None:
+            worksheet = self.workbook.add_worksheet(sheet_name)
+            for col_num, header in enumerate(self.columns):
+                worksheet.write(0, col_num, header, self.header_format)
+            sheet = self._sheets[sheet_name] = [worksheet, 1, [len(str(header)) for header in self.columns]]
+        return sheet
+    
+    def write(self, sheet_name: str, row: Dict[str, str]):
+        """1件の結果をシートの末尾に書き込む"""
+        if self.columns is None:
+            self.columns = list(row)
+        sheet = self.sheet(sheet_name)
+        worksheet, row_num, widths = sheet
+        for col_num, column in enumerate(self.columns):
+            value = row.get(column, '')
+            if value is None or (isinstance(value, float) and value != value):
+                value = ''
+            worksheet.write(row_num, col_num, value)
+            widths[col_num] = max(widths[col_num], len(str(value)))
+        sheet[1] = row_num + 1
+    
+    def close(self) -> Dict[str, int]:
+        """
+        改ページマーカーと列幅を設定してファイルを閉じる
+        
+        Returns:
+            Dict[str, int]: シート名ごとの書き込んだ件数
+        """
+        counts = {}
+        for sheet_name, (worksheet, row_num, widths) in self._sheets.items():
+            count = counts[sheet_name] = row_num - 1
+            if self.page_break_every:
+                # 記事ごとにページ分割マーカーを追加（データの下に空行を一つ空けて開始）
+                current_row = count + 2
+                for i in range(1, count):
+                    if i % self.page_break_every == 0:
+                        worksheet.write(current_row, 0, f'--- Page Break (Next {self.page_break_every} Articles) ---',
+                                        self.page_break_format)
+                        current_row += 2  # 空行も追加
+            for col_num, width in enumerate(widths):
+                worksheet.set_column(col_num, col_num, min(width + 2, self.MAX_COLUMN_WIDTH))
+        self.workbook.close()
+        return counts
+
+
+def write_keyword_rows_to_excel(rows: Iterable[tuple], filename: str = None, open_file: bool = True):
+    """
+    (キーワード, 結果) を1件ずつキーワード別のシートに書き込む（全件をメモリに載せない）
     各シート内では記事ごとにページ分割
     
     Args:
-        keyword_data_dict: キーワードをキーとしてデータのリストを値とする辞書
+        rows: (キーワード, 結果の辞書) のイテラブル（シートは最初に現れたキーワードの順に作成）
         filename: 出力ファイル名（省略時はタイムスタンプ付きファイル名）
+        open_file: 作成後にファイルを開くか
     
     Returns:
         str: 出力したファイルパス
@@ -853,104 +4076,38 @@ def write_to_excel_with_keywords(keyword_data_dict: dict, filename: str = None):
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'prtimes_all_keywords_{timestamp}.xlsx'
         
-        # Excelファイルに書き込み（xlsxwriterエンジンを使用）
-        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-            workbook = writer.book
-            
-            # ヘッダーのフォーマット設定
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1,
-                'align': 'center'
-            })
-            
-            # ページ区切りのフォーマット設定
-            page_break_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#FFE4B5',
-                'border': 1,
-                'align': 'center'
-            })
-            
-            for keyword, data_list in keyword_data_dict.items():
-                if not data_list:
-                    continue
-                
-                # DataFrameを作成
-                df = pd.DataFrame(data_list)
-                
-                # シート名をキーワードに設定（Excelシート名の制限に合わせて調整）
-                sheet_name = keyword[:31]  # Excelシート名は31文字まで
-                sheet_name = sheet_name.replace('/', '_').replace('\\', '_').replace('?', '_')
-                sheet_name = sheet_name.replace('*', '_').replace('[', '_').replace(']', '_')
-                sheet_name = sheet_name.replace(':', '_').replace('<', '_').replace('>', '_')
-                sheet_name = sheet_name.replace('|', '_')
-                
-                # データをシートに書き込み
-                df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=0)
-                
-                # ワークシートを取得してフォーマット適用
-                worksheet = writer.sheets[sheet_name]
-                
-                # ヘッダーにフォーマット適用
-                for col_num, header in enumerate(df.columns):
-                    worksheet.write(0, col_num, header, header_format)
-                
-                # 記事ごとにページ分割マーカーを追加
-                current_row = len(df) + 2  # データの下に空行を一つ空けて開始
-                
-                for i in range(1, len(df)):
-                    # 5行ごとに改ページマーカーを挿入
-                    if i % 5 == 0:
-                        worksheet.write(current_row, 0, f'--- Page Break (Next 5 Articles) ---', page_break_format)
-                        current_row += 2  # 空行も追加
-                
-                # 列幅の自動調整
-                for i, col in enumerate(df.columns):
-                    # 列の最大文字数を取得
-                    max_len = max(
-                        df[col].astype(str).map(len).max() if len(df) > 0 else 10,
-                        len(col)
-                    ) + 2
-                    # 列幅を設定（最大50文字まで）
-                    worksheet.set_column(i, i, min(max_len, 50))
-                
-                logger.info(f"シート '{sheet_name}' を作成: {len(df)}件")
+        writer = ExcelStreamWriter(filename)
+        for keyword, row in rows:
+            writer.write(_excel_sheet_name(keyword), row)
+        for sheet_name, count in writer.close().items():
+            logger.info(f"シート '{sheet_name}' を作成: {count}件")
         
         logger.info(f"Excelファイルを作成しました: {filename}")
         
-        # Excelファイルを自動で開く
         abs_path = os.path.abspath(filename)
-        system = platform.system()
-        
-        try:
-            if system == 'Windows':
-                os.startfile(abs_path)
-            elif system == 'Darwin':  # macOS
-                subprocess.run(['open', abs_path])
-            elif system == 'Linux':
-                # WSLの場合、Windows側のExcelで開く
-                if 'microsoft' in platform.uname().release.lower():
-                    # WSLパスをWindowsパスに変換
-                    windows_path = subprocess.check_output(['wslpath', '-w', abs_path]).decode().strip()
-                    subprocess.run(['cmd.exe', '/c', 'start', windows_path])
-                else:
-                    # 通常のLinux
-                    subprocess.run(['xdg-open', abs_path])
-            
-            logger.info(f"Excelファイルを開きました: {abs_path}")
-        except Exception as e:
-            logger.warning(f"Excelファイルの自動起動に失敗しました: {e}")
-            logger.info(f"手動でファイルを開いてください: {abs_path}")
-        
+        if open_file:
+            _open_with_default_app(abs_path)
         return abs_path
         
     except Exception as e:
         logger.error(f"Excelファイルの作成中にエラーが発生しました: {e}")
         return None
 
+def write_to_excel_with_keywords(keyword_data_dict: dict, filename: str = None):
+    """
+    キーワードごとのデータを別々のシートにExcelファイルとして保存
+    各シート内では記事ごとにページ分割
+    
+    Args:
+        keyword_data_dict: キーワードをキーとしてデータのリストを値とする辞書
+        filename: 出力ファイル名（省略時はタイムスタンプ付きファイル名）
+    
+    Returns:
+        str: 出力したファイルパス
+    """
+    rows = ((keyword, row) for keyword, data_list in keyword_data_dict.items() for row in data_list)
+    return write_keyword_rows_to_excel(rows, filename)
+
 def write_to_excel_and_open(dataframe: pd.DataFrame, filename: str = None):
     """
     DataFrameをExcelファイルに書き込み、自動で開く
@@ -968,69 +4125,376 @@ def write_to_excel_and_open(dataframe: pd.DataFrame, filename: str = None):
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             filename = f'prtimes_data_{timestamp}.xlsx'
         
-        # Excelファイルに書き込み（xlsxwriterエンジンを使用）
-        with pd.ExcelWriter(filename, engine='xlsxwriter') as writer:
-            dataframe.to_excel(writer, sheet_name='PR_Times_Data', index=False)
-            
-            # ワークシートの取得
-            workbook = writer.book
-            worksheet = writer.sheets['PR_Times_Data']
-            
-            # 列幅の自動調整
-            for i, col in enumerate(dataframe.columns):
-                # 列の最大文字数を取得
-                max_len = max(
-                    dataframe[col].astype(str).map(len).max(),
-                    len(col)
-                ) + 2
-                # 列幅を設定（最大50文字まで）
-                worksheet.set_column(i, i, min(max_len, 50))
-            
-            # ヘッダーのフォーマット設定
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4472C4',
-                'font_color': 'white',
-                'border': 1
-            })
-            
-            # ヘッダーに書式を適用
-            for col_num, value in enumerate(dataframe.columns.values):
-                worksheet.write(0, col_num, value, header_format)
+        # 1行ずつ書き込む（列の文字列コピーを作らずに列幅を求める）
+        columns = [str(column) for column in dataframe.columns]
+        writer = ExcelStreamWriter(filename, columns, header_align=None, page_break_every=None)
+        writer.sheet('PR_Times_Data')
+        for values in dataframe.itertuples(index=False, name=None):
+            writer.write('PR_Times_Data', dict(zip(columns, values)))
+        writer.close()
         
         logger.info(f"Excelファイルを作成しました: {filename}")
         
         # Excelファイルを自動で開く
         abs_path = os.path.abspath(filename)
-        system = platform.system()
-        
-        try:
-            if system == 'Windows':
-                os.startfile(abs_path)
-            elif system == 'Darwin':  # macOS
-                subprocess.run(['open', abs_path])
-            elif system == 'Linux':
-                # WSLの場合、Windows側のExcelで開く
-                if 'microsoft' in platform.uname().release.lower():
-                    # WSLパスをWindowsパスに変換
-                    windows_path = subprocess.check_output(['wslpath', '-w', abs_path]).decode().strip()
-                    subprocess.run(['cmd.exe', '/c', 'start', windows_path])
-                else:
-                    # 通常のLinux
-                    subprocess.run(['xdg-open', abs_path])
-            
-            logger.info(f"Excelファイルを開きました: {abs_path}")
-        except Exception as e:
-            logger.warning(f"Excelファイルの自動起動に失敗しました: {e}")
-            logger.info(f"手動でファイルを開いてください: {abs_path}")
-        
+        _open_with_default_app(abs_path)
         return abs_path
         
     except Exception as e:
         logger.error(f"Excelファイルの作成中にエラーが発生しました: {e}")
         return None
 
-def main(headless=True, search_keyword=None, use_multiple_keywords=False):
+class GoogleSheetsWriter:
+    """
+    抽出結果をGoogle Sheetsへまとめて追記する出力（Sheets API v4のvalues.append / values.batchUpdate）
+    
+    開始時に記事URL列を1回だけ読み込み、既にシートにある記事は追記しない。
+    行はbatch_size件ずつ1回のAPI呼び出しで追記し、API呼び出しはレートリミッターで
+    クォータ（書き込みは1ユーザーあたり毎分60回）を超えないように制御する（429/5xxは待機後に再試行）。
+    """
+    
+    API_BASE = 'https://sheets.googleapis.com/v4'
+    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+    KEY_COLUMN = '記事URL'
+    
+    def __init__(self, session: requests.Session, spreadsheet_id: str, sheet_name: str,
+                 columns: List[str] = None, batch_size: int = 500, requests_per_minute: float = 50,
+                 max_retries: int = 5, api_base: Optional[str] = None, timeout: float = 60.0):
+        """
+        Args:
+            session: 認証済みのHTTPセッション（from_credentialsで作成。検証用の偽サーバーには通常のrequests.Session）
+            spreadsheet_id: スプレッドシートID
+            sheet_name: 書き込むシート名
+            columns: 出力する列（省略時はResultStreamWriter.COLUMNS。シートにヘッダーがあればその並び）
+            batch_size: 1回のAPI呼び出しで追記する行数
+            requests_per_minute: 1分あたりのAPI呼び出し数の上限
+            max_retries: 429/5xx応答時の最大再試行回数
+            api_base: Sheets APIのベースURL（省略時はGoogleのAPI。検証用のローカルサーバーを指定できる）
+            timeout: 1回のAPI呼び出しのタイムアウト秒数
+        """
+        self.session = session
+        self.spreadsheet_id = spreadsheet_id
+        self.sheet_name = sheet_name
+        self.columns = list(columns or ResultStreamWriter.COLUMNS)
+        self.batch_size = max(1, batch_size)
+        self.max_retries = max_retries
+        self.api_base = (api_base or self.API_BASE).rstrip('/')
+        self.timeout = timeout
+        self.rate_limiter = RequestRateLimiter(requests_per_minute / 60.0)
+        self.api_calls = 0
+        self.appended = 0
+        self.skipped = 0
+        self._pending: List[List[str]] = []
+        self._existing = self._load_existing_keys()
+    
+    @classmethod
+    def from_credentials(cls, credentials_path: str, spreadsheet_id: str, sheet_name: str, **kwargs) -> 'GoogleSheetsWriter':
+        """サービスアカウントの認証情報ファイルから作成"""
+        from google.auth.transport.requests import AuthorizedSession
+        credentials = Credentials.from_service_account_file(credentials_path, scopes=cls.SCOPES)
+        return cls(AuthorizedSession(credentials), spreadsheet_id, sheet_name, **kwargs)
+    
+    def _range(self, a1: str = '') -> str:
+        """シート名を付けたA1形式の範囲"""
+        quoted = "'" + self.sheet_name.replace("'", "''") + "'"
+        return f'{quoted}!{a1}' if a1 else quoted
+    
+    @staticmethod
+    def _column_letter(index: int) -> str:
+        """0始まりの列番号をA1形式の列名に変換"""
+        letters = ''
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            letters = chr(ord('A') + remainder) + letters
+        return letters
+    
+    def _call(self, method: str, path: str, **kwargs) -> Dict:
+        """
+        レートリミッターを経由してSheets APIを呼び出す（429/5xxは待機後に再試行）
+        
+        Returns:
+            Dict: レスポンスのJSON
+        """
+        url = f'{self.api_base}/spreadsheets/{self.spreadsheet_id}{path}'
+        kwargs.setdefault('timeout', self.timeout)
+        attempt = 0
+        while True:
+            self.rate_limiter.wait()
+            response = self.session.request(method, url, **kwargs)
+            self.api_calls += 1
+            metrics.inc('sheets_api_calls_total', method=method, status=response.status_code)
+            self.rate_limiter.record_response(response.status_code, response.headers.get('Retry-After'))
+            if response.status_code not in RequestRateLimiter.RETRY_STATUS_CODES or attempt >= self.max_retries:
+                response.raise_for_status()
+                return response.json() if response.content else {}
+            attempt += 1
+            logger.info(f"Google Sheets APIの再試行 {attempt}/{self.max_retries}")
+    
+    def _load_existing_keys(self) -> set:
+        """シートのヘッダーと記事URL列を読み込み、既に書き込まれている記事URLの集合を返す"""
+        header = self._call('GET', '/values:batchGet', params={'ranges': self._range('1:1')})
+        header_values = (header.get('valueRanges') or [{}])[0].get('values') or []
+        if not header_values or not any(header_values[0]):
+            # 空のシートにはヘッダーを書き込む
+            self._call('POST', '/values:batchUpdate', json={
+                'valueInputOption': 'RAW',
+                'data': [{'range': self._range('A1'), 'values': [self.columns]}],
+            })
+            return set()
+        
+        self.columns = [str(value) for value in header_values[0]]
+        if self.KEY_COLUMN not in self.columns:
+            raise ValueError(f"シート '{self.sheet_name}' のヘッダーに「{self.KEY_COLUMN}」列がありません")
+        letter = self._column_letter(self.columns.index(self.KEY_COLUMN))
+        column = self._call('GET', '/values:batchGet', params={
+            'ranges': self._range(f'{letter}2:{letter}'), 'majorDimension': 'COLUMNS',
+        })
+        values = (column.get('valueRanges') or [{}])[0].get('values') or [[]]
+        return {value for value in values[0] if value}
+    
+    def write(self, info: Dict[str, str]):
+        """1件の結果を追記対象に加える（シートに既にある記事は追記しない）"""
+        key = info.get(self.KEY_COLUMN, '')
+        if key in self._existing:
+            self.skipped += 1
+            return
+        self._existing.add(key)
+        self._pending.append(['' if info.get(column) is None else str(info.get(column)) for column in self.columns])
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+    
+    def flush(self):
+        """溜まっている行をまとめて1回のAPI呼び出しで追記"""
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        path = '/values/' + urllib.parse.quote(self._range('A1'), safe='') + ':append'
+        self._call('POST', path, params={'valueInputOption': 'RAW', 'insertDataOption': 'INSERT_ROWS'},
+                   json={'majorDimension': 'ROWS', 'values': rows})
+        self.appended += len(rows)
+    
+    def close(self):
+        """残りの行を追記"""
+        self.flush()
+
+
+def write_to_google_sheets(rows: Iterable[Dict[str, str]], spreadsheet_id: str, sheet_name: str,
+                           credentials_path: str = None, session: requests.Session = None,
+                           **kwargs) -> Optional[GoogleSheetsWriter]:
+    """
+    結果をGoogle Sheetsへ追記（シートに既にある記事URLの行は追記しない）
+    
+    Args:
+        rows: 書き込む結果（辞書）のイテラブル
+        spreadsheet_id: スプレッドシートID
+        sheet_name: 書き込むシート名
+        credentials_path: サービスアカウントの認証情報ファイル（sessionを指定しない場合）
+        session: 認証済みのHTTPセッション（検証用の偽サーバーに書き込む場合など）
+        **kwargs: GoogleSheetsWriterに渡す追加引数
+    
+    Returns:
+        Optional[GoogleSheetsWriter]: 書き込みに使ったライター（件数・API呼び出し数を保持。失敗時はNone）
+    """
+    try:
+        if session is None:
+            writer = GoogleSheetsWriter.from_credentials(credentials_path, spreadsheet_id, sheet_name, **kwargs)
+        else:
+            writer = GoogleSheetsWriter(session, spreadsheet_id, sheet_name, **kwargs)
+        for row in rows:
+            writer.write(row)
+        writer.close()
+        logger.info(f"Google Sheetsに追記しました: {writer.appended}件（既存のためスキップ {writer.skipped}件、"
+                    f"API呼び出し {writer.api_calls}回）")
+        return writer
+    except Exception as e:
+        logger.error(f"Google Sheetsへの書き込み中にエラーが発生しました: {e}")
+        return None
+
+def run_watch(scraper: 'PRTimesCorrectedScraper', scheduler: WatchScheduler, checkpoint: CheckpointStore,
+              sink: ResultStreamWriter, extract: Callable[[Iterable[tuple], Callable[[Dict[str, str]], None]], int],
+              sheets: Optional[GoogleSheetsWriter] = None, dataset: Optional['ResultDataset'] = None,
+              stop: Optional[threading.Event] = None, max_polls: Optional[int] = None) -> int:
+    """
+    常駐モード: 確認時刻になったキーワードから順に検索し、新しい記事だけを抽出して各出力へ送る
+    
+    Ctrl+C・SIGTERM（またはstopの設定）で確認の合間に終了する。
+    
+    Args:
+        scraper: ログイン済みのスクレイパー
+        scheduler: キーワードごとの確認時刻を管理するスケジューラ
+        checkpoint: 抽出結果を保存するチェックポイント
+        sink: 抽出結果を1件ずつ追記する出力
+        extract: (記事URL, 検索キーワード) のイテラブルと結果のコールバックを受け取って抽出する関数
+        sheets: 確認ごとに追記するGoogle Sheetsの出力（省略可）
+        dataset: 確認ごとに結果を追加するParquetデータセット（省略可）
+        stop: 設定されると終了するイベント
+        max_polls: 確認回数の上限（省略時は終了するまで続ける）
+        
+    Returns:
+        int: 抽出した記事数
+    """
+    stop = stop or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    
+    logger.info(f"常駐モードを開始します（{len(scheduler.keywords)}キーワード、Ctrl+Cで終了）")
+    polls = extracted = 0
+    try:
+        while not stop.is_set() and (max_polls is None or polls < max_polls):
+            keyword, wait = scheduler.next_due()
+            if wait > 0 and stop.wait(wait):
+                break
+            scheduler.keep_session_alive()
+            with metrics.timer('stage_seconds', stage='watch_poll'):
+                hits = scheduler.poll(keyword)
+            polls += 1
+            if not hits:
+                continue
+            
+            rows = []
+            
+            def on_result(info: Dict[str, str]):
+                checkpoint.record(info)
+                rows.append({**info, '検索キーワード': keyword})
+            
+            extracted += extract([(url, keyword) for url, is_new in hits if is_new], on_result)
+            # 今回の常駐中に取得済みの記事は、チェックポイントの結果をこのキーワードでも出力する
+            for url, is_new in hits:
+                if not is_new:
+                    rows.append({**(checkpoint.get(url) or scraper.empty_info(url)), '検索キーワード': keyword})
+            
+            for row in rows:
+                sink.write(row)
+                if sheets:
+                    sheets.write(row)
+            if sheets:
+                sheets.flush()
+            if dataset and rows:
+                dataset.write(rows, f'{checkpoint.run_id}_{polls:06d}')
+    except KeyboardInterrupt:
+        logger.info("中断されました")
+    
+    logger.info(f"常駐モードを終了します（確認 {polls}回、新たに抽出した記事 {extracted}件）")
+    return extracted
+
+
+def run_coordinator(work_queue, items: Iterable[tuple], on_result: Callable[[Dict[str, str]], None],
+                    poll_interval: float = 5.0, stop: Optional[threading.Event] = None) -> int:
+    """
+    分散実行のコーディネーター: 検索で見つかった記事URLを作業キューへ登録し、ワーカーの完了を待って結果を受け取る
+    
+    Ctrl+C（またはstopの設定）で待機を打ち切り、それまでに完了した記事の結果だけを受け取る。
+    
+    Args:
+        work_queue: 作業キュー（SQLiteWorkQueue / RedisWorkQueue）
+        items: (記事URL, 検索キーワード) のイテラブル（検索中のジェネレータでよい）
+        on_result: 完了した記事の抽出結果ごとに呼ばれるコールバック
+        poll_interval: 完了を確認する間隔（秒）
+        stop: 設定されると待機を打ち切るイベント
+        
+    Returns:
+        int: 受け取った結果の件数
+    """
+    stop = stop or threading.Event()
+    pushed = 0
+    with metrics.timer('stage_seconds', stage='queue_push'):
+        for url, keyword in items:
+            if work_queue.push(url, keyword):
+                pushed += 1
+    work_queue.set_search_done()
+    logger.info(f"作業キューに記事を登録しました: {pushed}件（ワーカーの完了を待っています）")
+    
+    last_counts = None
+    try:
+        while not work_queue.finished():
+            counts = work_queue.counts()
+            if counts != last_counts:
+                logger.info(f"作業キュー: 未処理 {counts['pending']}件 / 処理中 {counts['leased']}件 / 完了 {counts['done']}件")
+                last_counts = counts
+            if stop.wait(poll_interval):
+                break
+    except KeyboardInterrupt:
+        logger.info("中断されました（完了済みの記事の結果だけを出力します）")
+    
+    count = 0
+    for info, keywords in work_queue.iter_results():
+        on_result(info)
+        count += 1
+    return count
+
+
+def iter_leased_articles(work_queue, worker: str, lease_seconds: float = 300, poll_interval: float = 2.0,
+                         stop: Optional[threading.Event] = None) -> Iterator[tuple]:
+    """
+    作業キューから記事を1件ずつ借り受けて返す（キューが空の間は待ち、全記事が完了したら終わる）
+    
+    Yields:
+        tuple: (記事URL, 検索キーワード)
+    """
+    stop = stop or threading.Event()
+    while not stop.is_set():
+        leased = work_queue.lease(worker, lease_seconds)
+        if leased:
+            yield leased
+        elif work_queue.finished() or stop.wait(poll_interval):
+            return
+
+
+def run_worker(work_queue, extract: Callable[[Iterable[tuple], Callable[[Dict[str, str]], None]], int],
+               worker: Optional[str] = None, lease_seconds: float = 300, poll_interval: float = 2.0,
+               stop: Optional[threading.Event] = None) -> int:
+    """
+    分散実行のワーカー: 作業キューから記事を借り受けて抽出し、結果を共有のキューへ保存する
+    
+    同じ記事を別のワーカーが先に完了させていた場合（貸し出し期限切れでの再配布など）、結果は保存しない。
+    検索が終わって全記事が完了するか、Ctrl+C・SIGTERM（またはstopの設定）で終了する。
+    
+    Args:
+        work_queue: 作業キュー（SQLiteWorkQueue / RedisWorkQueue）
+        extract: (記事URL, 検索キーワード) のイテラブルと結果のコールバックを受け取って抽出する関数
+        worker: ワーカー名（省略時は ホスト名-プロセスID）
+        lease_seconds: 1記事の貸し出し期限（秒。期限内に完了しない記事は他のワーカーへ再配布）
+        poll_interval: キューが空の場合に再確認する間隔（秒）
+        stop: 設定されると終了するイベント
+        
+    Returns:
+        int: このワーカーが結果を保存した記事数
+    """
+    worker = worker or f'{platform.node()}-{os.getpid()}'
+    stop = stop or threading.Event()
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    
+    counts = {'completed': 0, 'duplicate': 0}
+    
+    def on_result(info: Dict[str, str]):
+        if work_queue.complete(info['記事URL'], info, worker):
+            counts['completed'] += 1
+        else:
+            counts['duplicate'] += 1
+            metrics.inc('queue_duplicate_total')
+    
+    logger.info(f"ワーカー {worker} を開始します（Ctrl+Cで終了）")
+    try:
+        extract(iter_leased_articles(work_queue, worker, lease_seconds, poll_interval, stop), on_result)
+    except KeyboardInterrupt:
+        logger.info("中断されました（処理中の記事は貸し出し期限後に他のワーカーへ再配布されます）")
+    
+    logger.info(f"ワーカー {worker} を終了します（保存 {counts['completed']}件"
+                + (f"、他のワーカーが完了済み {counts['duplicate']}件" if counts['duplicate'] else "") + "）")
+    return counts['completed']
+
+
+def main(headless=True, search_keyword=None, use_multiple_keywords=False, workers=1, parse_workers=None,
+         requests_per_second=2.0, max_requests_per_second=None, cache_dir=None, refresh_cache=False,
+         checkpoint_path='prtimes_checkpoint.sqlite3', resume=False, since_last_run=False,
+         stream_output=None, fsync=False, search_workers=4, session_path='prtimes_session.json',
+         fresh_login=False, login_mode='http', login_url=None, connect_timeout=10.0, read_timeout=30.0,
+         http2=False, metrics_json=None, metrics_port=None, profile=None, fast_path=True,
+         stream_fetch=False, max_download_kb=2048, google_sheets=False, sheets_api_base=None,
+         parquet_dir=None, watch=False, watch_interval=15, watch_min_interval=5, watch_max_interval=360,
+         work_queue_spec=None, queue_role='coordinator', lease_seconds=300):
     # 設定をconfig.pyから読み込む
     try:
         import config
@@ -1051,94 +4515,301 @@ def main(headless=True, search_keyword=None, use_multiple_keywords=False):
         SHEET_NAME = 'PR_Times_Data'
         SEARCH_KEYWORDS = [search_keyword or 'サプリ']
     
+    # 実行中のメトリクスをPrometheusから取得できるようにする（--metrics-port指定時）
+    metrics_server = metrics.serve(metrics_port) if metrics_port is not None else None
+    
+    # 記事HTMLのディスクキャッシュ
+    cache = ResponseCache(cache_dir) if cache_dir else None
+    
     # スクレイパーの初期化（ヘッドレスモードを指定）
-    scraper = PRTimesCorrectedScraper(EMAIL, PASSWORD, CREDENTIALS_PATH, headless=headless)
+    scraper = PRTimesCorrectedScraper(EMAIL, PASSWORD, CREDENTIALS_PATH, headless=headless,
+                                      requests_per_second=requests_per_second,
+                                      max_requests_per_second=max_requests_per_second,
+                                      cache=cache, refresh_cache=refresh_cache, session_path=session_path,
+                                      login_mode=login_mode, login_url=login_url,
+                                      # 記事取得と検索のスレッドが同時に接続を使うため、その合計分を保持する
+                                      pool_size=max(1, workers) + max(1, search_workers),
+                                      connect_timeout=connect_timeout, read_timeout=read_timeout, http2=http2,
+                                      fast_path=fast_path, stream_fetch=stream_fetch,
+                                      max_download_kb=max_download_kb)
     
-    # ログイン試行
-    if not scraper.login():
+    # ログイン試行（保存済みのCookieが有効ならSeleniumを起動しない）
+    if not scraper.login(force=fresh_login):
         logger.error("ログインに失敗しました。認証情報を確認してください。")
         logger.info("ログインなしで検索を続行します...")
     
-    # 全結果を格納するリスト
-    all_results = []
-    # キーワードごとの結果を格納する辞書
-    keyword_results_dict = {}
-    
-    # 各キーワードで検索
-    for keyword_index, keyword in enumerate(SEARCH_KEYWORDS, 1):
-        logger.info(f"\n{'='*50}")
-        logger.info(f"キーワード {keyword_index}/{len(SEARCH_KEYWORDS)}: '{keyword}' で検索を開始します")
-        logger.info(f"{'='*50}")
-        
-        # 記事URLの収集
-        article_urls = scraper.search_articles(keyword, max_articles=100)
-        
-        if not article_urls:
-            logger.warning(f"キーワード '{keyword}' では記事が見つかりませんでした")
-            continue
-        
-        # 各記事から情報を抽出
-        keyword_results = []
-        for i, url in enumerate(article_urls, 1):
-            logger.info(f"処理中: {i}/{len(article_urls)} - {keyword}")
-            info = scraper.extract_info(url, keyword)
-            keyword_results.append(info)
-            all_results.append(info)
-            
-            if i <= 5:
-                logger.info(f"  会社名: {info['会社名']}")
-                if info['メールアドレス']:
-                    logger.info(f"  Email: {info['メールアドレス']}")
-                if info['電話番号']:
-                    logger.info(f"  TEL: {info['電話番号']}")
-            
-            if i % 5 == 0:
-                time.sleep(2)
-            else:
-                time.sleep(0.5)
-        
-        # キーワード別の結果を辞書に保存
-        keyword_results_dict[keyword] = keyword_results
-        logger.info(f"キーワード '{keyword}' の結果: {len(keyword_results)}件")
-        
-        # キーワード間の待機時間
-        if keyword_index < len(SEARCH_KEYWORDS):
-            logger.info(f"次のキーワードまで5秒待機...")
-            time.sleep(5)
-    
-    # Excel出力（キーワードごとにシート分け）
-    if keyword_results_dict:
-        # キーワードごとにシートを分けたExcelファイルを作成
-        excel_path = write_to_excel_with_keywords(keyword_results_dict)
-        
-        # 全データを統合したDataFrameも作成（バックアップ用）
-        if all_results:
-            df = pd.DataFrame(all_results)
-            # CSVファイルに記事ごとにページを分けて保存
-            csv_path = write_to_csv_with_pages(df)
-        
-        # Google Sheetsへの書き込みはオプション（必要に応じて）
-        # write_to_google_sheets(df, SPREADSHEET_ID, SHEET_NAME)
+    # 解析を別プロセスに分離するパイプライン（--parse-workers指定時）
+    pipeline = ExtractionPipeline(scraper, workers, parse_workers) if parse_workers is not None else None
+    
+    # 複数ノードで1回のクロールを分担する作業キュー（--queue指定時）
+    work_queue = None
+    if work_queue_spec:
+        try:
+            work_queue = open_work_queue(work_queue_spec)
+        except ImportError:
+            logger.error("redisがインストールされていないため、作業キューに接続できません（pip install redis）")
+            return
+    
+    if work_queue and queue_role == 'worker':
+        # ワーカー: キューから記事を借り受けて抽出し、結果はキューへ保存する（検索・出力はコーディネーターが行う）
+        if pipeline:
+            extract = lambda items, on_result: pipeline.run_stream(items, on_result=on_result)
+        else:
+            extract = lambda items, on_result: scraper.extract_stream(items, workers=workers, on_result=on_result)
+        run_worker(work_queue, extract, lease_seconds=lease_seconds)
+        
+        logger.info(f"通信: {scraper.transport_stats.summary(scraper.session)}")
+        if metrics_json:
+            metrics.write_json(metrics_json)
+        if metrics_server:
+            metrics_server.shutdown()
+        if pipeline:
+            pipeline.close()
+        work_queue.close()
+        if cache:
+            cache.evict()
+            cache.close()
+        return
+    
+    # 抽出結果を1件ずつ保存するチェックポイント
+    checkpoint = CheckpointStore(checkpoint_path)
+    if since_last_run:
+        last_run = checkpoint.last_finished_run()
+        logger.info(f"差分取得モード: 取得済み記事 {len(checkpoint)}件"
+                    + (f"（前回の実行: {last_run:%Y-%m-%d %H:%M}）" if last_run else ""))
+    # 再開モードで復元するのは、直前に異常終了した実行で抽出済みの記事だけ
+    resume_run_id = checkpoint.interrupted_run() if resume else None
+    if resume:
+        if resume_run_id:
+            logger.info(f"再開モード: 中断した実行 {resume_run_id} で抽出済みの記事は再取得しません")
+        else:
+            logger.info("再開モード: 前回の実行は正常終了しているため、全ての記事を取得します")
+    checkpoint.start_run()
+    
+    # 抽出結果は1件ずつファイルへ追記し、全結果をメモリに保持しない
+    if stream_output is None:
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        stream_output = f'prtimes_results_{timestamp}.jsonl'
+    sink = ResultStreamWriter(stream_output, fsync=fsync)
+    logger.info(f"抽出結果の逐次出力先: {stream_output}")
+    
+    if watch:
+        # 常駐モード: 各キーワードの1ページ目を定期的に確認し、新しい記事だけを抽出して各出力へ送る
+        scheduler = WatchScheduler(scraper, SEARCH_KEYWORDS, known_urls=checkpoint.previous_urls(),
+                                   interval=watch_interval * 60, min_interval=watch_min_interval * 60,
+                                   max_interval=watch_max_interval * 60)
+        if pipeline:
+            extract = lambda items, on_result: pipeline.run_stream(items, on_result=on_result)
+        else:
+            extract = lambda items, on_result: scraper.extract_stream(items, workers=workers, on_result=on_result)
+        sheets = None
+        if google_sheets:
+            try:
+                if sheets_api_base:
+                    sheets = GoogleSheetsWriter(requests.Session(), SPREADSHEET_ID, SHEET_NAME, api_base=sheets_api_base)
+                else:
+                    sheets = GoogleSheetsWriter.from_credentials(CREDENTIALS_PATH, SPREADSHEET_ID, SHEET_NAME)
+            except Exception as e:
+                logger.error(f"Google Sheetsに接続できないため、Sheetsへの追記をスキップします: {e}")
+        dataset = None
+        if parquet_dir:
+            try:
+                dataset = ResultDataset(parquet_dir)
+            except ImportError:
+                logger.warning("pyarrowがインストールされていないため、Parquet出力をスキップします（pip install pyarrow）")
+        
+        run_watch(scraper, scheduler, checkpoint, sink, extract, sheets=sheets, dataset=dataset)
+        
+        sink.close()
+        logger.info(f"抽出結果: {stream_output}（{sink.count}件）")
+        logger.info(f"通信: {scraper.transport_stats.summary(scraper.session)}")
+        if metrics_json:
+            metrics.write_json(metrics_json)
+        if metrics_server:
+            metrics_server.shutdown()
+        if pipeline:
+            pipeline.close()
+        checkpoint.finish_run()
+        checkpoint.close()
+        if cache:
+            cache.evict()
+            cache.close()
+        return
+    
+    # 実行全体での記事URLインデックス（URLとヒットしたキーワードのみ保持）
+    article_index = ArticleIndex()
+    # キーワードごとの出力件数（冒頭5件はログに表示）
+    emitted_counts = {}
+    
+    def write_result(item):
+        keyword, url, info = item
+        if info is None and url in positions:
+            return  # 元の記事の結果が届かなかった（flushで渡された場合のみ）
+        if info is None:
+            # 他のキーワードで抽出済みの記事（発見順に出力するため、元の記事は既に保存済み）
+            info = checkpoint.get(url) or scraper.empty_info(url, keyword)
+        sink.write({**info, '検索キーワード': keyword})
+        
+        emitted_counts[keyword] = emitted_counts.get(keyword, 0) + 1
+        if emitted_counts[keyword] <= 5:
+            logger.info(f"  [{keyword}] 会社名: {info['会社名']}")
+            if info['メールアドレス']:
+                logger.info(f"  [{keyword}] Email: {info['メールアドレス']}")
+            if info['電話番号']:
+                logger.info(f"  [{keyword}] TEL: {info['電話番号']}")
+    
+    # 結果は発見順に出力する（並列取得で前後した分は並べ直す）
+    emit = InOrderCallback(write_result)
+    positions = {}
+    reuse_counts = {'reused': 0, 'restored': 0}
+    
+    def new_articles():
+        """検索で見つかった記事のうち、取得が必要なものを見つけ次第返す"""
+        scheduler = SearchScheduler(scraper, SEARCH_KEYWORDS, max_articles=100, workers=search_workers,
+                                    known_urls=checkpoint.previous_urls() if since_last_run else None)
+        for index, (keyword, url) in enumerate(scheduler):
+            is_new = article_index.add(url, keyword)
+            if not is_new:
+                # 他のキーワードで取得済み・取得中の記事は再取得しない
+                reuse_counts['reused'] += 1
+                emit(index, (keyword, url, None))
+                continue
+            if resume_run_id:
+                # 再開モードでは中断した実行で抽出済みの記事をチェックポイントから復元（キーワードは今回の検索のもの）
+                stored = checkpoint.get(url, run_id=resume_run_id)
+                if stored:
+                    restored = {**stored, '検索キーワード': keyword}
+                    # この実行の結果として保存し直す（この実行も中断した場合に次の再開で引き継ぐ）
+                    checkpoint.record(restored)
+                    reuse_counts['restored'] += 1
+                    emit(index, (keyword, url, restored))
+                    continue
+            positions[url] = (index, keyword)
+            yield url, keyword
+    
+    def on_extracted(info):
+        checkpoint.record(info)
+        index, keyword = positions.pop(info['記事URL'])
+        emit(index, (keyword, info['記事URL'], info))
+    
+    # 検索・取得・解析のループをプロファイル（--profile指定時）
+    profiler = Profiler(profile) if profile else None
+    if profiler:
+        if pipeline:
+            logger.warning("--parse-workers指定時は解析プロセス内の処理はプロファイルされません")
+        profiler.start()
+    
+    # 検索と並行して各記事から情報を抽出（リクエスト間隔はレートリミッターで制御、結果は1件ずつ保存）
+    if work_queue:
+        # コーディネーター: 記事URLをキューへ登録し、ワーカーが抽出した結果を受け取る
+        if resume:
+            work_queue.set_search_done(False)
+        else:
+            work_queue.clear()
+        extracted_count = run_coordinator(
+            work_queue, new_articles(),
+            # 再開時のキューには前回の検索で登録した記事も残るため、今回の検索で見つかった記事だけを出力する
+            on_result=lambda info: on_extracted(info) if info['記事URL'] in positions else None)
+        work_queue.close()
+    elif pipeline:
+        extracted_count = pipeline.run_stream(new_articles(), on_result=on_extracted)
+    else:
+        extracted_count = scraper.extract_stream(new_articles(), workers=workers, on_result=on_extracted)
+    
+    # 欠番（ワーカーの停止・中断・抽出エラーで結果が届かなかった記事）の後ろで止まっている結果を出力する
+    if emit.flush():
+        logger.warning(f"結果が届かなかった記事: {len(positions)}件（出力をスキップ）")
+    
+    if profiler:
+        for path in profiler.stop():
+            logger.info(f"プロファイル結果を保存しました: {path}")
+    
+    logger.info(f"新たに抽出した記事: {extracted_count}件")
+    if reuse_counts['reused']:
+        logger.info(f"他のキーワードで取得済みの記事: {reuse_counts['reused']}件（再取得をスキップ）")
+    if reuse_counts['restored']:
+        logger.info(f"チェックポイントから復元: {reuse_counts['restored']}件（再取得をスキップ）")
+    
+    sink.close()
+    
+    # 逐次出力したファイルからExcel・CSVを作成（各記事にはヒットした全てのキーワードを紐付ける）
+    membership = load_keyword_membership(stream_output, SEARCH_KEYWORDS)
+    if membership:
+        # キーワードごとにシートを分けたExcelファイルを作成（1行ずつ書き込む）
+        with metrics.timer('stage_seconds', stage='write_excel'):
+            excel_path = write_keyword_rows_to_excel(iter_keyword_rows(stream_output, membership))
+        
+        # CSVファイルに記事ごとにページを分けて保存（バックアップ用）
+        with metrics.timer('stage_seconds', stage='write_csv'):
+            csv_path = write_rows_to_csv_with_pages(iter_unique_articles(stream_output, membership))
+        
+        # 実行日・キーワード別のParquetデータセットに追加（--parquet-dir指定時）
+        if parquet_dir:
+            try:
+                with metrics.timer('stage_seconds', stage='write_parquet'):
+                    parquet_rows = ResultDataset(parquet_dir).write(iter_stream_records(stream_output), checkpoint.run_id)
+                logger.info(f"Parquetデータセットに追加しました: {parquet_dir}（{parquet_rows}行）")
+            except ImportError:
+                logger.warning("pyarrowがインストールされていないため、Parquet出力をスキップします（pip install pyarrow）")
+        
+        # Google Sheetsへ未登録の記事だけを追記（--google-sheets指定時）
+        if google_sheets:
+            with metrics.timer('stage_seconds', stage='write_sheets'):
+                write_to_google_sheets(iter_unique_articles(stream_output, membership), SPREADSHEET_ID, SHEET_NAME,
+                                       credentials_path=CREDENTIALS_PATH,
+                                       session=requests.Session() if sheets_api_base else None,
+                                       api_base=sheets_api_base)
     else:
         logger.warning("結果が空のため、ファイルの作成をスキップします")
     
+    # 全結果をまとめて正規化・検証し、集計と会社別の連絡先一覧を作成
+    with metrics.timer('stage_seconds', stage='postprocess'):
+        results = postprocess_results(load_results_frame(stream_output))
+        articles = results.drop_duplicates('記事URL')
+        article_count = len(articles)
+        email_count = int(articles['メールアドレス'].ne('').sum())
+        phone_count = int(articles['電話番号'].ne('').sum())
+        keyword_stats = keyword_statistics(results, SEARCH_KEYWORDS)
+        if article_count:
+            write_contacts_csv(dedupe_contacts_by_company(results))
+    
     logger.info(f"\n{'='*50}")
     logger.info(f"処理が完了しました。")
     logger.info(f"{'='*50}")
     logger.info(f"検索キーワード数: {len(SEARCH_KEYWORDS)}個")
-    logger.info(f"収集した記事数: {len(all_results)}件")
-    
-    email_count = sum(1 for r in all_results if r['メールアドレス'])
-    phone_count = sum(1 for r in all_results if r['電話番号'])
+    logger.info(f"収集した記事数: {article_count}件（重複除外後）")
     logger.info(f"メールアドレス取得数: {email_count}件")
     logger.info(f"電話番号取得数: {phone_count}件")
     
-    # キーワード別の集計
+    # キーワード別の集計（複数キーワードにヒットした記事はそれぞれに計上）
     logger.info(f"\nキーワード別集計:")
-    for keyword in SEARCH_KEYWORDS:
-        keyword_count = sum(1 for r in all_results if r.get('検索キーワード') == keyword)
-        if keyword_count > 0:
-            logger.info(f"  {keyword}: {keyword_count}件")
+    for keyword, row in keyword_stats.iterrows():
+        logger.info(f"  {keyword}: {row['記事数']}件（メール {row['メールアドレス']}件 / 電話 {row['電話番号']}件）")
+    logger.info(f"通信: {scraper.transport_stats.summary(scraper.session)}")
+    if stream_fetch:
+        logger.info(f"逐次受信: 問い合わせ先の受信後に打ち切り {metrics.value('stream_fetch_total', reason='contact'):.0f}件"
+                    f" / 上限で打ち切り {metrics.value('stream_fetch_total', reason='size_cap'):.0f}件"
+                    f" / 全体を受信 {metrics.value('stream_fetch_total', reason='complete'):.0f}件")
+    fast_count = metrics.value('extraction_path_total', path='fast')
+    full_count = metrics.value('extraction_path_total', path='full')
+    if fast_count + full_count:
+        logger.info(f"抽出経路: 高速抽出 {fast_count:.0f}件 / 通常の抽出 {full_count:.0f}件"
+                    f"（高速抽出のヒット率 {fast_count / (fast_count + full_count):.0%}）")
+    logger.info("段階別の所要時間:")
+    metrics.log_stages()
+    if metrics_json:
+        metrics.write_json(metrics_json)
+    if metrics_server:
+        metrics_server.shutdown()
+    
+    if pipeline:
+        pipeline.close()
+    checkpoint.finish_run()
+    checkpoint.close()
+    
+    if cache:
+        cache.evict()
+        cache.close()
 
 
 
@@ -1150,9 +4821,57 @@ if __name__ == '__main__':
     parser.add_argument('--keyword', '-k', type=str, help='検索キーワード（例: --keyword "美容"）')
     parser.add_argument('--no-headless', action='store_true', help='ブラウザを表示して実行')
     parser.add_argument('--multiple', '-m', action='store_true', help='複数キーワードモード（config.pyのSEARCH_KEYWORDSを使用）')
+    parser.add_argument('--workers', '-w', type=int, default=1, help='記事取得の同時実行数（デフォルト: 1）')
+    parser.add_argument('--search-workers', type=int, default=4, help='同時に検索するキーワード数（デフォルト: 4）')
+    parser.add_argument('--parse-workers', type=int, default=None, help='解析を別プロセスで実行する場合のプロセス数（0でCPUコア数、省略時は取得スレッド内で解析）')
+    parser.add_argument('--rps', type=float, default=2.0, help='全体での1秒あたりの開始リクエスト数（デフォルト: 2.0）')
+    parser.add_argument('--max-rps', type=float, default=None, help='正常応答が続いた場合に引き上げるリクエスト数の上限（デフォルト: --rpsと同じ）')
+    parser.add_argument('--cache-dir', type=str, default=None, help='記事HTMLのキャッシュ保存先ディレクトリ（指定時のみキャッシュを使用）')
+    parser.add_argument('--refresh', action='store_true', help='キャッシュを使わずに記事を再取得（取得結果はキャッシュを更新）')
+    parser.add_argument('--checkpoint-db', type=str, default='prtimes_checkpoint.sqlite3', help='抽出結果を1件ずつ保存するチェックポイントのパス')
+    parser.add_argument('--resume', action='store_true', help='直前に異常終了した実行でチェックポイントに保存済みの記事は再取得せずに再開')
+    parser.add_argument('--stream-output', type=str, default=None, help='抽出結果を1件ずつ追記するファイル（.jsonl/.csv、省略時はprtimes_results_日時.jsonl）')
+    parser.add_argument('--fsync', action='store_true', help='逐次出力の1件ごとにfsyncしてディスクへの書き込みを保証')
+    parser.add_argument('--since-last-run', action='store_true', help='前回までに取得済みの記事に到達した時点で検索を打ち切り、差分だけを取得')
     
+    parser.add_argument('--session-file', type=str, default='prtimes_session.json', help='ログインCookieとChromeDriverパスの保存先（有効なCookieがあればSeleniumを起動しない）')
+    parser.add_argument('--fresh-login', action='store_true', help='保存済みのCookieを使わずにログインし直す（方法は--login-modeに従う）')
+    parser.add_argument('--login-mode', choices=PRTimesCorrectedScraper.LOGIN_MODES, default='http', help='ログイン方法（http: フォーム送信、selenium: ブラウザ操作、auto: 失敗時のみSelenium。デフォルト: http）')
+    parser.add_argument('--login-url', type=str, default=None, help='ログインページのURL（検証用のローカルサーバーを指定する場合）')
+    parser.add_argument('--connect-timeout', type=float, default=10.0, help='接続タイムアウト秒数（デフォルト: 10）')
+    parser.add_argument('--read-timeout', type=float, default=30.0, help='応答待ちタイムアウト秒数（デフォルト: 30）')
+    parser.add_argument('--http2', action='store_true', help="HTTP/2で接続（httpx[http2]が必要。未インストール時はHTTP/1.1）")
+    parser.add_argument('--metrics-json', type=str, default=None, help='段階別の所要時間・通信量などのメトリクスを書き出すJSONファイル')
+    parser.add_argument('--metrics-port', type=int, default=None, help='実行中のメトリクスをPrometheus形式で公開するポート（http://127.0.0.1:PORT/metrics）')
+    parser.add_argument('--profile', nargs='?', const='cprofile', choices=Profiler.MODES, default=None, help='検索・取得・解析のループをプロファイル（cprofile: .prof、sample: flamegraph用の.folded。省略時はcprofile）')
+    parser.add_argument('--no-fast-path', action='store_true', help='問い合わせ先ブロックだけを処理する高速抽出を使わず、常に記事全体を解析')
+    parser.add_argument('--stream-fetch', action='store_true', help='記事ページを逐次受信し、問い合わせ先を含む本文エリアを受信した時点で打ち切る')
+    parser.add_argument('--max-download-kb', type=float, default=2048, help='--stream-fetch時に1記事あたり受信する上限KB（デフォルト: 2048、0で無制限）')
+    parser.add_argument('--google-sheets', action='store_true', help='結果をconfig.pyのSPREADSHEET_ID/SHEET_NAMEのシートへ追記（既にシートにある記事URLは追記しない）')
+    parser.add_argument('--sheets-api-base', type=str, default=None, help='Sheets APIのベースURL（検証用のローカルサーバーを指定する場合。認証なしで接続）')
+    parser.add_argument('--parquet-dir', type=str, default=None, help='結果を実行日・キーワード別のParquetデータセットに追加するディレクトリ（pyarrowが必要）')
+    parser.add_argument('--watch', action='store_true', help='常駐モード: 各キーワードの検索結果1ページ目を定期的に確認し、新しい記事だけを抽出（Ctrl+Cで終了）')
+    parser.add_argument('--watch-interval', type=float, default=15, help='常駐モードの最初の確認間隔（分、デフォルト: 15）')
+    parser.add_argument('--watch-min-interval', type=float, default=5, help='常駐モードの確認間隔の下限（分、デフォルト: 5）')
+    parser.add_argument('--watch-max-interval', type=float, default=360, help='常駐モードの確認間隔の上限（分、デフォルト: 360）')
+    parser.add_argument('--queue', type=str, default=None, help='複数ノードで分担する作業キュー（redis://host:port/db、または1台のホスト内で分担する場合はSQLiteファイルのパス）')
+    parser.add_argument('--role', choices=['coordinator', 'worker'], default='coordinator', help='--queue指定時の役割（coordinator: 検索と出力、worker: 記事の抽出。デフォルト: coordinator）')
+    parser.add_argument('--lease-seconds', type=float, default=300, help='ワーカーへの記事の貸し出し期限（秒、デフォルト: 300。期限内に完了しない記事は他のワーカーへ再配布）')
     args = parser.parse_args()
     
     # 実行
     headless_mode = not args.no_headless
-    main(headless=headless_mode, search_keyword=args.keyword, use_multiple_keywords=args.multiple)
\ No newline at end of file
+    main(headless=headless_mode, search_keyword=args.keyword, use_multiple_keywords=args.multiple,
+         workers=args.workers, parse_workers=args.parse_workers, requests_per_second=args.rps, max_requests_per_second=args.max_rps,
+         cache_dir=args.cache_dir, refresh_cache=args.refresh,
+         checkpoint_path=args.checkpoint_db, resume=args.resume, since_last_run=args.since_last_run,
+         stream_output=args.stream_output, fsync=args.fsync, search_workers=args.search_workers,
+         session_path=args.session_file, fresh_login=args.fresh_login,
+         login_mode=args.login_mode, login_url=args.login_url,
+         connect_timeout=args.connect_timeout, read_timeout=args.read_timeout, http2=args.http2,
+         metrics_json=args.metrics_json, metrics_port=args.metrics_port, profile=args.profile,
+         fast_path=not args.no_fast_path, stream_fetch=args.stream_fetch, max_download_kb=args.max_download_kb,
+         google_sheets=args.google_sheets, sheets_api_base=args.sheets_api_base, parquet_dir=args.parquet_dir,
+         watch=args.watch, watch_interval=args.watch_interval, watch_min_interval=args.watch_min_interval,
+         watch_max_interval=args.watch_max_interval, work_queue_spec=args.queue, queue_role=args.role,
+         lease_seconds=args.lease_seconds)
\ No newline at end of file
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import sys
+
+import pandas as pd
+
+from prtimes_corrected_scraper import ResultDataset
+
+
+def main():
+    parser = argparse.ArgumentParser(description='PR Times 抽出結果のParquetデータセットを検索（--parquet-dirで蓄積したもの）')
+    parser.add_argument('--dataset', required=True, help='Parquetデータセットのディレクトリ（--parquet-dirに指定したもの）')
+    query = parser.add_mutually_exclusive_group(required=True)
+    query.add_argument('--new-since', metavar='YYYY-MM-DD', help='この日以降の実行で初めて現れた連絡先を表示')
+    query.add_argument('--company', help='会社名にこの文字列を含む全てのリリースを表示')
+    parser.add_argument('--output', help='結果を書き出すCSVファイル（省略時は画面に表示）')
+    args = parser.parse_args()
+
+    try:
+        dataset = ResultDataset(args.dataset)
+    except ImportError:
+        sys.exit("pyarrowがインストールされていません（pip install pyarrow）")
+
+    if args.new_since:
+        result = dataset.new_contacts_since(args.new_since)
+        print(f"{args.new_since}以降に初めて現れた連絡先: {len(result)}件")
+    else:
+        result = dataset.releases_for_company(args.company)
+        print(f"会社名に「{args.company}」を含むリリース: {len(result)}件")
+
+    if args.output:
+        result.to_csv(args.output, index=False, encoding='utf-8-sig')
+        print(f"CSVを書き出しました: {args.output}")
+    elif not result.empty:
+        with pd.option_context('display.max_rows', None, 'display.max_columns', None, 'display.width', None):
+            print(result.to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+import http.server
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def local_server():
+    """
+    ハンドラークラスを受け取り、ローカルのHTTPサーバーを起動してベースURLを返す（テスト終了時に停止）
+    """
+    servers = []
+
+    def start(handler_class) -> str:
+        server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler_class)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f'http://127.0.0.1:{server.server_port}'
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""高速抽出（問い合わせ先ブロックのみ処理）と記事全体の解析が同じ結果を返すことを検証"""
+import pytest
+
+import prtimes_corrected_scraper as scraper_module
+
+FIELDS = ['会社名', '担当者名', 'メールアドレス', '電話番号']
+
+
+def page(body: str, head: str = '') -> str:
+    return f'<html><head><meta charset="utf-8">{head}</head><body>{body}</body></html>'
+
+
+CORPUS = {
+    'contact_paragraph': page(
+        '<main><div class="release-company">サンプル株式会社</div><p>新商品を発売します。</p>'
+        '<div>【本件に関するお問い合わせ】サンプル株式会社 広報部 担当：山田 太郎 '
+        'TEL：03-1234-5678 E-mail：pr@sample.co.jp</div></main>'),
+    'labelled_table_and_contact_paragraph': page(
+        '<main><p>新商品を発売します。</p>'
+        '<table><tr><th>メール</th><td>pr@sample.co.jp</td></tr><tr><th>TEL</th><td>03-1234-5678</td></tr></table>'
+        '<p>【本件に関するお問い合わせ】 press@sample.jp 電話：06-1111-2222</p></main>'),
+    'contact_div_before_list': page(
+        '<main><div>【報道関係者のお問い合わせ先】担当：佐藤 mail: press@sample.jp TEL: 06-1111-2222</div>'
+        '<ul><li>E-mail：info@sample.co.jp</li><li>TEL：03-9999-8888</li></ul></main>'),
+    'contact_paragraph_then_company_table': page(
+        '<main><p>【本件に関するお問い合わせ】広報 press@sample.jp TEL 06-1111-2222</p>'
+        '<table><tr><td>会社名</td><td>サンプル株式会社</td></tr>'
+        '<tr><td>電話番号</td><td>03-5555-6666</td></tr></table></main>'),
+    'strong_label_followed_by_element': page(
+        '<main><div>【本件に関するお問い合わせ】<strong>TEL</strong><span>03-2222-3333</span> '
+        'Email: contact@sample.co.jp</div></main>'),
+    'obfuscated_email': page(
+        '<main><div>＜報道関係者お問い合わせ先＞ 株式会社テスト 広報担当：鈴木 '
+        'Mail：pr[at]test.co.jp TEL：０３－１２３４－００００</div></main>'),
+    'contact_table_with_keyword': page(
+        '<article><p>本文</p><table><tr><td>お問い合わせ先</td><td>株式会社テスト</td></tr>'
+        '<tr><td>MAIL</td><td>pr@test.co.jp</td></tr><tr><td>TEL</td><td>03-1111-2222</td></tr></table></article>'),
+    'no_content_area_with_chrome': page(
+        '<header><table><tr><td>メール</td><td>header@prtimes.example</td></tr></table></header>'
+        '<div class="body">【本件に関するお問い合わせ】 pr@sample.co.jp TEL 03-1234-5678</div>'
+        '<footer><p>お問い合わせ support@footer.example 0120-000-000 Copyright PR TIMES</p></footer>'),
+    'heading_only_paragraph': page(
+        '<main><p>【本件に関するお問い合わせ】</p><p>株式会社テスト 広報部 田中</p>'
+        '<p>TEL：03-4444-5555 / Email：info@test.co.jp</p></main>'),
+    'og_site_name_company': page(
+        '<main><section>【取材に関するお問い合わせ】 担当：高橋 pr@example.co.jp 電話 045-123-4567</section></main>',
+        head='<meta property="og:site_name" content="株式会社メタのプレスリリース">'),
+    'email_only': page(
+        '<main><div>【本件に関するお問い合わせ】 pr@sample.co.jp</div></main>'),
+    'header_table_with_content_area': page(
+        '<header><table><tr><td>TEL</td><td>03-0000-1111</td></tr></table></header>'
+        '<main><div>【本件に関するお問い合わせ】 pr@sample.co.jp TEL 06-2222-3333</div></main>'),
+}
+
+
+@pytest.fixture(scope='module')
+def scrapers():
+    return (scraper_module.PRTimesCorrectedScraper('', '', '', fast_path=True),
+            scraper_module.PRTimesCorrectedScraper('', '', '', fast_path=False))
+
+
+@pytest.mark.parametrize('name', sorted(CORPUS))
+def test_fast_path_matches_full_path(scrapers, name):
+    fast, full = scrapers
+    html = CORPUS[name]
+
+    fast_info = fast.parse_article(html, name)
+    full_info = full.parse_article(html, name)
+
+    assert {field: fast_info[field] for field in FIELDS} == {field: full_info[field] for field in FIELDS}
+
+
+def test_fast_path_is_used_for_simple_contact_blocks(scrapers):
+    fast, _ = scrapers
+    before = scraper_module.metrics.value('extraction_path_total', path='fast')
+
+    fast.parse_article(CORPUS['contact_paragraph'], 'contact_paragraph')
+
+    assert scraper_module.metrics.value('extraction_path_total', path='fast') == before + 1
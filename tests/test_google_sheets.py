@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+"""Google Sheetsへの一括追記をローカルのSheets APIスタブで検証"""
+import http.server
+import json
+import urllib.parse
+
+import pytest
+import requests
+
+import prtimes_corrected_scraper as scraper_module
+
+SHEET_NAME = "Sheet's"
+
+
+class FakeSheetsHandler(http.server.BaseHTTPRequestHandler):
+    """values:batchGet / values:batchUpdate / values:append だけを実装したSheets API"""
+
+    sheet = []
+    calls = []
+    fail_next_append = False
+
+    def _send(self, status, payload, headers=()):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        type(self).calls.append(('GET', url.path, None))
+        ranges = query['ranges'][0]
+        if ranges.endswith('!1:1'):
+            values = self.sheet[:1]
+        else:
+            values = [[row[0] for row in self.sheet[1:]]] if self.sheet[1:] else []
+        self._send(200, {'valueRanges': [{'range': ranges, 'values': values} if values else {'range': ranges}]})
+
+    def do_POST(self):
+        url = urllib.parse.urlparse(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        path = urllib.parse.unquote(url.path)
+        if path.endswith(':append'):
+            type(self).calls.append(('append', path, len(body['values'])))
+            if type(self).fail_next_append:
+                type(self).fail_next_append = False
+                return self._send(429, {}, [('Retry-After', '0')])
+            if query.get('valueInputOption') != ['RAW']:
+                return self._send(400, {'error': 'valueInputOption must be RAW'})
+            self.sheet.extend(body['values'])
+        else:
+            type(self).calls.append(('batchUpdate', path, None))
+            self.sheet[:1] = body['data'][0]['values']
+        self._send(200, {})
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_base(local_server):
+    FakeSheetsHandler.sheet = []
+    FakeSheetsHandler.calls = []
+    FakeSheetsHandler.fail_next_append = False
+    return local_server(FakeSheetsHandler) + '/v4'
+
+
+def make_rows(count, start=0):
+    return [dict(scraper_module.PRTimesCorrectedScraper.empty_info(f'https://example.com/{i}', '美容'),
+                 会社名=f'会社{i}') for i in range(start, start + count)]
+
+
+def write(rows, api_base):
+    return scraper_module.write_to_google_sheets(rows, 'SPREADSHEET', SHEET_NAME, session=requests.Session(),
+                                                 api_base=api_base, requests_per_minute=6000)
+
+
+def test_appends_in_batches_with_header(api_base):
+    writer = write(make_rows(1200), api_base)
+
+    assert writer.appended == 1200
+    sheet = FakeSheetsHandler.sheet
+    assert sheet[0] == scraper_module.ResultStreamWriter.COLUMNS
+    assert len(sheet) == 1201
+    assert sheet[1][0] == 'https://example.com/0'
+    appends = [size for kind, _, size in FakeSheetsHandler.calls if kind == 'append']
+    assert appends == [500, 500, 200]
+    # シート名の ' はA1表記でエスケープされる
+    assert all("'Sheet''s'" in path for kind, path, _ in FakeSheetsHandler.calls if kind == 'append')
+
+
+def test_skips_urls_already_in_sheet(api_base):
+    write(make_rows(10), api_base)
+    FakeSheetsHandler.calls = []
+
+    writer = write(make_rows(11), api_base)
+
+    assert (writer.appended, writer.skipped) == (1, 10)
+    assert len(FakeSheetsHandler.sheet) == 12
+    assert [kind for kind, _, _ in FakeSheetsHandler.calls] == ['GET', 'GET', 'append']
+
+
+def test_formula_like_values_are_written_raw(api_base):
+    write([dict(make_rows(1)[0], 会社名='=IMPORTXML("x")')], api_base)
+
+    assert FakeSheetsHandler.sheet[1][2] == '=IMPORTXML("x")'
+
+
+def test_rate_limited_append_is_retried(api_base):
+    FakeSheetsHandler.fail_next_append = True
+
+    writer = write(make_rows(3), api_base)
+
+    assert writer.appended == 3
+    assert len(FakeSheetsHandler.sheet) == 4
+    assert [size for kind, _, size in FakeSheetsHandler.calls if kind == 'append'] == [3, 3]
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""HTTP/2アダプター（httpx）がrequestsのstream・プロキシ・Cookieの扱いを引き継ぐことを検証"""
+import http.server
+import threading
+
+import pytest
+import requests
+
+import prtimes_corrected_scraper as scraper_module
+
+pytest.importorskip('httpx')
+
+BODY_SIZE = 32 * 1024 * 1024
+
+
+class LargePageHandler(http.server.BaseHTTPRequestHandler):
+    """大きな記事ページを返し、受け取ったリクエストのパスと最後まで送信できたかを記録するハンドラー"""
+
+    paths = []
+    sent_all = None
+    done = None
+
+    def do_GET(self):
+        type(self).paths.append(self.path)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(BODY_SIZE))
+        self.send_header('Set-Cookie', 'sid=ok; Path=/')
+        self.end_headers()
+        chunk = b'<p>' + b'x' * 1017 + b'</p>'  # 1KB
+        try:
+            for _ in range(BODY_SIZE // len(chunk)):
+                self.wfile.write(chunk)
+            type(self).sent_all = True
+        except (BrokenPipeError, ConnectionResetError):
+            type(self).sent_all = False  # 受信側が打ち切った
+        finally:
+            type(self).done.set()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url(local_server):
+    LargePageHandler.paths = []
+    LargePageHandler.sent_all = None
+    LargePageHandler.done = threading.Event()
+    return local_server(LargePageHandler)
+
+
+def make_session():
+    session = requests.Session()
+    # ローカルのサーバーはhttpのため、httpにもアダプターをマウントする（HTTP/1.1で接続）
+    session.mount('http://', scraper_module.Http2Adapter())
+    return session
+
+
+def test_stream_reads_only_consumed_chunks(server_url):
+    session = make_session()
+
+    response = session.get(server_url + '/r/1', stream=True)
+    received = 0
+    for chunk in response.iter_content(16 * 1024):
+        received += len(chunk)
+        if received >= 64 * 1024:
+            break
+    response.close()
+
+    assert LargePageHandler.done.wait(10)
+    assert LargePageHandler.sent_all is False
+    assert session.cookies.get('sid') == 'ok'
+
+
+def test_full_body_without_stream(server_url):
+    response = make_session().get(server_url + '/r/1')
+
+    assert len(response.content) == BODY_SIZE
+    assert LargePageHandler.sent_all is True
+
+
+def test_request_goes_through_proxy(server_url):
+    response = make_session().get('http://prtimes.invalid/r/1', stream=True, proxies={'http': server_url})
+    response.close()
+
+    assert LargePageHandler.paths == ['http://prtimes.invalid/r/1']
+
+
+def test_stream_fetch_stops_at_download_cap(server_url):
+    scraper = scraper_module.PRTimesCorrectedScraper('', '', '', requests_per_second=0, http2=True,
+                                                     stream_fetch=True, max_download_kb=64)
+    scraper.session.mount('http://', scraper_module.Http2Adapter())
+
+    body, complete = scraper._read_article_body(scraper._get(server_url + '/r/1', stream=True), server_url + '/r/1')
+
+    assert not complete
+    assert 64 * 1024 <= len(body) < BODY_SIZE
+    assert LargePageHandler.done.wait(10)
+    assert LargePageHandler.sent_all is False
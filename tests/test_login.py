@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""HTTPログイン（フォーム送信・Cookieの保存と復元）をローカルのログインサーバーで検証"""
+import http.server
+import urllib.parse
+
+import pytest
+
+import prtimes_corrected_scraper as scraper_module
+
+EMAIL = 'user@example.com'
+PASSWORD = 'secret'
+TOKEN = 'csrf-token-1'
+
+
+class FakeLoginHandler(http.server.BaseHTTPRequestHandler):
+    """CSRFトークン付きのログインフォームと、ログイン済みの場合だけ表示されるマイページ"""
+
+    posts = 0
+
+    def do_GET(self):
+        if self.path.startswith('/main/html/medialogin'):
+            body = (
+                '<html><head><meta name="csrf-token" content="' + TOKEN + '"></head><body>'
+                '<form method="post" action="/main/html/medialogin/do">'
+                '<input type="hidden" name="_token" value="' + TOKEN + '">'
+                '<input name="mail"><input type="password" name="pass">'
+                '<button type="submit">ログイン</button></form></body></html>'
+            ).encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        elif self.path == '/mypage':
+            if 'sid=ok' in (self.headers.get('Cookie') or ''):
+                body = b'<a>Logout</a>'
+                self.send_response(200)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            else:
+                self.send_response(302)
+                self.send_header('Location', '/main/html/medialogin')
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+        else:
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+    def do_POST(self):
+        type(self).posts += 1
+        form = urllib.parse.parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        if form.get('_token') == [TOKEN] and form.get('mail') == [EMAIL] and form.get('pass') == [PASSWORD]:
+            self.send_response(302)
+            self.send_header('Set-Cookie', 'sid=ok; Path=/')
+            self.send_header('Location', '/mypage')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            body = '<form><input name="mail"><input name="pass"></form>ログインに失敗しました'.encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def login_url(local_server):
+    FakeLoginHandler.posts = 0
+    return local_server(FakeLoginHandler) + '/main/html/medialogin'
+
+
+def make_scraper(login_url, password=PASSWORD, session_path=None):
+    return scraper_module.PRTimesCorrectedScraper(EMAIL, password, '', login_url=login_url,
+                                                  requests_per_second=0, session_path=session_path)
+
+
+def test_http_login_submits_form(login_url):
+    assert make_scraper(login_url).login(force=True)
+    assert FakeLoginHandler.posts == 1
+
+
+def test_saved_cookie_is_reused(login_url, tmp_path):
+    session_path = str(tmp_path / 'session.json')
+    assert make_scraper(login_url, session_path=session_path).login(force=True)
+
+    assert make_scraper(login_url, session_path=session_path).login()
+    assert FakeLoginHandler.posts == 1  # 保存済みのCookieが有効なためフォームを再送信しない
+
+
+def test_wrong_password_fails(login_url):
+    assert not make_scraper(login_url, password='wrong').login()
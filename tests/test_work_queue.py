@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""分散実行の作業キュー（SQLite / Redis互換）の貸し出し・再配布・1回だけの完了を検証"""
+import threading
+import time
+
+import pytest
+
+import prtimes_corrected_scraper as scraper_module
+
+
+@pytest.fixture(params=['sqlite', 'redis'])
+def work_queue(request, tmp_path):
+    if request.param == 'sqlite':
+        work_queue = scraper_module.open_work_queue(str(tmp_path / 'queue.sqlite3'))
+    else:
+        fakeredis = pytest.importorskip('fakeredis')
+        work_queue = scraper_module.RedisWorkQueue(fakeredis.FakeRedis(decode_responses=True))
+    work_queue.clear()
+    yield work_queue
+    work_queue.close()
+
+
+def info(url, company=''):
+    return dict(scraper_module.PRTimesCorrectedScraper.empty_info(url), 会社名=company)
+
+
+def fake_extract(items, on_result):
+    count = 0
+    for url, keyword in items:
+        on_result(info(url, 'C-' + url))
+        count += 1
+    return count
+
+
+def test_push_dedupes_urls_and_keeps_keywords(work_queue):
+    assert work_queue.push('https://example.com/1', '美容')
+    assert not work_queue.push('https://example.com/1', 'AGA')
+    assert work_queue.push('https://example.com/2', 'AGA')
+
+    assert work_queue.counts() == {'pending': 2, 'leased': 0, 'done': 0}
+    assert work_queue.lease('w1') == ('https://example.com/1', '美容')
+    assert work_queue.complete('https://example.com/1', info('https://example.com/1'), 'w1')
+    assert [keywords for _, keywords in work_queue.iter_results()] == [['美容', 'AGA']]
+
+
+def test_expired_lease_is_redistributed_and_completed_once(work_queue):
+    url = 'https://example.com/1'
+    work_queue.push(url, '美容')
+    assert work_queue.lease('slow-worker', lease_seconds=0.01) == (url, '美容')
+    assert work_queue.lease('w2') is None  # 期限内は他のワーカーに渡さない
+
+    time.sleep(0.05)
+    assert work_queue.lease('w2', lease_seconds=60) == (url, '美容')
+
+    assert work_queue.complete(url, info(url, 'first'), 'w2')
+    assert not work_queue.complete(url, info(url, 'late'), 'slow-worker')
+    assert [result['会社名'] for result, _ in work_queue.iter_results()] == ['first']
+    assert work_queue.lease('w3') is None
+
+
+def test_finished_waits_for_search(work_queue):
+    work_queue.push('https://example.com/1', '美容')
+    work_queue.complete('https://example.com/1', info('https://example.com/1'))
+    assert not work_queue.finished()
+
+    work_queue.set_search_done()
+    assert work_queue.finished()
+
+
+def test_coordinator_and_workers_process_each_url_once(work_queue):
+    urls = [(f'https://example.com/{i}', '美容') for i in range(50)]
+    workers = [threading.Thread(target=scraper_module.run_worker, args=(work_queue, fake_extract),
+                                kwargs={'worker': f'w{i}', 'poll_interval': 0.01}) for i in range(3)]
+    for worker in workers:
+        worker.start()
+
+    results = []
+    received = scraper_module.run_coordinator(work_queue, iter(urls), results.append, poll_interval=0.01)
+    for worker in workers:
+        worker.join(timeout=10)
+
+    assert received == 50
+    assert sorted(result['記事URL'] for result in results) == sorted(url for url, _ in urls)
+    assert work_queue.counts() == {'pending': 0, 'leased': 0, 'done': 50}
+
+
+def test_coordinator_stop_returns_finished_results(work_queue):
+    stop = threading.Event()
+
+    def partial_worker():
+        # 1件目を借りたまま停止したワーカーの代わりに、残りだけを完了させる
+        work_queue.lease('stalled', lease_seconds=60)
+        while work_queue.counts()['done'] < 2:
+            leased = work_queue.lease('w1')
+            if leased:
+                work_queue.complete(leased[0], info(leased[0]), 'w1')
+            else:
+                time.sleep(0.01)
+        stop.set()
+
+    items = [(f'https://example.com/{i}', '美容') for i in range(3)]
+    for url, keyword in items:
+        work_queue.push(url, keyword)
+    worker = threading.Thread(target=partial_worker)
+    worker.start()
+
+    results = []
+    received = scraper_module.run_coordinator(work_queue, iter([]), results.append, poll_interval=0.01, stop=stop)
+    worker.join(timeout=10)
+
+    assert received == 2
+    assert work_queue.counts()['leased'] == 1
+
+
+def test_in_order_callback_flush_emits_results_after_a_gap():
+    written = []
+    emit = scraper_module.InOrderCallback(written.append)
+    emit(1, 'b')
+    emit(2, 'c')
+    assert written == []  # 0番目の結果を待っている
+
+    assert emit.flush() == 2
+    assert written == ['b', 'c']
+    emit(3, 'd')
+    assert written == ['b', 'c', 'd']